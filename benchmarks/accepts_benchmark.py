@@ -0,0 +1,51 @@
+"""Measures the per-call overhead added by the ``pyvalid.accepts`` and
+``pyvalid.returns`` decorators.
+
+Usage:
+
+.. code-block:: bash
+
+    python -m benchmarks.accepts_benchmark
+
+"""
+import timeit
+
+from pyvalid import accepts, returns
+
+
+def plain(arg1, arg2, arg3=3, arg4=4):
+    return arg1
+
+
+@accepts(int, (float, int, None, 'None'), (str, 10))
+def positional(arg1, arg2, arg3=3, arg4=4):
+    return arg1
+
+
+@accepts(str, arg2=(float, int), arg3=bool)
+def keywords(arg1, **kwargs):
+    return arg1
+
+
+@returns(int, float)
+def returning(arg1, arg2, arg3=3, arg4=4):
+    return arg1
+
+
+CASES = (
+    ('undecorated', 'plain(1, 2.0, "x")'),
+    ('accepts, positional', 'positional(1, 2.0, "x")'),
+    ('accepts, keywords', 'keywords("x", arg2=1, arg3=True)'),
+    ('returns', 'returning(1, 2.0, "x")'),
+)
+
+
+def main(number=200000, repeat=5):
+    for name, stmt in CASES:
+        timings = timeit.repeat(stmt, globals=globals(), number=number, repeat=repeat)
+        per_call = min(timings) / number * 1e9
+        print('{:<24}{:>10.1f} ns/call'.format(name, per_call))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Measures the time ``pyvalid.validators.IterableValidator`` takes to validate
+iterables of different types and sizes.
+
+Usage:
+
+.. code-block:: bash
+
+    python -m benchmarks.iterable_benchmark
+
+"""
+from array import array
+import timeit
+
+from pyvalid.validators import IterableValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def make_inputs(size):
+    values = list(range(size))
+    inputs = [
+        ('list', values),
+        ('tuple', tuple(values)),
+        ('array.array', array('q', values)),
+    ]
+    if numpy is not None:
+        inputs.append(('numpy.ndarray', numpy.arange(size, dtype=numpy.float64)))
+    return inputs
+
+
+def main(repeat=3):
+    validators = (
+        ('min_val, max_val', IterableValidator(min_val=0, max_val=10 ** 7)),
+        ('elements_type, min_val, max_val', IterableValidator(
+            elements_type=(int, float), min_val=0, max_val=10 ** 7
+        )),
+    )
+    for validator_name, validator in validators:
+        print(validator_name)
+        for size in SIZES:
+            for input_name, value in make_inputs(size):
+                assert validator(value)
+                number = max(1, 10 ** 6 // size)
+                timings = timeit.repeat(
+                    lambda: validator(value), number=number, repeat=repeat
+                )
+                per_call = min(timings) / number * 1e6
+                print('    {:<16}{:>10}{:>14.1f} us/call'.format(
+                    input_name, size, per_call
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Measures the time the built-in validators take to validate valid and invalid
+values.
+
+Usage:
+
+.. code-block:: bash
+
+    python -m benchmarks.validators_benchmark
+
+"""
+import timeit
+
+from pyvalid.validators import IterableValidator, NumberValidator, StringValidator
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+def make_cases():
+    cases = [
+        ('NumberValidator', NumberValidator(
+            number_type=int, min_val=0, max_val=1000, not_in_range=[13, 666]
+        ), 42, -1),
+        ('NumberValidator, in_range', NumberValidator(
+            in_range=[num * 7 for num in range(1000)]
+        ), 700, 701),
+        ('StringValidator', StringValidator(
+            min_len=3, max_len=32, re_pattern=r'[a-z_]+$', re_full_match=True
+        ), 'pyvalid', 'py'),
+        ('StringValidator, in_range', StringValidator(
+            in_range=['word{}'.format(num) for num in range(1000)]
+        ), 'word999', 'word1000'),
+        ('IterableValidator', IterableValidator(
+            iterable_type=list, empty_allowed=False, elements_type=int, max_val=10
+        ), list(range(10)), list(range(12))),
+    ]
+    if torch is not None:
+        from pyvalid.validators import TensorValidator
+        cases.append(('TensorValidator', TensorValidator(
+            tensor_type='torch.FloatTensor', dim=2, empty_allowed=False,
+            nans_allowed=False
+        ), torch.zeros(8, 8), torch.zeros(8)))
+    return cases
+
+
+def main(number=100000, repeat=3):
+    for case_name, validator, valid_value, invalid_value in make_cases():
+        assert validator(valid_value)
+        assert not validator(invalid_value)
+        print(case_name)
+        for value_name, value in (('valid', valid_value), ('invalid', invalid_value)):
+            timings = timeit.repeat(
+                lambda: validator(value), number=number, repeat=repeat
+            )
+            per_call = min(timings) / number * 1e9
+            print('    {:<30}{:>10.1f} ns/call'.format(value_name, per_call))
+
+
+if __name__ == '__main__':
+    main()
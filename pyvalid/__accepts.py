@@ -1,17 +1,34 @@
-from functools import wraps
-from types import MethodType
+from collections import namedtuple
+from functools import partial, wraps
+from inspect import Parameter, signature
 from sys import version_info
-if version_info < (3, 0, 0):
-    from inspect import getargspec
-else:
-    from inspect import getfullargspec as getargspec
 try:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 except ImportError:
-    from collections import Callable
+    from collections import Callable, Iterator
 
+from pyvalid.__checks import compile_check, is_async_function, is_validator_instance
+from pyvalid.__codegen import accepts_wrapper
 from pyvalid.__exceptions import InvalidArgumentNumberError, ArgumentValidationError
-from pyvalid.switch import is_enabled
+from pyvalid import concurrency, sampling, stats, switch
+
+
+#: Compiled argument plan of the decorated function:
+#:
+#: * ``params`` — the tuple of the validated arguments in the following format:
+#:   ``(<argument name>, <argument position>, <is optional>, <ordinal number>,
+#:   <compiled check>, <allowed types and values>)``;
+#: * ``varargs`` — ``None`` or the spec of each extra item of the ``*args``:
+#:   ``(<parameter name>, <position of the first item>, <compiled check>,
+#:   <allowed types and values>)``;
+#: * ``varkw`` — ``None`` or the spec of each extra value of the ``**kwargs``:
+#:   ``(<parameter name>, <names of the other arguments>, <ordinal number>,
+#:   <compiled check>, <allowed types and values>)``;
+#: * ``positional_names`` — the names of the parameters, which can be passed both by
+#:   position and by keyword, in the order of their positions.
+ArgumentPlan = namedtuple(
+    'ArgumentPlan', ('params', 'varargs', 'varkw', 'positional_names')
+)
 
 
 class Accepts(Callable):
@@ -30,6 +47,43 @@ class Accepts(Callable):
     * ``pyvalid.InvalidArgumentNumberError`` — when the number/position of function’s
       arguments is incorrect.
 
+    Information about the function's arguments is collected once, when the function
+    gets decorated, and is never modified afterwards. So the wrapped function can be
+    safely called from several threads at once, as well as recursively.
+
+    Keyword-only parameters are validated in the same way as the positional ones. The
+    allowed values given by the name of the ``*args`` or ``**kwargs`` parameter are
+    applied to each extra positional argument or to each extra keyword argument, which
+    doesn't have its own allowed values:
+
+    .. code-block:: python
+
+        @accepts(str, args=int, kwargs=float)
+        def func(name, *args, **kwargs):
+            pass
+
+    The arguments of many calls can be validated at once, without calling the
+    function, with the ``validate_many`` attribute of the decorated function. It
+    returns the list of ``(index, error)`` pairs for the invalid rows. E.g. for the
+    ``multiply`` function defined below:
+
+    .. code-block:: python
+
+        multiply.validate_many([(4, 2), (3.14, 8), dict(num_1=1, num_2=2)])
+        # Returns [(1, ArgumentValidationError(...))].
+
+    Coroutine functions and asynchronous generator functions are wrapped into the
+    native ``async def`` wrappers, which validate the arguments when the coroutine or
+    the generator starts, as the body of the wrapped function would. Their heavy
+    validators are run in the executor of the ``pyvalid.concurrency`` module.
+
+    If an argument is a one-shot iterator (e.g. a generator), which doesn't match any
+    of the allowed values, but one of the allowed values is a streaming validator
+    (``IterableValidator(streaming=True)``), the iterator is replaced with the proxy.
+    The proxy validates each element when the wrapped function pulls it and raises
+    ``pyvalid.ArgumentValidationError`` with the ``element_index`` of the invalid
+    element.
+
     Examples of usage:
 
     Let's define the ``multiply`` function, which accepts only ``int`` values, and see
@@ -61,33 +115,257 @@ class Accepts(Callable):
         # is missing.
     """
 
+    #: Generate specialized wrappers with inlined checks. When disabled or when the
+    #: wrapper can't be generated, the generic (slower) wrapper is used instead.
+    codegen = True
+
+    #: Sampling policy of the decorator. If it's not set, the default sampler of the
+    #: ``pyvalid.sampling`` module is used.
+    sampler = None
+
     def __init__(self, *allowed_arg_values, **allowed_kwargs_values):
         self.allowed_arg_values = allowed_arg_values
         self.allowed_kwargs_values = allowed_kwargs_values
-        self.allowed_params = list()
-        self.optional_args = list()
+
+    @classmethod
+    def sampled(cls, sampler, *allowed_arg_values, **allowed_kwargs_values):
+        """Creates the decorator, which validates only the calls chosen by the given
+        sampler.
+
+        Example:
+
+        .. code-block:: python
+
+            from pyvalid import accepts, sampling
+
+
+            @accepts.sampled(sampling.EveryNth(100), int, int)
+            def multiply(num_1, num_2):
+                return num_1 * num_2
+
+        Args:
+            sampler (pyvalid.sampling.Sampler):
+                Sampling policy.
+
+        Returns (pyvalid.accepts):
+            The decorator.
+        """
+        decorator = cls(*allowed_arg_values, **allowed_kwargs_values)
+        decorator.sampler = sampler
+        return decorator
 
     def __call__(self, func):
-        @wraps(func)
-        def decorator_wrapper(*func_args, **func_kwargs):
-            perform_validation = all((
-                is_enabled(),
-                self.allowed_arg_values or self.allowed_kwargs_values
+        if switch.pyvalid_stripped:
+            return func
+        # Collect information about function arguments once. The result is immutable
+        # and shared by all the calls of the wrapped function.
+        plan = self.__compile(func)
+        sampler = self.sampler
+        sampler = sampling.default_sampler if sampler is None else sampler
+        func_stats = None
+        if stats.enabled:
+            func_stats = stats.register(
+                stats.FunctionStats, 'accepts', stats.function_name(func)
+            )
+        if is_async_function(func):
+            decorator_wrapper = self.__async_wrapper(func, plan, sampler, func_stats)
+        else:
+            decorator_wrapper = self.__sync_wrapper(func, plan, sampler, func_stats)
+        decorator_wrapper = wraps(func)(decorator_wrapper)
+        decorator_wrapper.validate_many = partial(self.__validate_many, func, plan)
+        return decorator_wrapper
+
+    def __sync_wrapper(self, func, plan, sampler, func_stats=None):
+        # The instrumented wrapper calls the function through the statistics, which
+        # mark the end of the validation.
+        call = func if func_stats is None else func_stats.call(func)
+        decorator_wrapper = None
+        # Generated wrappers can't replace arguments with the streaming proxies.
+        if plan is not None and self.codegen and not self.__has_streaming(plan):
+            namespace = self.__codegen_namespace(sampler)
+            if call is not func:
+                namespace['call'] = call
+            decorator_wrapper = accepts_wrapper(
+                func, plan, self.__validate_args, namespace
+            )
+        if decorator_wrapper is None:
+            decorator_wrapper = self.__generic_wrapper(func, plan, sampler, call)
+        if func_stats is not None:
+            decorator_wrapper = func_stats.wrap(decorator_wrapper)
+        return decorator_wrapper
+
+    def __async_wrapper(self, func, plan, sampler, func_stats=None):
+        """Returns the native wrapper of the coroutine function or of the asynchronous
+        generator function. The arguments, which allow heavy validators, are validated
+        by the generic wrapper, which runs the heavy validators in the executor.
+        """
+        from pyvalid.__async import async_wrapper
+        heavy_params = tuple()
+        if plan is not None:
+            plan, heavy_params = self.__split_heavy(plan)
+        if not heavy_params:
+            return async_wrapper(
+                func, self.__sync_wrapper(func, plan, sampler, func_stats)
+            )
+        check_args = self.__heavy_check(func, plan, heavy_params, sampler)
+        if func_stats is not None:
+            check_args = func_stats.wrap_check(check_args)
+        return async_wrapper(func, func, check_args=check_args)
+
+    def __heavy_check(self, func, plan, heavy_params, sampler):
+        """Returns the function, which validates the arguments inline and submits the
+        heavy validators to the executor.
+        """
+        create_exception = ArgumentValidationError
+        if sampler is not None:
+            create_exception = sampler.counting(ArgumentValidationError)
+
+        def check_args(func_args, func_kwargs):
+            if not switch.pyvalid_enabled or (sampler is not None and not sampler()):
+                return func_args, func_kwargs, None
+            try:
+                streamed_args = self.__validate_args(func, plan, func_args, func_kwargs)
+                if streamed_args is not None:
+                    func_args, func_kwargs = streamed_args
+                pending = self.__submit_heavy(
+                    func, heavy_params, func_args, func_kwargs, create_exception
+                )
+            except (InvalidArgumentNumberError, ArgumentValidationError):
+                if sampler is not None:
+                    sampler.failed += 1
+                raise
+            return func_args, func_kwargs, pending
+        return check_args
+
+    def __split_heavy(self, plan):
+        """Moves the arguments, which allow heavy validators, out of the plan.
+
+        Returns (tuple):
+            The plan of the other arguments and the tuple of the arguments with heavy
+            validators. The compiled check of the latter checks the allowed values,
+            except the heavy validators, and the heavy validators are inserted before
+            all the allowed values.
+        """
+        params = list()
+        heavy_params = list()
+        for param in plan.params:
+            arg_name, arg_index, is_optional, ord_num, _, allowed_values = param
+            inline_values, heavy_validators = concurrency.split_heavy(allowed_values)
+            if heavy_validators:
+                heavy_params.append((
+                    arg_name, arg_index, is_optional, ord_num,
+                    compile_check(inline_values), heavy_validators, allowed_values
+                ))
+            else:
+                params.append(param)
+        return plan._replace(params=tuple(params)), tuple(heavy_params)
+
+    def __submit_heavy(self, func, heavy_params, args, kwargs, create_exception):
+        """Runs the heavy validators of the arguments, which don't match the other
+        allowed values, in the executor.
+
+        Returns (list):
+            The pending checks: pairs of the future of the validators and the factory
+            of the exception.
+        """
+        pending = list()
+        args_count = len(args)
+        for arg_name, arg_index, is_optional, ord_num, check, heavy_validators, \
+                allowed_values in heavy_params:
+            if arg_index is not None and arg_index < args_count:
+                value = args[arg_index]
+            elif arg_name in kwargs:
+                value = kwargs[arg_name]
+            elif is_optional:
+                continue
+            else:
+                raise InvalidArgumentNumberError(func)
+            if check(value):
+                continue
+            pending.append((
+                concurrency.submit(heavy_validators, value),
+                partial(
+                    create_exception, func, ord_num, value, allowed_values,
+                    arg_name=arg_name
+                )
             ))
-            if perform_validation:
-                # Forget all information about function arguments.
-                self.allowed_params[:] = list()
-                self.optional_args[:] = list()
-                # Collect information about fresh arguments.
-                args_info = getargspec(func)
-                self.__scan_func(args_info)
-                self.__pep_0468_fix(func)
+        return pending
+
+    def __generic_wrapper(self, func, plan, sampler, call):
+        """Returns the wrapper, which validates the arguments according to the argument
+        plan on each call and then calls the ``call`` function.
+        """
+        def decorator_wrapper(*func_args, **func_kwargs):
+            if plan is not None and switch.pyvalid_enabled and \
+                    (sampler is None or sampler()):
                 # Validate function arguments.
-                self.__validate_args(func, func_args, func_kwargs)
+                try:
+                    streamed_args = self.__validate_args(
+                        func, plan, func_args, func_kwargs
+                    )
+                except (InvalidArgumentNumberError, ArgumentValidationError):
+                    if sampler is not None:
+                        sampler.failed += 1
+                    raise
+                if streamed_args is not None:
+                    func_args, func_kwargs = streamed_args
             # Call function.
-            return func(*func_args, **func_kwargs)
+            return call(*func_args, **func_kwargs)
         return decorator_wrapper
 
+    def __codegen_namespace(self, sampler):
+        """Returns objects used by the generated wrapper.
+        """
+        if sampler is None:
+            return {
+                'switch': switch,
+                'ordinal': self.__ordinal,
+                'InvalidArgumentNumberError': InvalidArgumentNumberError,
+                'ArgumentValidationError': ArgumentValidationError,
+            }
+        # Failures of the generated checks are counted by the sampler.
+        return {
+            'switch': switch,
+            'ordinal': self.__ordinal,
+            'sampler': sampler,
+            'InvalidArgumentNumberError': sampler.counting(InvalidArgumentNumberError),
+            'ArgumentValidationError': sampler.counting(ArgumentValidationError),
+        }
+
+    def __compile(self, func):
+        """Builds the argument plan of the given function.
+
+        Args:
+            func (types.FunctionType):
+                Function to validate.
+
+        Returns (ArgumentPlan):
+            Immutable argument plan or ``None`` if there is nothing to validate.
+        """
+        if not (self.allowed_arg_values or self.allowed_kwargs_values):
+            return None
+        allowed_params, varargs, varkw = self.__scan_func(func)
+        allowed_params = self.__pep_0468_fix(func, allowed_params)
+        params = tuple(
+            (arg_name, arg_index, is_optional, ord_num, compile_check(allowed_val),
+             allowed_val)
+            for arg_name, arg_index, is_optional, ord_num, allowed_val in allowed_params
+        )
+        if varargs is not None:
+            arg_name, first_index, allowed_val = varargs
+            varargs = (arg_name, first_index, compile_check(allowed_val), allowed_val)
+        if varkw is not None:
+            arg_name, named_args, ord_num, allowed_val = varkw
+            varkw = (
+                arg_name, named_args, ord_num, compile_check(allowed_val), allowed_val
+            )
+        positional_names = tuple(
+            param.name
+            for param in signature(func, follow_wrapped=False).parameters.values()
+            if param.kind is Parameter.POSITIONAL_OR_KEYWORD
+        )
+        return ArgumentPlan(params, varargs, varkw, positional_names)
+
     def __wrap_allowed_val(self, value):
         """Wrap allowed value in the list if not wrapped yet.
         """
@@ -95,99 +373,266 @@ class Accepts(Callable):
             value = list(value)
         elif not isinstance(value, list):
             value = [value]
+        else:
+            value = list(value)
         return value
 
-    def __scan_func(self, args_info):
+    def __scan_func(self, func):  # noqa: C901
         """Collects information about allowed values in the following format:
 
         .. code-block:: python
 
             (
-                (<argument name>, <allowed types and values>),
-                (<argument name>, <allowed types and values>),
-                ...
+                [
+                    (<argument name>, <argument position>, <is optional>,
+                     <ordinal number>, <allowed types and values>),
+                    ...
+                ],
+                (<*args name>, <position of the first item>,
+                 <allowed types and values>),
+                (<**kwargs name>, <names of the other arguments>, <ordinal number>,
+                 <allowed types and values>),
             )
 
+        The argument position is ``None`` for arguments, which can be passed by the
+        keyword only. The specs of the ``*args`` and ``**kwargs`` are ``None``, unless
+        the allowed values are given for the whole ``*args`` or ``**kwargs``
+        parameter by its name.
+
         Args:
-            args_info (inspect.FullArgSpec):
-                Information about function arguments.
+            func (types.FunctionType):
+                Function to validate.
         """
+        parameters = signature(func, follow_wrapped=False).parameters
+        positional = list()
+        params_order = dict()
+        for param_num, param in enumerate(parameters.values()):
+            params_order[param.name] = param_num
+            if param.kind in (Parameter.POSITIONAL_ONLY,
+                              Parameter.POSITIONAL_OR_KEYWORD):
+                positional.append(param)
+        allowed_params = list()
         # Process args.
         for i, allowed_val in enumerate(self.allowed_arg_values):
             allowed_val = self.__wrap_allowed_val(allowed_val)
-            # Add default value (if exists) in list of allowed values.
-            if args_info.defaults:
-                def_range = len(args_info.defaults) - len(args_info.args[i:])
-                if def_range >= 0:
-                    self.optional_args.append(i)
-                    default_value = args_info.defaults[def_range]
-                    allowed_val.append(default_value)
             # Try to detect current argument name.
-            if len(args_info.args) > i:
-                arg_name = args_info.args[i]
+            if len(positional) > i:
+                arg_name = positional[i].name
+                is_optional = positional[i].default is not Parameter.empty
+                # Add default value (if exists) in list of allowed values.
+                if is_optional:
+                    allowed_val.append(positional[i].default)
             else:
                 arg_name = None
-                self.optional_args.append(i)
+                is_optional = True
             # Save info about current argument and his allowed values.
-            self.allowed_params.append((arg_name, allowed_val))
+            allowed_params.append(
+                (arg_name, i, is_optional, self.__ordinal(i + 1), allowed_val)
+            )
         # Process kwargs.
+        varargs = varkw = None
         for arg_name, allowed_val in self.allowed_kwargs_values.items():
             allowed_val = self.__wrap_allowed_val(allowed_val)
-            # Mark current argument as optional.
-            i = len(self.allowed_params)
-            self.optional_args.append(i)
+            param = parameters.get(arg_name)
+            kind = None if param is None else param.kind
+            if kind is Parameter.VAR_POSITIONAL:
+                # Items of the "*args", which don't have their own allowed values.
+                first_index = max(len(positional), len(self.allowed_arg_values))
+                varargs = (arg_name, first_index, allowed_val)
+                continue
+            if kind is Parameter.VAR_KEYWORD:
+                varkw = (arg_name, allowed_val)
+                continue
+            if kind is Parameter.POSITIONAL_OR_KEYWORD:
+                arg_index = positional.index(param)
+                is_optional = param.default is not Parameter.empty
+                ord_num = self.__ordinal(arg_index + 1)
+                if is_optional:
+                    allowed_val.append(param.default)
+            elif kind is Parameter.KEYWORD_ONLY:
+                arg_index = None
+                is_optional = param.default is not Parameter.empty
+                ord_num = self.__ordinal(params_order[arg_name] + 1)
+                if is_optional:
+                    allowed_val.append(param.default)
+            else:
+                # Items of the "**kwargs".
+                arg_index = None
+                is_optional = True
+                ord_num = self.__ordinal(len(allowed_params) + 1)
             # Save info about current argument and his allowed values.
-            self.allowed_params.append((arg_name, allowed_val))
+            allowed_params.append(
+                (arg_name, arg_index, is_optional, ord_num, allowed_val)
+            )
+        if varkw is not None:
+            # Values of the "**kwargs", which don't have their own allowed values.
+            named_args = frozenset(
+                param.name for param in parameters.values()
+                if param.kind in (Parameter.POSITIONAL_OR_KEYWORD,
+                                  Parameter.KEYWORD_ONLY)
+            ).union(self.allowed_kwargs_values)
+            arg_name, allowed_val = varkw
+            ord_num = self.__ordinal(params_order[arg_name] + 1)
+            varkw = (arg_name, named_args, ord_num, allowed_val)
+        return allowed_params, varargs, varkw
 
-    def __validate_args(self, func, args, kwargs):
+    def __validate_args(self, func, plan, args, kwargs):  # noqa: C901
         """Compare value of each required argument with list of allowed values.
 
         Args:
             func (types.FunctionType):
                 Function to validate.
+            plan (ArgumentPlan):
+                Argument plan of the function.
             args (list):
                 Collection of the position arguments.
             kwargs (dict):
                 Collection of the keyword arguments.
 
+        Returns (tuple):
+            ``None`` if the arguments have to be passed to the function as is,
+            otherwise the pair of positional and keyword arguments, where some
+            iterators are replaced with the streaming proxies.
+
         Raises:
             InvalidArgumentNumberError:
                 When position or count of the arguments is incorrect.
             ArgumentValidationError:
                 When encountered unexpected argument value.
+            TypeError:
+                When the argument is passed both by position and by keyword, as the
+                generated wrapper and the function itself do.
         """
-        from pyvalid.validators import Validator
-        for i, (arg_name, allowed_values) in enumerate(self.allowed_params):
-            if i < len(args):
-                value = args[i]
-            else:
+        args_count = len(args)
+        if kwargs:
+            for arg_name in plan.positional_names[:args_count]:
                 if arg_name in kwargs:
-                    value = kwargs[arg_name]
-                elif i in self.optional_args:
-                    continue
-                else:
-                    raise InvalidArgumentNumberError(func)
-            is_valid = False
-            for allowed_val in allowed_values:
-                is_validator = (
-                    isinstance(allowed_val, Validator) or
-                    (
-                        isinstance(allowed_val, MethodType) and
-                        hasattr(allowed_val, '__func__') and
-                        isinstance(allowed_val.__func__, Validator)
+                    raise TypeError(
+                        '{}() got multiple values for argument \'{}\''.format(
+                            func.__name__, arg_name
+                        )
                     )
+        streamed = False
+        for arg_name, arg_index, is_optional, ord_num, check, allowed_values in \
+                plan.params:
+            positional = arg_index is not None and arg_index < args_count
+            if positional:
+                value = args[arg_index]
+            elif arg_name in kwargs:
+                value = kwargs[arg_name]
+            elif is_optional:
+                continue
+            else:
+                raise InvalidArgumentNumberError(func)
+            if check(value):
+                continue
+            stream = self.__stream_arg(func, arg_name, ord_num, value, allowed_values)
+            if stream is None:
+                raise ArgumentValidationError(
+                    func, ord_num, value, allowed_values, arg_name=arg_name
+                )
+            if not streamed:
+                streamed = True
+                args, kwargs = list(args), dict(kwargs)
+            if positional:
+                args[arg_index] = stream
+            else:
+                kwargs[arg_name] = stream
+        if plan.varargs is not None:
+            arg_name, first_index, check, allowed_values = plan.varargs
+            for arg_index in range(first_index, args_count):
+                if not check(args[arg_index]):
+                    raise ArgumentValidationError(
+                        func, self.__ordinal(arg_index + 1), args[arg_index],
+                        allowed_values, arg_name=arg_name
+                    )
+        if plan.varkw is not None:
+            _, named_args, ord_num, check, allowed_values = plan.varkw
+            for arg_name, value in kwargs.items():
+                if arg_name not in named_args and not check(value):
+                    raise ArgumentValidationError(
+                        func, ord_num, value, allowed_values, arg_name=arg_name
+                    )
+        if streamed:
+            return tuple(args), kwargs
+        return None
+
+    def __validate_many(self, func, plan, rows):
+        """Validates the batch of arguments of the function without calling it. It's
+        available as the ``validate_many`` attribute of the decorated function.
+
+        The batch is validated regardless of the state of the ``pyvalid.switch`` and
+        samplers. Streamed iterators are not validated, since it would consume them.
+
+        Args:
+            func (types.FunctionType):
+                Function to validate.
+            plan (ArgumentPlan):
+                Argument plan of the function.
+            rows (collections.abc.Iterable):
+                Arguments of the calls. Each row is either the sequence of positional
+                arguments or the dictionary of keyword arguments.
+
+        Returns (list):
+            Pairs of the index of the invalid row and the pyvalid's exception, which
+            would be raised by the call with these arguments.
+        """
+        failures = list()
+        if plan is None:
+            return failures
+        validate_args = self.__validate_args
+        no_args, no_kwargs = tuple(), dict()
+        for row_num, row in enumerate(rows):
+            if isinstance(row, dict):
+                args, kwargs = no_args, row
+            else:
+                args, kwargs = tuple(row), no_kwargs
+            try:
+                validate_args(func, plan, args, kwargs)
+            except (InvalidArgumentNumberError, ArgumentValidationError) as exc:
+                failures.append((row_num, exc))
+        return failures
+
+    def __has_streaming(self, plan):
+        """Returns ``True`` if any argument of the plan allows streaming validators.
+        """
+        return any(
+            self.__is_streaming(allowed_val)
+            for allowed_params_item in plan.params
+            for allowed_val in allowed_params_item[-1]
+        )
+
+    def __is_streaming(self, allowed_val):
+        return is_validator_instance(allowed_val) and \
+            getattr(allowed_val, 'streaming', False) is True
+
+    def __stream_arg(self, func, arg_name, ord_num, value, allowed_values):
+        """Wraps the one-shot iterator into the proxy of the first streaming validator,
+        which accepts the iterator itself.
+
+        Returns (collections.abc.Iterator):
+            The validating proxy or ``None`` if the value can't be streamed.
+        """
+        if not isinstance(value, Iterator):
+            return None
+
+        def on_error(element_index, element):
+            if element_index is None:
+                # The iterator itself is invalid, e.g. it's empty.
+                raise ArgumentValidationError(
+                    func, ord_num, value, allowed_values, arg_name=arg_name
                 )
-                if is_validator:
-                    is_valid = allowed_val(value)
-                elif isinstance(allowed_val, type):
-                    is_valid = isinstance(value, allowed_val)
-                else:
-                    is_valid = value == allowed_val
-                if is_valid:
-                    break
-            if not is_valid:
-                ord_num = self.__ordinal(i + 1)
-                raise ArgumentValidationError(func, ord_num, value, allowed_values)
+            raise ArgumentValidationError(
+                func, ord_num, element, allowed_values,
+                element_index=element_index, arg_name=arg_name
+            )
+
+        for allowed_val in allowed_values:
+            if self.__is_streaming(allowed_val):
+                stream = allowed_val.stream(value, on_error)
+                if stream is not None:
+                    return stream
+        return None
 
     def __ordinal(self, num):
         """Returns the ordinal number of a given integer, as a string.
@@ -199,14 +644,14 @@ class Accepts(Callable):
             ord_info = {1: 'st', 2: 'nd', 3: 'rd'}.get(num % 10, 'th')
             return '{}{}'.format(num, ord_info)
 
-    def __pep_0468_fix(self, func):
+    def __pep_0468_fix(self, func, allowed_params):
         """Fixes the issue with preserving the order of function's arguments. So far,
         the issue exists in the Python 3.5 only. More details can be found on the
         "PEP 468" page: https://www.python.org/dev/peps/pep-0468/
         """
         is_broken_py = (version_info.major, version_info.minor) == (3, 5)
         if not is_broken_py:
-            return False
+            return allowed_params
         from inspect import signature, Parameter
         func_signature = signature(func)
         func_parameters = func_signature.parameters.values()
@@ -215,7 +660,8 @@ class Accepts(Callable):
             if param.kind is Parameter.VAR_KEYWORD:
                 continue
             parameters_order[param.name] = param_index
-        last_param_pos = len(self.allowed_params)
-        self.allowed_params.sort(
+        last_param_pos = len(allowed_params)
+        return sorted(
+            allowed_params,
             key=lambda param: parameters_order.get(param[0], last_param_pos)
         )
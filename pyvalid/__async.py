@@ -0,0 +1,106 @@
+"""Native wrappers of the coroutine functions and asynchronous generator functions.
+
+The module uses the ``async def`` syntax, so it's imported only when an asynchronous
+function gets decorated. The wrapper of the asynchronous generator functions is
+defined in a separate module, since asynchronous generators are not supported by
+Python 3.5.
+"""
+from pyvalid.__checks import isasyncgenfunction
+from pyvalid import concurrency
+
+
+def async_wrapper(func, call, check_result=None, check_args=None):
+    """Returns the ``async def`` wrapper of the same kind as the wrapped function.
+
+    Args:
+        func (types.FunctionType):
+            Coroutine function or asynchronous generator function to wrap.
+        call (function):
+            Synchronous function, which accepts the arguments of the wrapped function
+            and returns the coroutine or the asynchronous generator, e.g. the wrapper
+            generated by ``pyvalid.accepts``.
+        check_result (function):
+            Optional function, which validates the result of the coroutine or each
+            item yielded by the asynchronous generator. It returns the list of the
+            pending checks (see below) or ``None``.
+        check_args (function):
+            Optional function, which validates the positional and keyword arguments
+            before the ``call``. It returns the arguments to pass and the list of the
+            pending checks: pairs of the future of the heavy validators, run by the
+            ``pyvalid.concurrency`` module, and the factory of the exception, which is
+            raised if the validators reject the value.
+
+    Returns (function):
+        Coroutine function or asynchronous generator function.
+    """
+    if isasyncgenfunction(func):
+        from pyvalid.__async_generator import async_generator_wrapper
+        return async_generator_wrapper(call, check_result, check_args)
+    return coroutine_wrapper(call, check_result, check_args)
+
+
+async def join(pending):
+    """Waits for the pending checks and raises the exception of the first failed one.
+    """
+    try:
+        for future, create_exception in pending:
+            if not await future:
+                raise create_exception()
+    finally:
+        cancel(pending)
+
+
+def cancel(pending):
+    for future, _ in pending:
+        future.cancel()
+
+
+async def validate(check, value):
+    """Validates the value inline and waits for the heavy validators, if needed.
+    """
+    pending = check(value)
+    if pending:
+        await join(pending)
+
+
+async def validate_args(check_args, func_args, func_kwargs):
+    """Validates the arguments and returns the arguments to pass to the function.
+    """
+    func_args, func_kwargs, pending = check_args(func_args, func_kwargs)
+    if pending:
+        await join(pending)
+    return func_args, func_kwargs
+
+
+def coroutine_wrapper(call, check_result=None, check_args=None):
+    """Returns the coroutine function, which awaits the result in place, so the
+    validation doesn't add any tasks or event loop iterations, unless the heavy
+    validators are run in the executor.
+    """
+    if check_result is None and check_args is None:
+        async def decorator_wrapper(*func_args, **func_kwargs):
+            return await call(*func_args, **func_kwargs)
+        return decorator_wrapper
+    return validating_coroutine_wrapper(call, check_result, check_args)
+
+
+def validating_coroutine_wrapper(call, check_result, check_args):
+    async def decorator_wrapper(*func_args, **func_kwargs):
+        pending = None
+        if check_args is not None:
+            func_args, func_kwargs, pending = check_args(func_args, func_kwargs)
+            if pending and not concurrency.parallel:
+                await join(pending)
+                pending = None
+        try:
+            result = await call(*func_args, **func_kwargs)
+        except BaseException:
+            if pending:
+                cancel(pending)
+            raise
+        if pending:
+            await join(pending)
+        if check_result is not None:
+            await validate(check_result, result)
+        return result
+    return decorator_wrapper
@@ -0,0 +1,38 @@
+"""The native wrapper of the asynchronous generator functions. It's imported only when
+an asynchronous generator function gets decorated, since the ``yield`` expressions
+inside the ``async def`` functions are supported by Python 3.6 and newer only.
+"""
+from pyvalid.__async import validate, validate_args
+
+
+def async_generator_wrapper(call, check_result=None, check_args=None):
+    """Returns the asynchronous generator function, which re-yields the items of the
+    wrapped generator and delegates the ``asend``, ``athrow`` and ``aclose`` calls to
+    it.
+    """
+    async def decorator_wrapper(*func_args, **func_kwargs):
+        if check_args is not None:
+            # The generator doesn't run until its first item is requested, so its
+            # arguments are always validated before it starts.
+            func_args, func_kwargs = await validate_args(
+                check_args, func_args, func_kwargs
+            )
+        generator = call(*func_args, **func_kwargs)
+        try:
+            item = await generator.__anext__()
+            while True:
+                if check_result is not None:
+                    await validate(check_result, item)
+                try:
+                    sent = yield item
+                except GeneratorExit:
+                    raise
+                except BaseException as exc:
+                    item = await generator.athrow(exc)
+                else:
+                    item = await generator.asend(sent)
+        except StopAsyncIteration:
+            return
+        finally:
+            await generator.aclose()
+    return decorator_wrapper
@@ -0,0 +1,115 @@
+import inspect
+from types import MethodType
+
+
+def isasyncgenfunction(func):
+    """Returns ``True`` if the function is an asynchronous generator function. They
+    were added in Python 3.6, so the function always returns ``False`` before.
+    """
+    check = getattr(inspect, 'isasyncgenfunction', None)
+    return check is not None and check(func)
+
+
+def is_async_function(func):
+    """Returns ``True`` if the function is a coroutine function or an asynchronous
+    generator function, which have to be wrapped by the ``async def`` wrappers.
+    """
+    return inspect.iscoroutinefunction(func) or isasyncgenfunction(func)
+
+
+def is_validator_instance(value):
+    """Returns ``True`` if the given allowed value is a pyvalid validator (or a method
+    bound to a validator), which has to be called to check an actual value.
+    """
+    if not callable(value) or isinstance(value, type):
+        return False
+    from pyvalid.validators import Validator
+    return (
+        isinstance(value, Validator) or
+        (
+            isinstance(value, MethodType) and
+            hasattr(value, '__func__') and
+            isinstance(value.__func__, Validator)
+        )
+    )
+
+
+#: Maximal number of types, whose verdicts are cached by a single compiled check. It
+#: limits the memory used by the checks of values of dynamically created types.
+max_cached_types = 256
+
+
+def compile_check(allowed_values):  # noqa: C901
+    """Compiles the list of allowed types and values into a single function, which
+    accepts an actual value and returns ``True`` if the value matches at least one of
+    the allowed types/values.
+
+    All the types are merged into a single ``isinstance()`` call, while validators and
+    constants are classified once, so the compiled function doesn't need to inspect
+    the allowed values anymore.
+
+    The result of the ``isinstance()`` call is cached by the exact type of the value,
+    so the values of the accepted types are checked with a single dictionary lookup.
+    Values, which don't match the types, are compared with constants and validators
+    on each call. Results are cached only if all the allowed types are created by the
+    ``type`` metaclass: the ``__instancecheck__`` of the custom metaclasses may depend
+    on the value itself (e.g. runtime checkable protocols) or accept new subclasses
+    later (e.g. abstract base classes). Values, which fake their ``__class__``, are
+    never cached.
+
+    Args:
+        allowed_values (list):
+            Allowed types, values and validators.
+
+    Returns (function):
+        Function which checks an actual value.
+    """
+    allowed_types = tuple(
+        allowed_val for allowed_val in allowed_values
+        if isinstance(allowed_val, type)
+    )
+    other_values = tuple(
+        (is_validator_instance(allowed_val), allowed_val)
+        for allowed_val in allowed_values
+        if not isinstance(allowed_val, type)
+    )
+    is_cacheable = all(type(allowed_type) is type for allowed_type in allowed_types)
+    type_verdicts = dict()
+    get_verdict = type_verdicts.get
+
+    def check_type(value):
+        verdict = isinstance(value, allowed_types)
+        value_type = type(value)
+        if value.__class__ is value_type and len(type_verdicts) < max_cached_types:
+            type_verdicts[value_type] = verdict
+        return verdict
+
+    def check_other(value):
+        for is_validator, allowed_val in other_values:
+            if is_validator:
+                if allowed_val(value):
+                    return True
+            elif value == allowed_val:
+                return True
+        return False
+
+    if not other_values and (len(allowed_types) < 2 or not is_cacheable):
+        # A single isinstance() call is faster than the lookup.
+        def check(value):
+            return isinstance(value, allowed_types)
+    elif not other_values:
+        def check(value):
+            verdict = get_verdict(type(value))
+            if verdict is None:
+                verdict = check_type(value)
+            return verdict
+    elif not is_cacheable:
+        def check(value):
+            return isinstance(value, allowed_types) or check_other(value)
+    else:
+        def check(value):
+            verdict = get_verdict(type(value))
+            if verdict is None:
+                verdict = check_type(value)
+            return verdict or check_other(value)
+    return check
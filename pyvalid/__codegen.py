@@ -0,0 +1,510 @@
+"""Generates specialized wrappers for the ``pyvalid.accepts`` and ``pyvalid.returns``
+decorators.
+
+Instead of walking the list of allowed values on every call, the Python source of the
+wrapper is generated once per decorated function (the same way as ``dataclasses`` and
+``attrs`` do it). The generated wrapper has the same parameter list as the wrapped
+function and the checks of each argument are inlined as plain ``isinstance()`` calls,
+comparisons and validator calls.
+"""
+import linecache
+from inspect import Parameter, signature
+from itertools import count
+from keyword import iskeyword
+from types import FunctionType
+import weakref
+
+from pyvalid.__checks import is_validator_instance
+from pyvalid.__exceptions import PyvalidError
+
+
+#: Prefix of all the global names used by generated wrappers. Functions with
+#: parameters starting with this prefix are not supported.
+PREFIX = '_pyvalid_'
+
+#: Default value of the parameters, which weren't passed to the generated wrapper.
+MISSING = type('Missing', (object, ), {'__repr__': lambda self: '<missing>'})()
+
+_wrappers_counter = count()
+
+
+def make_function(func_name, source, namespace, func):
+    """Compiles the source code of the function and returns the function object.
+
+    The source code is registered in the ``linecache`` module, so tracebacks which go
+    through generated wrappers show the actual lines of code. The entry is removed
+    from the cache when the generated function gets garbage collected.
+
+    Args:
+        func_name (str):
+            Name of the function defined by the source code.
+        source (str):
+            Source code of the function.
+        namespace (dict):
+            Global namespace of the generated function.
+        func (types.FunctionType):
+            The function wrapped by the generated one.
+
+    Returns (types.FunctionType):
+        The generated function.
+    """
+    filename = '<pyvalid wrapper of {} #{}>'.format(
+        func.__qualname__, next(_wrappers_counter)
+    )
+    code = compile(source, filename, 'exec')
+    exec(code, namespace)
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename
+    )
+    function = namespace[func_name]
+    weakref.finalize(function, linecache.cache.pop, filename, None)
+    return function
+
+
+def check_expression(allowed_values, value_name, prefix, namespace):
+    """Builds the Python expression, which is true if the value matches at least one
+    of the allowed types/values. All the objects referenced by the expression are
+    stored in the namespace under names starting with the given prefix.
+
+    Args:
+        allowed_values (list):
+            Allowed types, values and validators.
+        value_name (str):
+            Python expression, which returns the value to check.
+        prefix (str):
+            Prefix of the names stored in the namespace.
+        namespace (dict):
+            Global namespace of the generated function.
+
+    Returns (str):
+        Source of the expression.
+    """
+    conditions = list()
+    allowed_types = tuple(
+        allowed_val for allowed_val in allowed_values
+        if isinstance(allowed_val, type)
+    )
+    if allowed_types:
+        types_name = '{}_types'.format(prefix)
+        if len(allowed_types) == 1:
+            namespace[types_name] = allowed_types[0]
+        else:
+            namespace[types_name] = allowed_types
+        conditions.append('isinstance({}, {})'.format(value_name, types_name))
+    for i, allowed_val in enumerate(allowed_values):
+        if isinstance(allowed_val, type):
+            continue
+        allowed_name = '{}_{}'.format(prefix, i)
+        namespace[allowed_name] = allowed_val
+        if is_validator_instance(allowed_val):
+            conditions.append('{}({})'.format(allowed_name, value_name))
+        else:
+            conditions.append('{} == {}'.format(value_name, allowed_name))
+    if not conditions:
+        return 'False'
+    return ' or '.join(conditions)
+
+
+class FunctionSignature(object):
+    """Parameters of the function, which can be reproduced by a generated wrapper.
+
+    Args:
+        func (types.FunctionType):
+            Function to reproduce.
+    """
+
+    def __init__(self, func):
+        self.args = list()
+        self.defaults = dict()
+        self.kwonlyargs = list()
+        self.varargs = None
+        self.varkw = None
+        for param in signature(func, follow_wrapped=False).parameters.values():
+            if param.kind is Parameter.POSITIONAL_OR_KEYWORD:
+                self.args.append(param.name)
+            elif param.kind is Parameter.KEYWORD_ONLY:
+                self.kwonlyargs.append(param.name)
+            elif param.kind is Parameter.VAR_POSITIONAL:
+                self.varargs = param.name
+            elif param.kind is Parameter.VAR_KEYWORD:
+                self.varkw = param.name
+            else:
+                raise ValueError('Positional-only parameters are not supported.')
+            if param.default is not Parameter.empty:
+                self.defaults[param.name] = param.default
+            if param.name.startswith(PREFIX) or iskeyword(param.name):
+                raise ValueError('Unsupported parameter name.')
+
+    @classmethod
+    def of(cls, func):
+        """Returns the signature of the function or ``None`` if wrappers with the
+        same parameters can't be generated for the function.
+        """
+        if not isinstance(func, FunctionType):
+            return None
+        try:
+            return cls(func)
+        except ValueError:
+            return None
+
+    def value_source(self, arg_name, arg_index):
+        """Returns the Python expression, which gets the value of the argument inside
+        of the generated wrapper, and the condition, which is true if the argument was
+        passed. Returns ``None`` if the argument can't be passed to the function.
+
+        Args:
+            arg_name (str):
+                Name of the argument, ``None`` for items of the ``*args``.
+            arg_index (int):
+                Position of the argument, ``None`` for keyword-only arguments.
+        """
+        if arg_name in self.args or arg_name in self.kwonlyargs:
+            guard = None
+            if arg_name in self.defaults:
+                guard = '{} is not {}missing'.format(arg_name, PREFIX)
+            return arg_name, guard
+        if arg_name is None and self.varargs:
+            varargs_index = arg_index - len(self.args)
+            return (
+                '{}[{}]'.format(self.varargs, varargs_index),
+                'len({}) > {}'.format(self.varargs, varargs_index)
+            )
+        if arg_name is not None and self.varkw:
+            return (
+                '{}[{!r}]'.format(self.varkw, arg_name),
+                '{!r} in {}'.format(arg_name, self.varkw)
+            )
+        return None
+
+    def extra_params(self):
+        """Returns the names of the parameters, which the generated wrapper adds to
+        catch the extra positional and keyword arguments, if the function doesn't
+        have the ``*args`` and ``**kwargs`` parameters.
+        """
+        extra_params = list()
+        if not self.varargs:
+            extra_params.append(PREFIX + 'args')
+        if not self.varkw:
+            extra_params.append(PREFIX + 'kwargs')
+        return extra_params
+
+    def definition(self, func_name, defaults, catch_all=False):
+        """Returns the first line of the function definition.
+
+        Args:
+            func_name (str):
+                Name of the function.
+            defaults (dict):
+                Names of default values of the parameters, which are stored in the
+                global namespace of the generated function.
+            catch_all (bool):
+                If set to ``True``, the function accepts any extra arguments (see the
+                ``extra_params`` method).
+        """
+        params = list()
+        for arg_name in self.args:
+            if arg_name in defaults:
+                params.append('{}={}'.format(arg_name, defaults[arg_name]))
+            else:
+                params.append(arg_name)
+        varargs, varkw = self.__variadic_params(catch_all)
+        if varargs:
+            params.append('*{}'.format(varargs))
+        elif self.kwonlyargs:
+            params.append('*')
+        for arg_name in self.kwonlyargs:
+            if arg_name in defaults:
+                params.append('{}={}'.format(arg_name, defaults[arg_name]))
+            else:
+                params.append(arg_name)
+        if varkw:
+            params.append('**{}'.format(varkw))
+        return 'def {}({}):'.format(func_name, ', '.join(params))
+
+    def call(self, func_name, catch_all=False):
+        """Returns the expression, which calls the function with all the parameters.
+        """
+        params = list(self.args)
+        varargs, varkw = self.__variadic_params(catch_all)
+        if varargs:
+            params.append('*{}'.format(varargs))
+        params.extend('{0}={0}'.format(arg_name) for arg_name in self.kwonlyargs)
+        if varkw:
+            params.append('**{}'.format(varkw))
+        return '{}({})'.format(func_name, ', '.join(params))
+
+    def __variadic_params(self, catch_all):
+        if not catch_all:
+            return self.varargs, self.varkw
+        return self.varargs or PREFIX + 'args', self.varkw or PREFIX + 'kwargs'
+
+
+def wrapper_name(func):
+    func_name = func.__name__
+    if not func_name.isidentifier() or iskeyword(func_name) or \
+            func_name.startswith(PREFIX):
+        func_name = 'decorator_wrapper'
+    return func_name
+
+
+def store_defaults(func_signature, namespace, missing_params=()):
+    """Stores default values of the parameters in the namespace and returns the names
+    of the stored values.
+    """
+    defaults = dict()
+    for arg_name, default_value in func_signature.defaults.items():
+        defaults[arg_name] = '{}default_{}'.format(PREFIX, arg_name)
+        namespace[defaults[arg_name]] = default_value
+    for arg_name in missing_params:
+        defaults[arg_name] = '{}missing'.format(PREFIX)
+    return defaults
+
+
+def accepts_wrapper(func, plan, validate_args, namespace):  # noqa: C901
+    """Generates the wrapper, which validates the arguments of the function according
+    to the argument plan built by ``pyvalid.accepts``.
+
+    Parameters, which have to be validated, get a special default value in the
+    generated wrapper, so the wrapper is able to skip validation of the arguments,
+    which weren't passed. The wrapper also accepts any extra positional and keyword
+    arguments. When a required argument is missing or extra arguments are passed, the
+    wrapper falls back to the generic validation, so the malformed calls raise the
+    same errors as with the generic wrapper.
+
+    Args:
+        func (types.FunctionType):
+            Function to validate.
+        plan (tuple):
+            Argument plan of the function.
+        validate_args (function):
+            Generic validation, accepts the function, the argument plan, positional
+            and keyword arguments.
+        namespace (dict):
+            Objects used by the wrapper: the ``pyvalid.switch`` module, the
+            pyvalid's exceptions, the function formatting ordinal numbers, the
+            optional sampler and the optional ``call`` — the function called instead
+            of the validated one, e.g. to measure the time of the validation.
+
+    Returns (types.FunctionType):
+        The generated wrapper or ``None`` if the function is not supported.
+    """
+    func_signature = FunctionSignature.of(func)
+    if func_signature is None:
+        return None
+    namespace = dict(
+        ('{}{}'.format(PREFIX, name), value) for name, value in namespace.items()
+    )
+    namespace.update({
+        PREFIX + 'func': func,
+        PREFIX + 'missing': MISSING,
+    })
+    namespace.setdefault(PREFIX + 'call', func)
+    missing_name = PREFIX + 'missing'
+    # Each required parameter gets the special default value, so the wrapper is able
+    # to raise InvalidArgumentNumberError, as the generic wrapper does.
+    required_args = [
+        arg_name for arg_name in func_signature.args + func_signature.kwonlyargs
+        if arg_name not in func_signature.defaults
+    ]
+    validated_optional_args = list()
+    checks = list()
+    for param_num, param in enumerate(plan.params):
+        arg_name, arg_index, _, ord_num, _, allowed_values = param
+        prefix = '{}param{}'.format(PREFIX, param_num)
+        allowed_name = '{}_allowed'.format(prefix)
+        namespace[allowed_name] = allowed_values
+        value_source = func_signature.value_source(arg_name, arg_index)
+        if value_source is None:
+            # The argument can't be passed to the function at all.
+            continue
+        value_name, guard = value_source
+        if arg_name in func_signature.defaults and \
+                arg_name not in validated_optional_args:
+            validated_optional_args.append(arg_name)
+        condition = check_expression(allowed_values, value_name, prefix, namespace)
+        condition = 'not ({})'.format(condition)
+        if guard:
+            condition = '{} and {}'.format(guard, condition)
+        checks.extend((
+            '        if {}:'.format(condition),
+            '            raise {0}ArgumentValidationError('
+            '{0}func, {1!r}, {2}, {3}, arg_name={4!r})'.format(
+                PREFIX, ord_num, value_name, allowed_name, arg_name
+            ),
+        ))
+    checks.extend(variadic_checks(func_signature, plan, namespace))
+    defaults = store_defaults(
+        func_signature, namespace, required_args + validated_optional_args
+    )
+    func_name = wrapper_name(func)
+    lines = [func_signature.definition(func_name, defaults, catch_all=True)]
+    namespace[PREFIX + 'partial_call'] = partial_call(
+        func, func_signature, plan, validate_args, namespace
+    )
+    fallback_conditions = [
+        '{} is {}'.format(arg_name, missing_name) for arg_name in required_args
+    ]
+    fallback_conditions.extend(func_signature.extra_params())
+    if fallback_conditions:
+        lines.extend((
+            '    if {}:'.format(' or '.join(fallback_conditions)),
+            '        return {}'.format(
+                func_signature.call(PREFIX + 'partial_call', catch_all=True)
+            ),
+        ))
+    if checks:
+        lines.append('    if {}:'.format(enabled_condition(namespace)))
+        lines.extend(checks)
+    for arg_name in validated_optional_args:
+        lines.extend((
+            '    if {} is {}:'.format(arg_name, missing_name),
+            '        {} = {}default_{}'.format(arg_name, PREFIX, arg_name),
+        ))
+    lines.append('    return {}'.format(func_signature.call(PREFIX + 'call')))
+    source = '\n'.join(lines) + '\n'
+    return make_function(func_name, source, namespace, func)
+
+
+def enabled_condition(namespace):
+    """Returns the expression, which decides if the call has to be validated. It
+    checks the switch and then asks the sampler, if the wrapper has one.
+    """
+    condition = PREFIX + 'switch.pyvalid_enabled'
+    if PREFIX + 'sampler' in namespace:
+        condition += ' and {}sampler()'.format(PREFIX)
+    return condition
+
+
+def variadic_checks(func_signature, plan, namespace):
+    """Returns the lines of the generated wrapper, which validate each extra item of
+    the ``*args`` and each extra value of the ``**kwargs``.
+    """
+    lines = list()
+    index_name = PREFIX + 'index'
+    value_name = PREFIX + 'value'
+    if plan.varargs is not None and func_signature.varargs:
+        arg_name, first_index, _, allowed_values = plan.varargs
+        prefix = PREFIX + 'varargs'
+        allowed_name = '{}_allowed'.format(prefix)
+        namespace[allowed_name] = allowed_values
+        condition = check_expression(allowed_values, value_name, prefix, namespace)
+        args_count = len(func_signature.args)
+        lines.extend((
+            '        for {} in range({}, len({})):'.format(
+                index_name, max(first_index - args_count, 0), func_signature.varargs
+            ),
+            '            {} = {}[{}]'.format(
+                value_name, func_signature.varargs, index_name
+            ),
+            '            if not ({}):'.format(condition),
+            '                raise {0}ArgumentValidationError({0}func, {0}ordinal('
+            '{1} + {2}), {3}, {4}, arg_name={5!r})'.format(
+                PREFIX, index_name, args_count + 1, value_name, allowed_name, arg_name
+            ),
+        ))
+    if plan.varkw is not None and func_signature.varkw:
+        _, named_args, ord_num, _, allowed_values = plan.varkw
+        prefix = PREFIX + 'varkw'
+        allowed_name = '{}_allowed'.format(prefix)
+        named_name = '{}_named'.format(prefix)
+        namespace[allowed_name] = allowed_values
+        namespace[named_name] = named_args
+        key_name = PREFIX + 'key'
+        condition = check_expression(allowed_values, value_name, prefix, namespace)
+        lines.extend((
+            '        for {}, {} in {}.items():'.format(
+                key_name, value_name, func_signature.varkw
+            ),
+            '            if {} not in {} and not ({}):'.format(
+                key_name, named_name, condition
+            ),
+            '                raise {0}ArgumentValidationError({0}func, {1!r}, {2}, {3}, '
+            'arg_name={4})'.format(
+                PREFIX, ord_num, value_name, allowed_name, key_name
+            ),
+        ))
+    return lines
+
+
+def drop_missing(func_signature, func_args, func_kwargs):
+    """Removes the arguments, which weren't passed to the generated wrapper, and
+    returns the positional and keyword arguments, which were passed.
+    """
+    # When the items of the "*args" or the extra positional arguments are passed, all
+    # the positional arguments are passed too, so the positional arguments are kept
+    # as is.
+    if len(func_args) == len(func_signature.args):
+        for arg_name, value in zip(func_signature.args, func_args):
+            if value is not MISSING:
+                func_kwargs[arg_name] = value
+        func_args = tuple()
+    for arg_name in func_signature.kwonlyargs:
+        if func_kwargs.get(arg_name) is MISSING:
+            del func_kwargs[arg_name]
+    return func_args, func_kwargs
+
+
+def partial_call(func, func_signature, plan, validate_args, namespace):
+    """Returns the function, which is called by the generated wrapper when some
+    required arguments are missing or extra arguments are passed. It passes all the
+    given arguments to the generic validation and then calls the wrapped function, so
+    it raises the same errors as the generic wrapper.
+    """
+    switch = namespace[PREFIX + 'switch']
+    sampler = namespace.get(PREFIX + 'sampler')
+    call = namespace[PREFIX + 'call']
+
+    def call_with_missing(*func_args, **func_kwargs):
+        func_args, func_kwargs = drop_missing(func_signature, func_args, func_kwargs)
+        if switch.pyvalid_enabled and (sampler is None or sampler()):
+            try:
+                validate_args(func, plan, func_args, func_kwargs)
+            except PyvalidError:
+                if sampler is not None:
+                    sampler.failed += 1
+                raise
+        return call(*func_args, **func_kwargs)
+    return call_with_missing
+
+
+def returns_wrapper(func, allowed_return_values, namespace):
+    """Generates the wrapper, which validates the value returned by the function.
+
+    Args:
+        func (types.FunctionType):
+            Function to validate.
+        allowed_return_values (tuple):
+            Allowed return types, values and validators.
+        namespace (dict):
+            Objects used by the wrapper: the ``pyvalid.switch`` module, the
+            pyvalid's exceptions, the optional sampler and the optional ``call`` —
+            the function called instead of the validated one.
+
+    Returns (types.FunctionType):
+        The generated wrapper or ``None`` if the function is not supported.
+    """
+    func_signature = FunctionSignature.of(func)
+    if func_signature is None:
+        return None
+    namespace = dict(
+        ('{}{}'.format(PREFIX, name), value) for name, value in namespace.items()
+    )
+    namespace.update({
+        PREFIX + 'func': func,
+        PREFIX + 'allowed': allowed_return_values,
+    })
+    namespace.setdefault(PREFIX + 'call', func)
+    condition = check_expression(
+        allowed_return_values, PREFIX + 'returns_val', PREFIX + 'returns', namespace
+    )
+    func_name = wrapper_name(func)
+    defaults = store_defaults(func_signature, namespace)
+    source = '\n'.join((
+        func_signature.definition(func_name, defaults),
+        '    {}returns_val = {}'.format(PREFIX, func_signature.call(PREFIX + 'call')),
+        '    if {} and not ({}):'.format(enabled_condition(namespace), condition),
+        '        raise {0}InvalidReturnTypeError('
+        '{0}func, {0}returns_val, {0}allowed)'.format(PREFIX),
+        '    return {}returns_val'.format(PREFIX),
+    )) + '\n'
+    return make_function(func_name, source, namespace, func)
@@ -1,3 +1,8 @@
+from inspect import signature
+from reprlib import Repr
+from weakref import WeakKeyDictionary
+
+
 class PyvalidError(ValueError):
     """The base class for all the pyvalid errors. So it can be used for the try-except
     contruction as a base class for all the possible exceptions raised by the pyvalid.
@@ -31,70 +36,131 @@ class PyvalidError(ValueError):
             print('Only numbers are allowed!')
 
     """
+    #: Cache of the function names with signatures, which are used in the error
+    #: messages. Entries are removed together with the functions.
+    __func_names = WeakKeyDictionary()
+
+    #: Error message, which is built on the first access.
+    __error = None
+
+    #: Limits of the representation of the actual values in the error messages.
+    value_repr = Repr()
+    value_repr.maxstring = value_repr.maxother = 200
+
     def __get_func_name__(self, func):
-        func_name = func.__name__
-        from sys import version_info
-        py_ver = (version_info.major, version_info.minor)
-        has_signature_support = py_ver >= (3, 3)
-        if has_signature_support:
-            from inspect import signature
+        try:
+            return self.__func_names[func]
+        except (KeyError, TypeError):
+            pass
+        func_name = getattr(func, '__name__', None)
+        if func_name is None:
+            func_name = type(func).__name__
+        try:
             func_name += str(signature(func))
-        else:
+        except (TypeError, ValueError):
             func_name += '()'
+        try:
+            self.__func_names[func] = func_name
+        except TypeError:
+            # The function doesn't support weak references.
+            pass
         return func_name
 
+    def __format_value__(self, value):
+        """Returns the string representation of the actual value, which is truncated
+        without converting the whole value to a string.
+        """
+        if isinstance(value, str):
+            if len(value) > self.value_repr.maxstring:
+                value = value[:self.value_repr.maxstring] + '...'
+            return value
+        return self.value_repr.repr(value)
+
+    def __str__(self):
+        # The message is built only when it's needed, because errors are often caught
+        # and discarded. Errors created with the message don't build it.
+        build_error = getattr(self, '__build_error__', None)
+        if build_error is None:
+            return ValueError.__str__(self)
+        if self.__error is None:
+            self.__error = build_error()
+        return self.__error
+
+    @property
+    def error(self):
+        return str(self)
+
 
 class InvalidArgumentNumberError(PyvalidError):
     """Raised when the number or position of arguments supplied to a function is
     incorrect.
     """
     def __init__(self, func):
+        self.func = func
+
+    def __build_error__(self):
         error_message_template = (
             'Invalid number or position of arguments for the "{}" function.'
         )
-        self.error = error_message_template.format(
-            self.__get_func_name__(func)
-        )
-
-    def __str__(self):
-        return self.error
+        return error_message_template.format(self.__get_func_name__(self.func))
 
 
 class ArgumentValidationError(PyvalidError):
     """Raised when the function's parameter contains the value is different from the
     expected one.
+
+    The ``arg_num`` attribute contains the ordinal number of the argument (e.g.
+    ``'2nd'``) and the ``arg_name`` contains its name, if it's known.
+
+    When an element of the streamed iterator is invalid, the ``element_index``
+    attribute contains the index of this element and the ``actual_value`` is the
+    element itself. Otherwise the ``element_index`` is ``None``.
     """
-    def __init__(self, func, arg_num, actual_value, allowed_arg_values):
-        error_message_template = (
-            'The {} argument of the "{}" function is "{}" of the "{}" type, while '
-            'expected values are: "{}".'
-        )
-        self.error = error_message_template.format(
-            arg_num,
-            self.__get_func_name__(func),
-            actual_value,
-            type(actual_value),
-            allowed_arg_values
+    def __init__(self, func, arg_num, actual_value, allowed_arg_values,
+                 element_index=None, arg_name=None):
+        self.func = func
+        self.arg_num = arg_num
+        self.arg_name = arg_name
+        self.actual_value = actual_value
+        self.allowed_arg_values = allowed_arg_values
+        self.element_index = element_index
+
+    def __build_error__(self):
+        if self.element_index is None:
+            error_message_template = (
+                'The {} argument of the "{}" function is "{}" of the "{}" type, while '
+                'expected values are: "{}".'
+            )
+        else:
+            error_message_template = (
+                'The element #{} of the {{}} argument of the "{{}}" function is "{{}}" '
+                'of the "{{}}" type, while expected values are: "{{}}".'
+            ).format(self.element_index)
+        return error_message_template.format(
+            self.arg_num,
+            self.__get_func_name__(self.func),
+            self.__format_value__(self.actual_value),
+            type(self.actual_value),
+            self.allowed_arg_values
         )
 
-    def __str__(self):
-        return self.error
-
 
 class InvalidReturnTypeError(PyvalidError):
     """Raised when a function returns the value different from the expected one.
     """
     def __init__(self, func, actual_value, allowed_return_values):
+        self.func = func
+        self.actual_value = actual_value
+        self.allowed_return_values = allowed_return_values
+
+    def __build_error__(self):
         error_message_template = (
             'Invalid return value "{}" of the "{}" type for the "{}" function, while '
             'expected values are: "{}".'
         )
-        self.error = error_message_template.format(
-            actual_value,
-            type(actual_value),
-            self.__get_func_name__(func),
-            allowed_return_values
+        return error_message_template.format(
+            self.__format_value__(self.actual_value),
+            type(self.actual_value),
+            self.__get_func_name__(self.func),
+            self.allowed_return_values
         )
-
-    def __str__(self):
-        return self.error
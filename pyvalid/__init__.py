@@ -16,7 +16,12 @@ Purposes of the pyvalid package:
 from pyvalid.__accepts import Accepts as accepts
 from pyvalid.__returns import Returns as returns
 from pyvalid import switch
+from pyvalid import sampling
+from pyvalid import stats
+from pyvalid import concurrency
+from pyvalid import deferred
 from pyvalid import validators
+from pyvalid.__validate import validate
 from pyvalid.__exceptions import PyvalidError, ArgumentValidationError, \
     InvalidArgumentNumberError, InvalidReturnTypeError
 
@@ -27,7 +32,12 @@ version = '1.0.4'
 __all__ = [
     'accepts',
     'returns',
+    'validate',
     'switch',
+    'sampling',
+    'stats',
+    'concurrency',
+    'deferred',
     'validators',
     'version',
     'PyvalidError',
@@ -1,12 +1,13 @@
-from functools import wraps
-from types import MethodType
+from functools import partial, wraps
 try:
     from collections.abc import Callable
 except ImportError:
     from collections import Callable
 
+from pyvalid.__checks import compile_check, is_async_function
+from pyvalid.__codegen import returns_wrapper
 from pyvalid.__exceptions import InvalidReturnTypeError
-from pyvalid.switch import is_enabled
+from pyvalid import concurrency, deferred, sampling, stats, switch
 
 
 class Returns(Callable):
@@ -45,37 +46,203 @@ class Returns(Callable):
         multiply(3, 'pyvalid')
         # Raises the InvalidReturnTypeError exception, since the function returns the
         # str value, when we're expecting int values only.
+
+    Coroutine functions are wrapped into the native ``async def`` wrappers, which
+    validate the awaited result. The wrappers of asynchronous generator functions
+    validate each yielded item, when it's pulled from the generator. Heavy validators
+    are run in the executor of the ``pyvalid.concurrency`` module.
+
+    With ``deferred=True`` the return value is handed back to the caller immediately
+    and validated in the background by the ``pyvalid.deferred`` module. Failures are
+    passed to the ``sink``: they are logged by default, but the sink may also be the
+    ``pyvalid.deferred.RaiseOnNextCall`` sink or any function accepting the exception.
+
+    .. code-block:: python
+
+        from pyvalid import deferred, returns
+
+
+        @returns(int, deferred=True, sink=deferred.RaiseOnNextCall())
+        def multiply(num_1, num_2):
+            return num_1 * num_2
+
+
+        multiply(3.14, 8)
+        # Returns 25.12, the failure is kept by the sink.
+
+        multiply(4, 2)
+        # Raises the InvalidReturnTypeError exception of the previous call.
     """
 
-    def __init__(self, *allowed_return_values):
+    #: Generate specialized wrappers with inlined checks. When disabled or when the
+    #: wrapper can't be generated, the generic (slower) wrapper is used instead.
+    codegen = True
+
+    #: Sampling policy of the decorator. If it's not set, the default sampler of the
+    #: ``pyvalid.sampling`` module is used.
+    sampler = None
+
+    def __init__(self, *allowed_return_values, **kwargs):
         self.allowed_return_values = allowed_return_values
+        self.deferred = kwargs.pop('deferred', False)
+        self.sink = kwargs.pop('sink', None)
+        if kwargs:
+            raise TypeError('Unexpected options: {}.'.format(', '.join(sorted(kwargs))))
+        if self.sink is not None and not self.deferred:
+            raise ValueError('Sink can be set in the deferred mode only!')
+
+    @classmethod
+    def sampled(cls, sampler, *allowed_return_values, **kwargs):
+        """Creates the decorator, which validates only the calls chosen by the given
+        sampler.
+
+        Example:
+
+        .. code-block:: python
+
+            from pyvalid import returns, sampling
+
+
+            @returns.sampled(sampling.Probabilistic(0.01), int, float)
+            def multiply(num_1, num_2):
+                return num_1 * num_2
+
+        Args:
+            sampler (pyvalid.sampling.Sampler):
+                Sampling policy.
+
+        Returns (pyvalid.returns):
+            The decorator.
+        """
+        decorator = cls(*allowed_return_values, **kwargs)
+        decorator.sampler = sampler
+        return decorator
 
     def __call__(self, func):
-        @wraps(func)
-        def decorator_wrapper(*func_args, **func_kwargs):
-            from pyvalid.validators import Validator
-            returns_val = func(*func_args, **func_kwargs)
-            if is_enabled() and self.allowed_return_values:
-                is_valid = False
-                for allowed_val in self.allowed_return_values:
-                    if isinstance(allowed_val, (Validator, MethodType)):
-                        if isinstance(allowed_val, Validator):
-                            is_valid = allowed_val(returns_val)
-                        elif (isinstance(allowed_val, MethodType) and
-                                hasattr(allowed_val, '__func__') and
-                                isinstance(allowed_val.__func__, Validator)):
-                            is_valid = allowed_val(returns_val)
-                    elif isinstance(allowed_val, type):
-                        is_valid = isinstance(
-                            returns_val, allowed_val
-                        )
-                    else:
-                        is_valid = returns_val == allowed_val
-                    if is_valid:
-                        break
+        if switch.pyvalid_stripped:
+            return func
+        allowed_return_values = self.allowed_return_values
+        sampler = self.sampler
+        sampler = sampling.default_sampler if sampler is None else sampler
+        error_type = InvalidReturnTypeError
+        if sampler is not None:
+            error_type = sampler.counting(InvalidReturnTypeError)
+        func_stats = None
+        if stats.enabled:
+            func_stats = stats.register(
+                stats.FunctionStats, 'returns', stats.function_name(func)
+            )
+        if is_async_function(func):
+            return wraps(func)(
+                self.__async_wrapper(func, sampler, error_type, func_stats)
+            )
+        # The instrumented wrapper calls the function through the statistics, which
+        # mark the start of the validation.
+        call = func if func_stats is None else func_stats.call(func)
+        if self.deferred and allowed_return_values:
+            decorator_wrapper = self.__deferred_wrapper(func, sampler, error_type, call)
+        else:
+            decorator_wrapper = self.__sync_wrapper(func, sampler, error_type, call)
+        if func_stats is not None:
+            decorator_wrapper = func_stats.wrap(decorator_wrapper)
+        return wraps(func)(decorator_wrapper)
+
+    def __sync_wrapper(self, func, sampler, error_type, call):
+        """Returns the wrapper, which calls the ``call`` function and validates the
+        return value.
+        """
+        allowed_return_values = self.allowed_return_values
+        decorator_wrapper = None
+        if allowed_return_values and self.codegen:
+            namespace = {
+                'switch': switch,
+                'InvalidReturnTypeError': error_type,
+            }
+            if sampler is not None:
+                namespace['sampler'] = sampler
+            if call is not func:
+                namespace['call'] = call
+            decorator_wrapper = returns_wrapper(func, allowed_return_values, namespace)
+        if decorator_wrapper is None:
+            check = compile_check(allowed_return_values)
+
+            def decorator_wrapper(*func_args, **func_kwargs):
+                returns_val = call(*func_args, **func_kwargs)
+                is_valid = (
+                    not allowed_return_values or
+                    not switch.pyvalid_enabled or
+                    (sampler is not None and not sampler()) or
+                    check(returns_val)
+                )
                 if not is_valid:
-                    raise InvalidReturnTypeError(
-                        func, returns_val, self.allowed_return_values
-                    )
+                    raise error_type(func, returns_val, allowed_return_values)
+                return returns_val
+        return decorator_wrapper
+
+    def __deferred_wrapper(self, func, sampler, error_type, call):
+        """Returns the wrapper, which submits the validation of the return value to
+        the background and returns it immediately.
+        """
+        submit, raise_pending = self.__deferred_check(func, sampler, error_type)
+
+        def decorator_wrapper(*func_args, **func_kwargs):
+            if raise_pending is not None:
+                raise_pending()
+            returns_val = call(*func_args, **func_kwargs)
+            submit(returns_val)
             return returns_val
         return decorator_wrapper
+
+    def __deferred_check(self, func, sampler, error_type):
+        """Returns the function, which submits the validation of the return value to
+        the background, and the ``raise_pending`` method of the sink or ``None``.
+        """
+        allowed_return_values = self.allowed_return_values
+        check = compile_check(allowed_return_values)
+        sink = deferred.get_sink(self.sink)
+
+        def submit(returns_val):
+            if switch.pyvalid_enabled and (sampler is None or sampler()):
+                create_exception = partial(
+                    error_type, func, returns_val, allowed_return_values
+                )
+                deferred.submit(check, returns_val, create_exception, sink)
+        return submit, sink.raise_pending if sink.raises else None
+
+    def __async_wrapper(self, func, sampler, error_type, func_stats=None):
+        """Returns the native wrapper of the coroutine function, which validates the
+        awaited result, or of the asynchronous generator function, which validates
+        each yielded item. Heavy validators are run in the executor.
+        """
+        from pyvalid.__async import async_wrapper
+        allowed_return_values = self.allowed_return_values
+        if not allowed_return_values:
+            return async_wrapper(func, func)
+        if self.deferred:
+            submit, raise_pending = self.__deferred_check(func, sampler, error_type)
+            if func_stats is not None:
+                submit = func_stats.wrap_check(submit)
+            if raise_pending is None:
+                return async_wrapper(func, func, submit)
+
+            def check_args(func_args, func_kwargs):
+                raise_pending()
+                return func_args, func_kwargs, None
+            return async_wrapper(func, func, submit, check_args)
+        inline_values, heavy_validators = concurrency.split_heavy(allowed_return_values)
+        check = compile_check(inline_values)
+
+        def check_result(returns_val):
+            if not switch.pyvalid_enabled or (sampler is not None and not sampler()) or \
+                    check(returns_val):
+                return None
+            create_exception = partial(
+                error_type, func, returns_val, allowed_return_values
+            )
+            if not heavy_validators:
+                raise create_exception()
+            future = concurrency.submit(heavy_validators, returns_val)
+            return [(future, create_exception)]
+        if func_stats is not None:
+            check_result = func_stats.wrap_check(check_result)
+        return async_wrapper(func, func, check_result)
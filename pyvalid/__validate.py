@@ -0,0 +1,325 @@
+from inspect import Parameter, signature, unwrap
+from itertools import islice
+import types
+import typing
+try:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+except ImportError:
+    from collections import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+
+from pyvalid.__accepts import Accepts
+from pyvalid.__checks import compile_check, isasyncgenfunction, is_validator_instance
+from pyvalid.__returns import Returns
+from pyvalid.validators import Validator
+from pyvalid import switch
+
+
+#: The ``Literal`` special form or ``None`` on Python < 3.8.
+LITERAL = getattr(typing, 'Literal', None)
+
+#: Qualifiers, which wrap the type hints (``ClassVar`` and ``Final``), available on the
+#: current version of Python.
+QUALIFIERS = tuple(
+    qualifier
+    for qualifier in (getattr(typing, 'ClassVar', None), getattr(typing, 'Final', None))
+    if qualifier is not None
+)
+
+
+def accept_any(value):
+    return True
+
+
+def get_origin(hint):
+    if hasattr(typing, 'get_origin'):
+        return typing.get_origin(hint)
+    return getattr(hint, '__origin__', None)
+
+
+def get_args(hint):
+    if hasattr(typing, 'get_args'):
+        return typing.get_args(hint)
+    return getattr(hint, '__args__', tuple())
+
+
+def resolve_type_hints(obj):
+    try:
+        return typing.get_type_hints(obj, include_extras=True)
+    except TypeError:
+        # Python < 3.9 doesn't support the "include_extras" argument.
+        return typing.get_type_hints(obj)
+
+
+def get_type_hints(func):
+    """Returns the type hints of the function. Forward references, which can't be
+    resolved when the function gets decorated (e.g. the class, which is being defined,
+    or the classes defined later), are skipped.
+    """
+    try:
+        return resolve_type_hints(func)
+    except NameError:
+        pass
+    global_names = getattr(unwrap(func), '__globals__', dict())
+    type_hints = dict()
+    for name, annotation in getattr(func, '__annotations__', dict()).items():
+        # Each hint is resolved on its own, so the others are still validated.
+        hint_holder = types.SimpleNamespace(
+            __annotations__={name: annotation}, __globals__=global_names
+        )
+        try:
+            type_hints.update(resolve_type_hints(hint_holder))
+        except NameError:
+            continue
+    return type_hints
+
+
+class Validate(Callable):
+    """
+    ``pyvalid.validate(func=None, max_depth=2, sample_size=16)``
+    ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    The decorator which validates input parameters and the return value of the
+    wrapped function according to its type hints.
+
+    The type hints are read once, when the function gets decorated, and compiled into
+    the allowed types, values and validators of the ``pyvalid.accepts`` and
+    ``pyvalid.returns`` decorators, so the calls are validated as fast as if these
+    decorators were used directly. The following hints are supported:
+
+    * classes, ``None``, ``Any`` and ``object``;
+    * ``Optional``, ``Union`` (including the ``X | Y`` syntax) and ``Literal``;
+    * ``Annotated[X, validator, ...]`` — the value has to match ``X`` and all the
+      pyvalid validators given in the metadata. Other metadata is ignored;
+    * generic containers, such as ``List[int]``, ``Set[str]``, ``Dict[str, float]``,
+      ``Tuple[int, str]`` and ``Tuple[int, ...]``, as well as the abstract ones,
+      such as ``Sequence[int]`` and ``Mapping[str, int]``;
+    * ``NewType``, ``TypeVar`` with the bound or constraints, ``ClassVar`` and
+      ``Final``.
+
+    Parameters without hints, as well as hints, which can't be checked at runtime
+    (e.g. unresolved forward references, protocols, which aren't runtime checkable),
+    are not validated. Default values of the parameters are always allowed. The return
+    hint of the asynchronous generator function, e.g. ``AsyncIterator[int]``, is
+    applied to each yielded item.
+
+    Elements of the containers are validated up to the ``max_depth`` level of nesting
+    (``None`` means no limit, ``0`` means that only the types of the containers are
+    checked). Only ``sample_size`` elements of each container are validated, evenly
+    spaced in the sequences and the first ones in the other collections, so the
+    validation of large collections doesn't cost O(n) per call. Set ``sample_size``
+    to ``None`` to validate all the elements. Iterators are never consumed, so their
+    elements are not validated.
+
+    Examples of usage:
+
+    .. code-block:: python
+
+        from typing import Annotated, Dict, List, Optional
+
+        from pyvalid import validate
+        from pyvalid.validators import NumberValidator
+
+
+        @validate
+        def mean(values: List[float],
+                 weights: Optional[Dict[str, float]] = None) -> float:
+            return sum(values) / len(values)
+
+
+        @validate(sample_size=None)
+        def percent(value: Annotated[int, NumberValidator(min_val=0, max_val=100)]):
+            return value / 100
+    """
+
+    def __init__(self, max_depth=2, sample_size=16):
+        if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 0):
+            raise ValueError('The maximal depth has to be a non-negative integer.')
+        if sample_size is not None and \
+                (not isinstance(sample_size, int) or sample_size < 1):
+            raise ValueError('The sample size has to be a positive integer.')
+        self.max_depth = max_depth
+        self.sample_size = sample_size
+
+    def __call__(self, func=None, **options):
+        if func is None:
+            # The decorator is used with options, e.g. "@validate(max_depth=1)".
+            params = dict(max_depth=self.max_depth, sample_size=self.sample_size)
+            params.update(options)
+            return type(self)(**params)
+        if switch.pyvalid_stripped:
+            return func
+        type_hints = get_type_hints(func)
+        allowed_arg_values, allowed_kwargs_values = self.__allowed_params(
+            func, type_hints
+        )
+        if allowed_arg_values or allowed_kwargs_values:
+            func = Accepts(*allowed_arg_values, **allowed_kwargs_values)(func)
+        allowed_return_values = None
+        if 'return' in type_hints:
+            return_hint = type_hints['return']
+            if isasyncgenfunction(func):
+                # The items yielded by the asynchronous generator are validated, e.g.
+                # "AsyncIterator[int]" allows the "int" items.
+                return_hint = (get_args(return_hint) or (typing.Any, ))[0]
+            allowed_return_values = self.allowed_values(return_hint)
+        if allowed_return_values is not None:
+            func = Returns(*allowed_return_values)(func)
+        return func
+
+    def __allowed_params(self, func, type_hints):
+        """Returns the allowed values of the positional-only arguments and of the
+        other arguments by their names, in the format of ``pyvalid.accepts``.
+        """
+        allowed_arg_values = list()
+        allowed_kwargs_values = dict()
+        for param in signature(func, follow_wrapped=False).parameters.values():
+            allowed_values = None
+            if param.name in type_hints:
+                allowed_values = self.allowed_values(type_hints[param.name])
+            if allowed_values is not None and param.default is not Parameter.empty:
+                allowed_values.append(param.default)
+            if param.kind is Parameter.POSITIONAL_ONLY:
+                # Positional-only arguments can't be validated by the name.
+                allowed_arg_values.append(
+                    [object] if allowed_values is None else allowed_values
+                )
+            elif allowed_values is not None:
+                allowed_kwargs_values[param.name] = allowed_values
+        return allowed_arg_values, allowed_kwargs_values
+
+    def allowed_values(self, hint):
+        """Compiles the type hint into the allowed types, values and validators.
+
+        Args:
+            hint (object):
+                Type hint.
+
+        Returns (list):
+            Allowed types, values and validators or ``None`` if the hint allows any
+            value.
+        """
+        return self.__compile_hint(hint, self.max_depth)
+
+    def __compile_hint(self, hint, depth):  # noqa: C901
+        if hint is typing.Any or hint is object:
+            return None
+        if hint is None or hint is type(None):
+            return [None]
+        if isinstance(hint, typing.TypeVar):
+            if hint.__bound__ is not None:
+                return self.__compile_hint(hint.__bound__, depth)
+            if hint.__constraints__:
+                return self.__compile_union(hint.__constraints__, depth)
+            return None
+        if hasattr(hint, '__supertype__'):
+            # NewType.
+            return self.__compile_hint(hint.__supertype__, depth)
+        if hasattr(hint, '__metadata__'):
+            # Annotated.
+            return self.__compile_annotated(hint.__origin__, hint.__metadata__, depth)
+        origin = get_origin(hint)
+        if origin is not None:
+            if origin is typing.Union or \
+                    (hasattr(types, 'UnionType') and origin is types.UnionType):
+                return self.__compile_union(get_args(hint), depth)
+            if origin is LITERAL:
+                return list(get_args(hint))
+            if origin in QUALIFIERS:
+                return self.__compile_hint(get_args(hint)[0], depth)
+            if isinstance(origin, type):
+                return [self.__compile_generic(origin, get_args(hint), depth)]
+        if not isinstance(hint, type):
+            # Forward references and other hints, which can't be checked at runtime.
+            return None
+        if getattr(hint, '_is_protocol', False) and \
+                not getattr(hint, '_is_runtime_protocol', False):
+            return None
+        return [hint]
+
+    def __compile_union(self, hints, depth):
+        allowed_values = list()
+        for hint in hints:
+            hint_values = self.__compile_hint(hint, depth)
+            if hint_values is None:
+                return None
+            allowed_values.extend(hint_values)
+        return allowed_values
+
+    def __compile_annotated(self, hint, metadata, depth):
+        validators = tuple(
+            validator for validator in metadata if is_validator_instance(validator)
+        )
+        allowed_values = self.__compile_hint(hint, depth)
+        if not validators:
+            return allowed_values
+        check = accept_any if allowed_values is None else compile_check(allowed_values)
+
+        def check_annotated(value):
+            return check(value) and all(validator(value) for validator in validators)
+        return [Validator(check_annotated)]
+
+    def __compile_element(self, hint, depth):
+        allowed_values = self.__compile_hint(hint, depth)
+        if allowed_values is None:
+            return accept_any
+        return compile_check(allowed_values)
+
+    def __compile_generic(self, origin, hint_args, depth):  # noqa: C901
+        """Returns the type or the validator, which checks the container and its
+        elements.
+        """
+        if not hint_args or depth == 0 or not issubclass(origin, Iterable) or \
+                issubclass(origin, Iterator):
+            return origin
+        depth = None if depth is None else depth - 1
+        checks = tuple(self.__compile_element(hint, depth) for hint in hint_args)
+        if all(check is accept_any for check in checks) and \
+                not (issubclass(origin, tuple) and Ellipsis not in hint_args):
+            return origin
+        sample = self.__sample
+        if issubclass(origin, Mapping):
+            key_check = checks[0]
+            # Some mappings, e.g. "Counter[str]", have the type of the keys only.
+            value_check = checks[1] if len(checks) > 1 else accept_any
+
+            def check_container(value):
+                if not isinstance(value, origin):
+                    return False
+                return all(
+                    key_check(key) and value_check(val)
+                    for key, val in sample(value.items())
+                )
+        elif issubclass(origin, tuple) and Ellipsis not in hint_args:
+            # Tuples of the fixed length, "Tuple[()]" is the empty tuple.
+            if hint_args == (tuple(), ):
+                checks = tuple()
+
+            def check_container(value):
+                if not isinstance(value, origin) or len(value) != len(checks):
+                    return False
+                return all(check(val) for check, val in zip(checks, value))
+        else:
+            element_check = checks[0]
+
+            def check_container(value):
+                if not isinstance(value, origin):
+                    return False
+                if isinstance(value, Iterator) or not isinstance(value, Sized):
+                    # The elements can't be validated without consuming them.
+                    return True
+                return all(map(element_check, sample(value)))
+        return Validator(check_container)
+
+    def __sample(self, values):
+        """Returns the elements of the sized collection, which have to be validated.
+        """
+        sample_size = self.sample_size
+        if sample_size is None or len(values) <= sample_size:
+            return values
+        if isinstance(values, Sequence):
+            step = len(values) / sample_size
+            return [values[int(num * step)] for num in range(sample_size)]
+        return islice(values, sample_size)
+
+
+validate = Validate()
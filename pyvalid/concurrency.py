@@ -0,0 +1,126 @@
+"""This module runs the heavy validators in the executor, so the expensive validation
+(e.g. the scan of a huge tensor or of the list with millions of elements) doesn't
+block the event loop, when the arguments or the result of the coroutine function are
+validated.
+
+A validator is marked as heavy with the ``heavy`` option of the built-in validators
+or with the ``heavy`` attribute of the custom ones. The wrappers of the coroutine
+functions and asynchronous generator functions check the allowed types, values and
+the other validators inline first, and only if they don't match the value, the heavy
+validators are run in the executor. The wrappers of the regular functions always run
+the validators inline.
+
+Example:
+
+.. code-block:: python
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from pyvalid import accepts, concurrency
+    from pyvalid.validators import IterableValidator
+
+
+    @accepts(IterableValidator(elements_type=float, heavy=True))
+    async def mean(values):
+        return sum(values) / len(values)
+
+
+    concurrency.set_executor(ProcessPoolExecutor())
+    # Validate the arguments, while the coroutine is running.
+    concurrency.set_parallel(True)
+
+By default, the heavy validators are run in the default executor of the event loop,
+and the coroutine starts after the arguments get validated. In the parallel mode the
+heavy validators of the arguments are run in parallel with the coroutine, and their
+results are joined before the result of the coroutine is returned. The process pools
+require the validators and the validated values to be picklable.
+
+The executor and the mode are read on each call, so they can be set at any time.
+"""
+from pyvalid.__checks import is_validator_instance
+
+
+#: Executor, which runs the heavy validators. ``None`` means the default executor of
+#: the event loop.
+executor = None
+
+#: Whether the heavy validators of the arguments are run in parallel with the
+#: coroutine.
+parallel = False
+
+
+def set_executor(new_executor):
+    """Sets the executor, which runs the heavy validators.
+
+    Args:
+        new_executor (concurrent.futures.Executor):
+            ``ThreadPoolExecutor``, ``ProcessPoolExecutor`` or ``None`` to use the
+            default executor of the event loop.
+    """
+    global executor
+    executor = new_executor
+
+
+def get_executor():
+    """Returns the executor, which runs the heavy validators, or ``None``.
+    """
+    return executor
+
+
+def set_parallel(enabled):
+    """Turns the parallel validation of the arguments on or off.
+
+    Args:
+        enabled (bool):
+            If set to ``True``, the coroutine doesn't wait for the heavy validators of
+            its arguments.
+    """
+    global parallel
+    parallel = bool(enabled)
+
+
+def is_heavy(allowed_val):
+    """Returns ``True`` if the given allowed value is the heavy validator.
+    """
+    return is_validator_instance(allowed_val) and \
+        getattr(allowed_val, 'heavy', False) is True
+
+
+def split_heavy(allowed_values):
+    """Splits the allowed types, values and validators into the ones checked inline
+    and the heavy validators.
+
+    Returns (tuple):
+        The list of the inline allowed values and the tuple of the heavy validators.
+    """
+    inline_values = [
+        allowed_val for allowed_val in allowed_values if not is_heavy(allowed_val)
+    ]
+    heavy_validators = tuple(
+        allowed_val for allowed_val in allowed_values if is_heavy(allowed_val)
+    )
+    return inline_values, heavy_validators
+
+
+def run_validators(validators, value):
+    """Returns ``True`` if any of the validators accepts the value. It's called in the
+    executor.
+    """
+    return any(validator(value) for validator in validators)
+
+
+def submit(validators, value):
+    """Runs the validators in the executor.
+
+    Args:
+        validators (tuple):
+            Heavy validators.
+        value (object):
+            Value to validate.
+
+    Returns (asyncio.Future):
+        The future of the result of the ``run_validators`` function.
+    """
+    import asyncio
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(executor, run_validators, validators, value)
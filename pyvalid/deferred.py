@@ -0,0 +1,292 @@
+"""This module validates the return values in the background, so the heavy checks of
+the return values don't add latency to the calls of the latency-critical functions.
+
+The deferred mode is turned on with the ``deferred`` option of the
+``pyvalid.returns`` decorator. The wrapper hands the return value back to the caller
+immediately and submits its validation to the executor of this module. The failures
+can't be raised to the caller anymore, so they are passed to the sink:
+
+* ``LogSink`` logs them with the ``logging`` module (the default sink);
+* ``RaiseOnNextCall`` raises the failure on the next call of the decorated function;
+* any other callable, which accepts the exception, e.g. the metrics callback.
+
+Example:
+
+.. code-block:: python
+
+    from pyvalid import deferred, returns
+    from pyvalid.validators import IterableValidator
+
+
+    @returns(IterableValidator(elements_type=float, min_val=0), deferred=True)
+    def predict(features):
+        return model.predict(features)
+
+
+    @returns(dict, deferred=True, sink=deferred.RaiseOnNextCall())
+    def handle(request):
+        return process(request)
+
+
+    @returns(int, deferred=True, sink=lambda error: metrics.increment('invalid'))
+    def count(items):
+        return len(items)
+
+By default, the return values are validated by a single background thread, created on
+the first use, so the validators don't need to be thread-safe. The return values are
+validated after the caller got them, so they must not be modified by the caller.
+
+The number of the return values waiting for the validation is limited by the
+``max_pending`` attribute, so the memory doesn't grow without bounds when the
+validation can't keep up with the calls. The return values beyond the limit are not
+validated, they are counted by the ``get_dropped`` function.
+"""
+from abc import ABCMeta, abstractmethod
+from threading import Condition, Lock
+
+from six import with_metaclass
+
+from pyvalid.__exceptions import PyvalidError
+
+
+class Sink(with_metaclass(ABCMeta, object)):
+    """The base class of the sinks, which receive the failures of the deferred
+    validation. Subclasses implement the ``__call__`` method, which accepts the
+    ``pyvalid.InvalidReturnTypeError`` exception or the exception raised by the
+    validator. It's called by the background thread.
+    """
+
+    #: Whether the wrapper has to call the ``raise_pending`` method before each call
+    #: of the decorated function.
+    raises = False
+
+    @abstractmethod
+    def __call__(self, error):
+        raise NotImplementedError
+
+    def raise_pending(self):
+        """Raises the failure received since the previous call, if any.
+        """
+        pass
+
+
+class LogSink(Sink):
+    """Sink, which logs the failures. Tracebacks are logged for the exceptions raised
+    by the validators only.
+
+    Args:
+        logger (logging.Logger):
+            Logger. The ``pyvalid`` logger is used by default.
+        level (int):
+            Logging level, ``logging.ERROR`` by default.
+    """
+
+    def __init__(self, logger=None, level=None):
+        # The "logging" module is imported by the sinks only, so "import pyvalid"
+        # stays fast.
+        import logging
+        self.logger = logging.getLogger('pyvalid') if logger is None else logger
+        self.level = logging.ERROR if level is None else level
+
+    def __call__(self, error):
+        self.logger.log(
+            self.level, 'Deferred validation failed: %s', error,
+            exc_info=None if isinstance(error, PyvalidError) else error
+        )
+
+
+class RaiseOnNextCall(Sink):
+    """Sink, which keeps the first failure and raises it on the next call of the
+    decorated function. The sink shared by several functions raises the failure on the
+    next call of any of them. The failures received before the kept one is raised are
+    counted by the ``dropped`` attribute.
+    """
+
+    raises = True
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__error = None
+        self.dropped = 0
+
+    def __call__(self, error):
+        with self.__lock:
+            if self.__error is None:
+                self.__error = error
+            else:
+                self.dropped += 1
+
+    def raise_pending(self):
+        # The pending failure is read without the lock, so the calls without the
+        # failures don't pay for it.
+        if self.__error is None:
+            return
+        with self.__lock:
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+
+class CallbackSink(Sink):
+    """Sink, which passes the failures to the given function.
+
+    Args:
+        callback (function):
+            Function, which accepts the exception.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def __call__(self, error):
+        self.callback(error)
+
+
+#: Executor, which validates the return values. ``None`` means the single background
+#: thread created on the first use.
+executor = None
+
+#: Maximum number of the submitted validations, which are not finished yet. The return
+#: values submitted when the limit is reached are dropped. ``None`` means no limit.
+max_pending = 10000
+
+__default_executor = None
+__default_executor_lock = Lock()
+
+# Number of the submitted validations, which are not finished yet, and the number of
+# the dropped ones.
+__pending = 0
+__dropped = 0
+__pending_condition = Condition(Lock())
+
+
+def set_executor(new_executor):
+    """Sets the executor, which validates the return values.
+
+    Args:
+        new_executor (concurrent.futures.Executor):
+            ``ThreadPoolExecutor`` or ``None`` to use the single background thread.
+    """
+    global executor
+    executor = new_executor
+
+
+def get_executor():
+    """Returns the executor, which validates the return values, or ``None``.
+    """
+    return executor
+
+
+def set_max_pending(limit):
+    """Sets the maximum number of the return values waiting for the validation.
+
+    Args:
+        limit (int):
+            Maximum number of the return values or ``None`` to remove the limit.
+    """
+    global max_pending
+    max_pending = limit
+
+
+def get_dropped():
+    """Returns the number of the return values, which weren't validated, because the
+    limit of the pending validations was reached.
+    """
+    return __dropped
+
+
+def get_sink(sink):
+    """Returns the given sink, the ``CallbackSink`` of the given function or the
+    ``LogSink``, if the sink is not set.
+    """
+    if sink is None:
+        return LogSink()
+    if isinstance(sink, Sink):
+        return sink
+    if not callable(sink):
+        raise TypeError('Sink must be callable!')
+    return CallbackSink(sink)
+
+
+def __get_default_executor():
+    global __default_executor
+    with __default_executor_lock:
+        if __default_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            try:
+                __default_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='pyvalid'
+                )
+            except TypeError:
+                # Python < 3.6 doesn't support the "thread_name_prefix" argument.
+                __default_executor = ThreadPoolExecutor(max_workers=1)
+        return __default_executor
+
+
+def __finish(_):
+    global __pending
+    with __pending_condition:
+        __pending -= 1
+        if __pending == 0:
+            __pending_condition.notify_all()
+
+
+def __validate(check, returns_val, create_exception, sink):
+    try:
+        if check(returns_val):
+            return
+        error = create_exception()
+    except Exception as exc:  # noqa: B902
+        error = exc
+    sink(error)
+
+
+def submit(check, returns_val, create_exception, sink):
+    """Validates the return value in the background.
+
+    Args:
+        check (function):
+            Compiled check of the allowed return values.
+        returns_val (object):
+            Return value.
+        create_exception (function):
+            Factory of the exception, which is passed to the sink, if the return value
+            is invalid.
+        sink (pyvalid.deferred.Sink):
+            Sink of the failures.
+
+    Returns (bool):
+        ``False`` if the return value was dropped, because the limit of the pending
+        validations was reached.
+    """
+    global __pending, __dropped
+    pool = executor
+    if pool is None:
+        pool = __get_default_executor()
+    with __pending_condition:
+        if max_pending is not None and __pending >= max_pending:
+            __dropped += 1
+            return False
+        __pending += 1
+    try:
+        future = pool.submit(__validate, check, returns_val, create_exception, sink)
+    except BaseException:
+        __finish(None)
+        raise
+    future.add_done_callback(__finish)
+    return True
+
+
+def wait(timeout=None):
+    """Waits until all the submitted return values get validated, e.g. before the
+    program exits or in the tests.
+
+    Args:
+        timeout (float):
+            Maximum number of seconds to wait or ``None`` to wait without the limit.
+
+    Returns (bool):
+        ``False`` if the timeout expired.
+    """
+    with __pending_condition:
+        return __pending_condition.wait_for(lambda: __pending == 0, timeout)
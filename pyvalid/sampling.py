@@ -0,0 +1,156 @@
+"""This module provides sampling policies, which allow to validate only a fraction of
+calls of hot functions instead of turning the validation off completely.
+
+A sampler is attached to a single decorator with the ``sampled`` constructor of the
+``pyvalid.accepts`` and ``pyvalid.returns`` decorators, or to all the decorators at
+once with the ``set_default`` function.
+
+Example:
+
+.. code-block:: python
+
+    from pyvalid import accepts, returns, sampling
+
+
+    # Validate each 100th call.
+    @accepts.sampled(sampling.EveryNth(100), str)
+    def say_hello(name):
+        print('Hello,', name)
+
+
+    # Validate about 1% of calls.
+    @returns.sampled(sampling.Probabilistic(0.01), int, float)
+    def multiply(num_1, num_2):
+        return num_1 * num_2
+
+
+    # Validate each 10th call of the functions without their own samplers.
+    sampling.set_default(sampling.EveryNth(10))
+
+The sampler is bound to the wrapper, when the function gets decorated. So the
+``set_default`` function has to be called before the functions get decorated (e.g. at
+the very beginning of the program), and the wrappers without samplers don't pay for
+the sampling at all.
+
+Samplers count the checked, skipped and failed calls. The sampling decision and the
+counters don't take any locks, so the counters of the sampler shared by several
+threads are approximate.
+"""
+from abc import ABCMeta, abstractmethod
+from random import random
+
+from six import with_metaclass
+
+
+class Sampler(with_metaclass(ABCMeta, object)):
+    """The base class of the sampling policies. Subclasses implement the ``__call__``
+    method, which is called by the wrapper on each call of the decorated function and
+    returns ``True`` if the call has to be validated. The method has to update the
+    ``checked`` and ``skipped`` counters.
+
+    Attributes:
+        checked (int):
+            Number of the validated calls.
+        skipped (int):
+            Number of the calls, which were not validated.
+        failed (int):
+            Number of the validated calls, which raised the pyvalid's exceptions.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    @abstractmethod
+    def __call__(self):
+        raise NotImplementedError
+
+    def reset(self):
+        """Resets all the counters.
+        """
+        self.checked = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def stats(self):
+        """Returns the snapshot of the counters.
+
+        Returns (dict):
+            Numbers of the ``checked``, ``skipped`` and ``failed`` calls.
+        """
+        return dict(checked=self.checked, skipped=self.skipped, failed=self.failed)
+
+    def counting(self, exception_type):
+        """Returns the factory of the given pyvalid's exceptions, which increments the
+        ``failed`` counter. It's used by the wrappers instead of the exception class.
+        """
+        def create_exception(*args, **kwargs):
+            self.failed += 1
+            return exception_type(*args, **kwargs)
+        return create_exception
+
+
+class EveryNth(Sampler):
+    """Deterministic sampler, which validates the first call and then each ``n``-th
+    call.
+
+    Args:
+        n (int):
+            Sampling interval.
+    """
+
+    def __init__(self, n):
+        if not isinstance(n, int) or n < 1:
+            raise ValueError('Sampling interval must be a positive integer!')
+        self.n = n
+        Sampler.__init__(self)
+
+    def __call__(self):
+        if (self.checked + self.skipped) % self.n == 0:
+            self.checked += 1
+            return True
+        self.skipped += 1
+        return False
+
+
+class Probabilistic(Sampler):
+    """Sampler, which validates each call with the given probability.
+
+    Args:
+        rate (float):
+            Probability of the validation, from 0 to 1.
+    """
+
+    def __init__(self, rate):
+        if not 0 <= rate <= 1:
+            raise ValueError('Sampling rate must be between 0 and 1!')
+        self.rate = rate
+        Sampler.__init__(self)
+
+    def __call__(self):
+        if random() < self.rate:
+            self.checked += 1
+            return True
+        self.skipped += 1
+        return False
+
+
+#: Sampler used by the decorators without their own samplers.
+default_sampler = None
+
+
+def set_default(sampler):
+    """Sets the sampler used by the functions decorated afterwards, which don't have
+    their own samplers. Pass ``None`` to validate all the calls again.
+
+    Args:
+        sampler (pyvalid.sampling.Sampler):
+            Sampling policy or ``None``.
+    """
+    global default_sampler
+    default_sampler = sampler
+
+
+def get_default():
+    """Returns the default sampler or ``None``.
+    """
+    return default_sampler
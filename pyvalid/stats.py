@@ -0,0 +1,424 @@
+"""This module collects the statistics of the validation: the number of calls and
+failures of the decorated functions and validators, the failures per argument, the
+total time spent on the validation and its percentiles, and the time spent by each
+checker of the validators.
+
+The statistics are collected only for the functions decorated and the validators
+created after the ``enable`` call (e.g. at the very beginning of the program), so the
+other functions and validators don't pay for it at all. The same can be achieved
+without any code changes, by setting the ``PYVALID_STATS`` environment variable to
+``on`` before pyvalid gets imported.
+
+Example:
+
+.. code-block:: python
+
+    from pyvalid import accepts, stats
+
+
+    stats.enable()
+
+
+    @accepts(str)
+    def say_hello(name):
+        print('Hello,', name)
+
+
+    say_hello('pyvalid')
+    stats.snapshot()
+    # Returns the dictionary with the statistics of the functions and validators.
+
+    # Feed the monitoring system on each validated call.
+    stats.add_hook(
+        lambda event: statsd.timing('pyvalid.' + event.name, event.seconds * 1000)
+    )
+
+The time of the validation doesn't include the time of the decorated function: the
+``pyvalid.accepts`` decorator measures the time until the function is called, and the
+``pyvalid.returns`` decorator measures the time after it returned. The wrappers of the
+coroutine functions measure the inline checks only, the checks run in the executors
+are not measured, as well as the deferred validation of the return values, whose
+failures are passed to the sinks only. Percentiles are computed over the last
+``window`` calls.
+
+Validators count the calls, which passed their ``allowed_types`` check, and the calls
+answered by their caches are not counted. The statistics of the validators are released
+along with the validators.
+"""
+from collections import deque, namedtuple
+from os import environ
+from threading import Lock, local
+from time import perf_counter
+import warnings
+from weakref import WeakValueDictionary
+
+from pyvalid.__exceptions import ArgumentValidationError, InvalidReturnTypeError, \
+    PyvalidError
+
+
+#: Whether the functions decorated and the validators created from now on collect the
+#: statistics.
+enabled = False
+
+#: Number of the last calls, whose durations are used for the percentiles.
+window = 1024
+
+#: Percentiles included into the snapshots.
+percentiles = (50, 90, 99)
+
+#: The event passed to the hooks after each validated call: the kind of the
+#: statistics (``accepts``, ``returns`` or ``validator``), the name of the function or
+#: validator, the seconds spent on the validation and the key of the failure
+#: (the name or ordinal number of the argument, ``return`` or ``value``) or ``None``.
+Event = namedtuple('Event', ('kind', 'name', 'seconds', 'failure'))
+
+_hooks = tuple()
+_registry = dict()
+# Statistics of the validators by their names. They are referenced by the validators
+# only, so the registry doesn't keep them alive.
+_validators = WeakValueDictionary()
+_registry_lock = Lock()
+
+
+def enable():
+    """Enables the statistics of the functions decorated and the validators created
+    after this call.
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Disables the statistics of the functions decorated and the validators created
+    after this call. The statistics of the others are still collected.
+    """
+    global enabled
+    enabled = False
+
+
+def is_enabled():
+    """Returns ``True`` if the statistics are enabled, otherwise returns ``False``.
+    """
+    return enabled
+
+
+def add_hook(hook):
+    """Adds the function, which is called with the ``pyvalid.stats.Event`` after each
+    validated call. Hooks are called by the threads, which validate the values, so
+    they have to be thread-safe and fast.
+    """
+    global _hooks
+    with _registry_lock:
+        _hooks = _hooks + (hook, )
+
+
+def remove_hook(hook):
+    """Removes the hook added by the ``add_hook`` function.
+    """
+    global _hooks
+    with _registry_lock:
+        _hooks = tuple(added for added in _hooks if added is not hook)
+
+
+def snapshot():
+    """Returns the snapshot of the statistics.
+
+    Returns (dict):
+        The dictionary with two items: the ``functions`` — the dictionary of the
+        statistics of the decorated functions by their names and the kinds of the
+        decorators (``accepts`` or ``returns``), and the ``validators`` — the
+        dictionary of the statistics of the validators by their names. See the
+        ``Stats.snapshot`` method.
+    """
+    with _registry_lock:
+        registry = list(_registry.items())
+        validators = list(_validators.items())
+    result = dict(functions=dict(), validators=dict())
+    for (kind, name), stats in registry:
+        result['functions'].setdefault(name, dict())[kind] = stats.snapshot()
+    for name, stats in validators:
+        result['validators'][name] = stats.snapshot()
+    return result
+
+
+def reset():
+    """Resets the statistics of all the functions and validators.
+    """
+    with _registry_lock:
+        registry = list(_registry.values()) + list(_validators.values())
+    for stats in registry:
+        stats.reset()
+
+
+def register(stats_type, kind, name):
+    """Returns the statistics of the given kind and name. The functions with the same
+    names (e.g. redefined ones) share the statistics.
+    """
+    key = (kind, name)
+    with _registry_lock:
+        stats = _registry.get(key)
+        if stats is None:
+            stats = _registry[key] = stats_type(kind, name)
+    return stats
+
+
+def function_name(func):
+    return '{}.{}'.format(
+        getattr(func, '__module__', None),
+        getattr(func, '__qualname__', getattr(func, '__name__', repr(func)))
+    )
+
+
+def failure_key(error):
+    """Returns the key of the failure: the name or the ordinal number of the invalid
+    argument, ``arguments`` if the number of the arguments is invalid, or ``return``.
+    """
+    if isinstance(error, InvalidReturnTypeError):
+        return 'return'
+    if isinstance(error, ArgumentValidationError):
+        return error.arg_name or error.arg_num
+    return 'arguments'
+
+
+class Stats(object):
+    """The statistics of a decorated function or a validator.
+
+    Attributes:
+        kind (str):
+            ``accepts``, ``returns`` or ``validator``.
+        name (str):
+            Name of the function or the validator.
+    """
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """Resets all the counters.
+        """
+        with self._lock:
+            self._calls = 0
+            self._seconds = 0.0
+            self._failures = dict()
+            self._durations = deque(maxlen=window)
+
+    def record(self, seconds, failure=None):
+        """Records the validated call and passes it to the hooks.
+
+        Args:
+            seconds (float):
+                Time of the validation.
+            failure (str):
+                Key of the failure or ``None``.
+        """
+        with self._lock:
+            self._calls += 1
+            self._seconds += seconds
+            self._durations.append(seconds)
+            if failure is not None:
+                self._failures[failure] = self._failures.get(failure, 0) + 1
+        if _hooks:
+            event = Event(self.kind, self.name, seconds, failure)
+            for hook in _hooks:
+                hook(event)
+
+    def snapshot(self):
+        """Returns the snapshot of the counters.
+
+        Returns (dict):
+            The number of the ``calls`` and ``failures``, the ``failures_by_key``
+            (the numbers of the failures by the arguments for the functions), the
+            total ``seconds`` and the ``percentiles`` of the seconds.
+        """
+        with self._lock:
+            calls = self._calls
+            seconds = self._seconds
+            failures = dict(self._failures)
+            durations = sorted(self._durations)
+        result = dict(
+            calls=calls, failures=sum(failures.values()), failures_by_key=failures,
+            seconds=seconds, percentiles=dict()
+        )
+        if durations:
+            for percentile in percentiles:
+                index = min(len(durations) - 1, len(durations) * percentile // 100)
+                result['percentiles'][percentile] = durations[index]
+        return result
+
+
+class FunctionStats(Stats):
+    """The statistics of a function decorated by ``pyvalid.accepts`` or
+    ``pyvalid.returns``. The decorator calls the function through the ``call``
+    method, so the time of the validation is measured without the time of the
+    function, and the wrapper is instrumented by the ``wrap`` method.
+    """
+
+    def __init__(self, kind, name):
+        Stats.__init__(self, kind, name)
+        self.__local = local()
+
+    def __marks(self):
+        marks = getattr(self.__local, 'marks', None)
+        if marks is None:
+            marks = self.__local.marks = list()
+        return marks
+
+    def call(self, func):
+        """Returns the function, which calls the given one and marks the time, when it
+        was called by the ``pyvalid.accepts`` wrapper or when it returned to the
+        ``pyvalid.returns`` wrapper.
+        """
+        marks = self.__marks
+        if self.kind == 'accepts':
+            def marked_call(*func_args, **func_kwargs):
+                marks()[-1] = perf_counter()
+                return func(*func_args, **func_kwargs)
+        else:
+            def marked_call(*func_args, **func_kwargs):
+                returns_val = func(*func_args, **func_kwargs)
+                marks()[-1] = perf_counter()
+                return returns_val
+        return marked_call
+
+    def wrap(self, wrapper):
+        """Returns the function, which calls the wrapper and records the time of the
+        validation and its failure.
+        """
+        get_marks = self.__marks
+        record = self.record
+        is_accepts = self.kind == 'accepts'
+
+        def instrumented_wrapper(*func_args, **func_kwargs):
+            marks = get_marks()
+            marks.append(None)
+            failure = None
+            start = perf_counter()
+            try:
+                return wrapper(*func_args, **func_kwargs)
+            except PyvalidError as exc:
+                # Errors raised by the function itself are not the failures.
+                if (marks[-1] is None) == is_accepts:
+                    failure = failure_key(exc)
+                raise
+            finally:
+                end = perf_counter()
+                mark = marks.pop()
+                if is_accepts:
+                    record((end if mark is None else mark) - start, failure)
+                elif mark is not None:
+                    record(end - mark, failure)
+        return instrumented_wrapper
+
+    def wrap_check(self, check):
+        """Returns the function, which calls the check of the asynchronous wrapper and
+        records the time of the check and its failure.
+        """
+        record = self.record
+
+        def instrumented_check(*args):
+            failure = None
+            start = perf_counter()
+            try:
+                return check(*args)
+            except PyvalidError as exc:
+                failure = failure_key(exc)
+                raise
+            finally:
+                record(perf_counter() - start, failure)
+        return instrumented_check
+
+    def snapshot(self):
+        result = Stats.snapshot(self)
+        result['failures_by_argument'] = result.pop('failures_by_key')
+        return result
+
+
+class ValidatorStats(Stats):
+    """The statistics of a validator, including the time spent by each checker.
+    """
+
+    def reset(self):
+        Stats.reset(self)
+        with self._lock:
+            checkers = getattr(self, '_checkers', dict())
+            for counters in checkers.values():
+                counters[:] = [0, 0, 0.0]
+            self._checkers = checkers
+
+    def wrap_checker(self, name, check):
+        """Returns the compiled checker, which records its calls, rejections and
+        time.
+        """
+        with self._lock:
+            counters = self._checkers.setdefault(name, [0, 0, 0.0])
+        lock = self._lock
+
+        def instrumented_checker(val):
+            start = perf_counter()
+            is_passed = check(val)
+            elapsed = perf_counter() - start
+            with lock:
+                counters[0] += 1
+                counters[2] += elapsed
+                if not is_passed:
+                    counters[1] += 1
+            return is_passed
+        return instrumented_checker
+
+    def wrap_check(self, check):
+        """Returns the function, which calls the whole pipeline of the validator and
+        records its time and result.
+        """
+        record = self.record
+
+        def instrumented_check(val):
+            start = perf_counter()
+            is_valid = check(val)
+            record(perf_counter() - start, None if is_valid else 'value')
+            return is_valid
+        return instrumented_check
+
+    def snapshot(self):
+        result = Stats.snapshot(self)
+        del result['failures_by_key']
+        with self._lock:
+            result['checkers'] = dict(
+                (name, dict(calls=calls, rejections=rejections, seconds=seconds))
+                for name, (calls, rejections, seconds) in self._checkers.items()
+            )
+        return result
+
+
+_validators_counts = dict()
+
+
+def validator_stats(validator):
+    """Registers the statistics of the new validator. Validators are named by their
+    types and the numbers, e.g. ``StringValidator#2``. The registry holds the
+    statistics through the weak reference, so they are released along with the
+    validator, and the unpickled or copied validators get their own statistics.
+    """
+    type_name = type(validator).__name__
+    with _registry_lock:
+        number = _validators_counts.get(type_name, 0) + 1
+        _validators_counts[type_name] = number
+        name = '{}#{}'.format(type_name, number)
+        stats = _validators[name] = ValidatorStats('validator', name)
+    return stats
+
+
+def __apply_environment():
+    mode = environ.get('PYVALID_STATS', 'off').strip().lower()
+    if mode == 'on':
+        enable()
+    elif mode != 'off':
+        warnings.warn(
+            'Invalid value of the PYVALID_STATS environment variable: "{}". '
+            'Expected values are: "on", "off".'.format(mode)
+        )
+
+
+__apply_environment()
@@ -34,27 +34,82 @@ Example:
     switch.turn_on()
     # And now the pyvalid's validation is enabled back
 
+Functions decorated by pyvalid check the state of the switch with a single attribute
+lookup, but the call still goes through the wrapper. To get rid of the wrappers
+completely, the validation system can be turned off with the ``strip=True`` flag
+before the functions get decorated (e.g. at the very beginning of the program). In this
+mode ``pyvalid.accepts`` and ``pyvalid.returns`` return the decorated functions
+unchanged, so they cost nothing.
+
+The same can be achieved without any code changes, by setting the ``PYVALID_MODE``
+environment variable before pyvalid gets imported:
+
+* ``PYVALID_MODE=on`` — the validation is enabled (default);
+* ``PYVALID_MODE=off`` — the validation is disabled, but it can be enabled back with
+  the ``pyvalid.switch.turn_on()`` call;
+* ``PYVALID_MODE=strip`` — the validation is disabled and pyvalid's decorators return
+  functions unchanged.
+
 """
+from os import environ
+import warnings
+
+
+#: Whether the validation is performed. Wrappers generated by pyvalid read this flag on
+#: every call, so use the ``turn_on`` and ``turn_off`` functions to change it.
+pyvalid_enabled = True
+
+#: Whether pyvalid's decorators return functions unchanged.
+pyvalid_stripped = False
 
 
 def turn_on():
-    """Enables the pyvalid's validation system.
+    """Enables the pyvalid's validation system. Functions decorated in the "strip" mode
+    remain unchanged, but functions decorated from now on will be validated again.
     """
     globals()['pyvalid_enabled'] = True
+    globals()['pyvalid_stripped'] = False
 
 
-def turn_off():
+def turn_off(strip=False):
     """Disables the pyvalid's validation system.
+
+    Args:
+        strip (bool):
+            If set to ``True``, functions decorated after this call are returned by
+            pyvalid's decorators unchanged, so they won't be validated even if the
+            validation system gets enabled back.
     """
     globals()['pyvalid_enabled'] = False
+    if strip:
+        globals()['pyvalid_stripped'] = True
 
 
 def is_enabled():
     """Returns ``True`` if the pyvalid's validation system is enabled otherwise returns
     ``False`` value.
     """
-    if 'pyvalid_enabled' in globals():
-        enabled = globals()['pyvalid_enabled']
-    else:
-        enabled = True
-    return enabled
+    return pyvalid_enabled
+
+
+def is_stripped():
+    """Returns ``True`` if pyvalid's decorators return functions unchanged, otherwise
+    returns ``False`` value.
+    """
+    return pyvalid_stripped
+
+
+def __apply_environment():
+    mode = environ.get('PYVALID_MODE', 'on').strip().lower()
+    if mode == 'off':
+        turn_off()
+    elif mode == 'strip':
+        turn_off(strip=True)
+    elif mode != 'on':
+        warnings.warn(
+            'Invalid value of the PYVALID_MODE environment variable: "{}". '
+            'Expected values are: "on", "off", "strip".'.format(mode)
+        )
+
+
+__apply_environment()
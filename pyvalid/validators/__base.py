@@ -1,4 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
+import sys
+from time import perf_counter
 try:
     from collections.abc import Callable
 except ImportError:
@@ -6,11 +9,15 @@ except ImportError:
 
 from six import with_metaclass
 
-from pyvalid import accepts
+from pyvalid import accepts, stats
 
 
 class Validator(Callable):
 
+    #: Whether the validator is expensive, so the asynchronous wrappers run it in the
+    #: executor of the ``pyvalid.concurrency`` module instead of the event loop.
+    heavy = False
+
     @accepts(object, Callable)
     def __init__(self, func):
         self.__func = func
@@ -20,6 +27,75 @@ class Validator(Callable):
 
 
 class AbstractValidator(with_metaclass(ABCMeta, Validator)):
+    """The base class of the validators, which consist of several checkers.
+
+    Subclasses define the ``checkers`` property — the dictionary of the checkers
+    (usually classmethods, which accept the value and the checker's arguments) and
+    their arguments. Checkers, whose first argument is ``None``, are not used.
+
+    The checkers are compiled once, when the validator is created, into the pipeline:
+    the tuple of functions, which accept the value only. The pipeline is ordered by the
+    costs of the checkers (see the ``checker_costs`` attribute), so the cheap checkers,
+    such as type or length checks, reject invalid values before the expensive ones,
+    such as regular expressions or scans of the iterables. Checkers of the same cost
+    keep the order of the ``checkers`` dictionary. Checkers of zero cost are guards,
+    which must run before the others (e.g. to reject values, which other checkers
+    can't handle).
+
+    Validators accept the following options of the pipeline:
+
+    * ``checker_costs`` — the dictionary of the costs by the checkers' names, which
+      overrides the class's costs, so the order of the checkers stays deterministic;
+    * ``adaptive`` — if set to ``True``, the validator profiles the checkers during
+      the first ``adaptive_window`` calls and then periodically, after each
+      ``adaptive_interval`` calls. The checkers, except guards, are reordered by the
+      average time spent per rejected value, so the checkers, which reject most of the
+      values cheaply, are called first. See the ``checker_stats`` method.
+
+    * ``cache_size`` — if set, the results are memoized in the LRU cache of the given
+      size. Values are cached by their types and values, so e.g. ``1`` and ``True``
+      are cached separately. Unhashable values are never cached. See the
+      ``cache_info`` and ``cache_clear`` methods.
+
+    * ``heavy`` — if set to ``True``, the validator is run in the executor, when it
+      validates the arguments or the result of the coroutine function. See the
+      ``pyvalid.concurrency`` module.
+
+    The options are validated and applied by this class, so subclasses pass all their
+    keyword arguments to the ``AbstractValidator.__init__`` method along with the
+    ``allowed_types``.
+
+    The cache is allowed for the pure validators only (see the ``pure`` attribute):
+    their results depend on the validated value only and they have no side effects.
+    ``NumberValidator`` and ``StringValidator`` are pure. ``IterableValidator`` isn't,
+    since it may emit warnings, as well as ``TensorValidator``, since tensors are
+    mutable, but hashable by their identities.
+
+    Example:
+
+    .. code-block:: python
+
+        # Most of the values are too long, so the length is checked first.
+        validator = StringValidator(max_len=64, re_pattern=r'[a-z]+$', adaptive=True)
+
+        # Statuses repeat, so the results are cached.
+        validator = StringValidator(re_pattern=r'[A-Z_]+$', cache_size=1024)
+    """
+
+    #: Whether the result depends on the validated value only, so it can be cached.
+    pure = False
+
+    #: Relative costs of the checkers by their names. Cheaper checkers are called first.
+    checker_costs = dict()
+
+    #: Cost of the checkers, which are missing in the ``checker_costs`` dictionary.
+    default_checker_cost = 10
+
+    #: Number of calls profiled at once by the adaptive validators.
+    adaptive_window = 1000
+
+    #: Number of calls between the profiling windows of the adaptive validators.
+    adaptive_interval = 100000
 
     @property
     @abstractmethod
@@ -27,26 +103,327 @@ class AbstractValidator(with_metaclass(ABCMeta, Validator)):
         raise NotImplementedError
 
     def __call__(self, val):
+        if self.__cache is not None:
+            try:
+                return self.__cache(val)
+            except TypeError:
+                # Unhashable value.
+                pass
         is_valid = False
         if self.allowed_types is None or isinstance(val, self.allowed_types):
             is_valid = self._check(val)
         return is_valid
 
+    @accepts(
+        object, checker_costs=[dict, None], adaptive=bool, cache_size=[int, None],
+        heavy=[bool, None]
+    )
     def __init__(self, **kwargs):
         self.allowed_types = kwargs.get('allowed_types', None)
         Validator.__init__(self, self)
-        for checker_func, checker_args in list(self.checkers.items()):
+        self.__active_checkers = dict()
+        for checker_func, checker_args in self.checkers.items():
             try:
-                to_del = checker_args[0] is None
+                is_active = checker_args[0] is not None
             except (IndexError, TypeError):
-                to_del = True
-            if to_del:
-                del self.checkers[checker_func]
+                is_active = False
+            if is_active:
+                self.__active_checkers[checker_func] = tuple(checker_args)
+        self.__costs = dict(self.checker_costs)
+        self.__costs.update(kwargs.get('checker_costs', None) or dict())
+        self.__adaptive = kwargs.get('adaptive', False)
+        cache_size = kwargs.get('cache_size', None)
+        if cache_size is not None:
+            if not self.pure:
+                raise ValueError(
+                    '{} can\'t be cached, since it\'s not pure!'.format(
+                        type(self).__name__
+                    )
+                )
+            if not isinstance(cache_size, int) or cache_size < 1:
+                raise ValueError('Cache size must be a positive integer!')
+        self.__cache_size = cache_size
+        heavy = kwargs.get('heavy', None)
+        if heavy is not None:
+            self.heavy = heavy
+        self.__compile()
 
-    def _check(self, val):
-        valid = True
-        for checker_func, checker_args in self.checkers.items():
-            valid = checker_func(val, *checker_args)
-            if not valid:
+    def __compile(self):
+        # The statistics are collected by the validators created after the
+        # ``pyvalid.stats.enable`` call only, so the others don't pay for them.
+        self.__instrumentation = None
+        if stats.enabled:
+            self.__instrumentation = stats.validator_stats(self)
+        self.__stages = self.__compile_pipeline()
+        self.__pipeline = tuple(check for _, _, check in self.__stages)
+        self.__stats = None
+        if self.__adaptive:
+            self.__start_profiling()
+        if self.__instrumentation is not None:
+            self._check = self.__instrumentation.wrap_check(self._check)
+        self.__cache = None
+        if self.__cache_size is not None:
+            self.__cache = lru_cache(maxsize=self.__cache_size, typed=True)(
+                self.__call_uncached
+            )
+
+    def __getstate__(self):
+        # The compiled pipeline consists of closures, so it's compiled again, when the
+        # validator is unpickled, e.g. in the worker process.
+        state = self.__dict__.copy()
+        for name in ('_check', '_Validator__func', '_AbstractValidator__stages',
+                     '_AbstractValidator__pipeline', '_AbstractValidator__stats',
+                     '_AbstractValidator__cache', '_AbstractValidator__instrumentation',
+                     '_AbstractValidator__unprofiled_calls',
+                     '_AbstractValidator__profiled_calls'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        Validator.__init__(self, self)
+        self.__compile()
+
+    def __call_uncached(self, val):
+        # The same as the __call__ method, which doesn't call this method to avoid
+        # the extra call for the validators without the cache.
+        is_valid = False
+        if self.allowed_types is None or isinstance(val, self.allowed_types):
+            is_valid = self._check(val)
+        return is_valid
+
+    def cache_info(self):
+        """Returns the statistics of the cache.
+
+        Returns (functools._CacheInfo):
+            The named tuple with the number of ``hits`` and ``misses``, the ``maxsize``
+            and the ``currsize`` of the cache, or ``None`` if the cache is not used.
+        """
+        if self.__cache is None:
+            return None
+        return self.__cache.cache_info()
+
+    def cache_clear(self):
+        """Clears the cache and its statistics.
+        """
+        if self.__cache is not None:
+            self.__cache.cache_clear()
+
+    def __compile_pipeline(self):
+        """Returns the tuple of the stages of the pipeline. Each stage is the tuple of
+        the checker's name, its cost and the compiled checker.
+        """
+        stages = list()
+        for position, (checker_func, checker_args) in \
+                enumerate(self.__active_checkers.items()):
+            name = getattr(checker_func, '__name__', str(position))
+            cost = self.__costs.get(name, self.default_checker_cost)
+            check = self._compile_checker(checker_func, checker_args)
+            if self.__instrumentation is not None:
+                check = self.__instrumentation.wrap_checker(name, check)
+            stages.append((cost, position, (name, cost, check)))
+        stages.sort(key=lambda stage: stage[:2])
+        return tuple(stage for _, _, stage in stages)
+
+    def __start_profiling(self):
+        # Statistics of each checker: number of calls, rejections and the time spent.
+        self.__stats = dict((stage, [0, 0, 0.0]) for stage in self.__stages)
+        self.__unprofiled_calls = 0
+        self.__profiled_calls = self.adaptive_window
+        # Shadows the method, so the non-adaptive validators don't pay for it.
+        self._check = self.__adaptive_check
+
+    def __adaptive_check(self, val):
+        if self.__unprofiled_calls > 0:
+            self.__unprofiled_calls -= 1
+            for check in self.__pipeline:
+                if not check(val):
+                    return False
+            return True
+        return self.__profiled_check(val)
+
+    def __profiled_check(self, val):
+        is_valid = True
+        stats = self.__stats
+        for stage in self.__stages:
+            start = perf_counter()
+            is_passed = stage[2](val)
+            elapsed = perf_counter() - start
+            stage_stats = stats[stage]
+            stage_stats[0] += 1
+            stage_stats[2] += elapsed
+            if not is_passed:
+                stage_stats[1] += 1
+                is_valid = False
                 break
-        return valid
+        self.__profiled_calls -= 1
+        if self.__profiled_calls <= 0:
+            self.__reorder()
+        return is_valid
+
+    def __reorder(self):
+        stats = self.__stats
+
+        def rank(stage):
+            calls, rejections, elapsed = stats[stage]
+            # Checkers, which never reject values, go last.
+            return elapsed / rejections if rejections else float('inf')
+
+        guards = tuple(stage for stage in self.__stages if stage[1] == 0)
+        others = sorted(
+            (stage for stage in self.__stages if stage[1] != 0), key=rank
+        )
+        stages = guards + tuple(others)
+        # Old statistics fade out, so the order follows the changes of the input.
+        for stage_stats in stats.values():
+            stage_stats[:] = [stage_stats[0] / 2, stage_stats[1] / 2, stage_stats[2] / 2]
+        self.__stages = stages
+        self.__pipeline = tuple(check for _, _, check in stages)
+        self.__profiled_calls = self.adaptive_window
+        self.__unprofiled_calls = self.adaptive_interval
+
+    def checker_stats(self):
+        """Returns the statistics collected by the adaptive validator.
+
+        Returns (dict):
+            ``None`` for non-adaptive validators. Otherwise the dictionary with the
+            names of the checkers as the keys and the dictionaries with the
+            (exponentially decaying) number of ``calls``, ``rejections`` and the
+            ``seconds`` spent as the values.
+        """
+        if self.__stats is None:
+            return None
+        return dict(
+            (stage[0], dict(calls=calls, rejections=rejections, seconds=elapsed))
+            for stage, (calls, rejections, elapsed) in self.__stats.items()
+        )
+
+    def _compile_checker(self, checker_func, checker_args):
+        """Binds the arguments to the checker. Subclasses may return faster
+        equivalents of their checkers.
+
+        Args:
+            checker_func (function):
+                Checker, which accepts the value and the arguments.
+            checker_args (tuple):
+                Arguments of the checker.
+
+        Returns (function):
+            Function, which accepts the value only.
+        """
+        if len(checker_args) == 1:
+            checker_arg = checker_args[0]
+
+            def check(val):
+                return checker_func(val, checker_arg)
+        else:
+            def check(val):
+                return checker_func(val, *checker_args)
+        return check
+
+    def _checker_args(self, checker_func):
+        """Returns the arguments of the given checker or ``None`` if the checker is not
+        used by the validator.
+        """
+        return self.__active_checkers.get(checker_func)
+
+    @property
+    def pipeline(self):
+        """The compiled checkers in the order of their calls.
+        """
+        return self.__pipeline
+
+    def _check(self, val):
+        for check in self.__pipeline:
+            if not check(val):
+                return False
+        return True
+
+    def validate_many(self, values):
+        """Validates the batch of values at once. The dispatch is done once for the
+        whole batch, and subclasses may validate some batches (e.g. NumPy arrays) with
+        vectorized operations.
+
+        One-dimensional NumPy arrays are validated as if they were converted to lists
+        with ``tolist()``, as the ``validate_array`` method of the ``NumberValidator``
+        does, so e.g. the elements of ``int64`` arrays are valid ``int`` values. Other
+        iterables are validated value by value.
+
+        Example:
+
+        .. code-block:: python
+
+            validator = NumberValidator(min_val=0)
+            validator.validate_many([1, -1, 2])
+            # Returns [True, False, True].
+
+            validator.validate_many(numpy.array([1, -1, 2]))
+            # Returns array([ True, False,  True]).
+
+        Args:
+            values (collections.abc.Iterable):
+                Values to be validated.
+
+        Returns (list|numpy.ndarray):
+            Boolean mask, where each item tells if the corresponding value is valid.
+            Vectorized validation returns NumPy arrays of booleans.
+        """
+        mask = self._validate_batch(values)
+        if mask is not None:
+            return mask
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(values, numpy.ndarray) and values.ndim == 1:
+            values = values.tolist()
+        values = list(values)
+        allowed_types = self.allowed_types
+        if allowed_types is None:
+            mask = [True] * len(values)
+        else:
+            mask = [isinstance(val, allowed_types) for val in values]
+        # The batch is validated checker by checker, each checker is applied only to
+        # the values, which passed the previous checkers.
+        for check in self.__pipeline:
+            mask = [
+                is_valid and bool(check(val)) for is_valid, val in zip(mask, values)
+            ]
+        return mask
+
+    def _validate_batch(self, values):
+        """Vectorized validation of the batch of values. Subclasses return the mask,
+        if the batch is supported, or ``None`` otherwise. In the latter case the values
+        are validated one by one.
+        """
+        return None
+
+    def _refine_mask(self, values, mask, checker_funcs):
+        """Applies the checkers, which can't be vectorized, to the elements of the
+        NumPy array, which passed the vectorized checks.
+
+        Args:
+            values (numpy.ndarray):
+                One-dimensional array of values.
+            mask (numpy.ndarray):
+                Boolean mask of the valid values, which is updated in place.
+            checker_funcs (tuple):
+                Checkers to apply. Checkers, which are not used by the validator, are
+                skipped.
+
+        Returns (numpy.ndarray):
+            The updated mask.
+        """
+        checkers = [
+            (checker_func, self._checker_args(checker_func))
+            for checker_func in checker_funcs
+            if self._checker_args(checker_func) is not None
+        ]
+        if not checkers:
+            return mask
+        for index in mask.nonzero()[0]:
+            # Elements are converted to the Python's objects, so the checkers see the
+            # same values as in the non-vectorized validation.
+            val = values[index].item()
+            for checker_func, checker_args in checkers:
+                if not checker_func(val, *checker_args):
+                    mask[index] = False
+                    break
+        return mask
@@ -0,0 +1,108 @@
+from threading import Lock
+import sys
+
+
+# Pools shared by all the validators, by the kind of the pool and the number of the
+# workers. They are created on the first use.
+__pools = dict()
+__pools_lock = Lock()
+
+
+def get_pool(processes, workers):
+    """Returns the shared pool of threads or processes.
+
+    Args:
+        processes (bool):
+            If set to ``True``, returns the pool of processes.
+        workers (int):
+            Number of the workers.
+
+    Returns (concurrent.futures.Executor):
+        The pool.
+    """
+    key = (processes, workers)
+    with __pools_lock:
+        pool = __pools.get(key)
+        if pool is None:
+            # The executors are imported on the first use, since they import the
+            # "logging" and "multiprocessing" packages.
+            if processes:
+                from concurrent.futures import ProcessPoolExecutor as pool_type
+            else:
+                from concurrent.futures import ThreadPoolExecutor as pool_type
+            pool = __pools[key] = pool_type(max_workers=workers)
+    return pool
+
+
+def chunk_failure(values, offset, elements_spec):
+    """Returns the index of the first invalid element of the chunk or ``None``.
+
+    Args:
+        values (collections.abc.Sequence):
+            The chunk: the slice of the list, tuple, ``array.array`` or NumPy array.
+            The types of the elements of NumPy arrays are not checked.
+        offset (int):
+            Index of the first element of the chunk in the whole sequence.
+        elements_spec (tuple):
+            Expected type, minimum and maximum value of the elements.
+
+    Returns (int):
+        Global index of the first invalid element or ``None``.
+    """
+    elements_type, min_val, max_val = elements_spec
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if len(values) == 0:
+            return None
+        # Comparisons release the GIL, so the chunks are validated in parallel even by
+        # the threads. NaN values are valid, as in the loop below.
+        invalid = numpy.zeros(len(values), dtype=bool)
+        if min_val is not None:
+            invalid |= values < min_val
+        if max_val is not None:
+            invalid |= values > max_val
+        index = int(invalid.argmax())
+        return offset + index if invalid[index] else None
+    for index, element in enumerate(values):
+        if (elements_type is not None and not isinstance(element, elements_type)) or \
+                (min_val is not None and element < min_val) or \
+                (max_val is not None and element > max_val):
+            return offset + index
+    return None
+
+
+def first_failure(values, elements_spec, chunk_size, pool):  # noqa: C901
+    """Validates the chunks of the sequence in the pool and returns the global index
+    of the first invalid element or ``None``.
+
+    Chunks are validated in any order. Once an invalid element is found, the chunks
+    after it are cancelled, and only the chunks before it are waited for, since they
+    may contain an earlier invalid element.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+    futures = dict()
+    for chunk_num, offset in enumerate(range(0, len(values), chunk_size)):
+        future = pool.submit(
+            chunk_failure, values[offset:offset + chunk_size], offset, elements_spec
+        )
+        futures[future] = chunk_num
+    failure = None
+    failed_chunk = None
+    not_done = set(futures)
+    try:
+        while not_done:
+            done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = future.result()
+                if index is None or (failure is not None and index > failure):
+                    continue
+                failure = index
+                failed_chunk = futures[future]
+            if failed_chunk is not None:
+                not_done = set(
+                    future for future in not_done if futures[future] < failed_chunk
+                )
+    finally:
+        for future in futures:
+            future.cancel()
+    return failure
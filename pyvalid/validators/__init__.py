@@ -1,8 +1,9 @@
+from sys import version_info
+
 from pyvalid.validators.__base import AbstractValidator, Validator
 from pyvalid.validators.__iterable import IterableValidator
 from pyvalid.validators.__number import NumberValidator
 from pyvalid.validators.__string import StringValidator
-from pyvalid.validators.__tensor import TensorValidator
 
 is_validator = Validator
 
@@ -15,3 +16,36 @@ __all__ = [
     'StringValidator',
     'TensorValidator'
 ]
+
+
+# Validators, which depend on heavy optional packages (such as PyTorch), are imported
+# on the first access only, so "import pyvalid" stays fast.
+__lazy_validators = {
+    'TensorValidator': 'pyvalid.validators.__tensor',
+}
+
+
+def __load_validator(name):
+    from importlib import import_module
+    validator = getattr(import_module(__lazy_validators[name]), name)
+    globals()[name] = validator
+    return validator
+
+
+if version_info >= (3, 7):
+    def __getattr__(name):
+        if name in __lazy_validators:
+            return __load_validator(name)
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+
+    def __dir__():
+        return sorted(set(globals()) | set(__lazy_validators))
+else:
+    # Module level __getattr__ isn't supported (PEP 562), import everything eagerly.
+    for __name in __lazy_validators:
+        try:
+            __load_validator(__name)
+        except ImportError:
+            pass
@@ -1,12 +1,20 @@
+from array import array
+import os
+import sys
 import warnings
 
 try:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Sequence
 except ImportError:
-    from collections import Iterable
+    from collections import Iterable, Iterator, Sequence
+try:
+    from collections.abc import Buffer
+except ImportError:
+    Buffer = (bytes, bytearray, memoryview)
 
 from pyvalid import accepts
 from pyvalid.validators import AbstractValidator
+from pyvalid.validators.__chunks import chunk_failure, first_failure, get_pool
 
 
 class IterableValidator(AbstractValidator):
@@ -14,6 +22,15 @@ class IterableValidator(AbstractValidator):
     given iterable is valid or not. The iterable can be either a list, tuple or even
     keys or values of a dictionary.
 
+    All the checks of the elements are performed in a single pass over the iterable.
+    One-shot iterators, such as generators, are rejected if the elements or the
+    emptiness have to be checked, since the validation would consume them.
+
+    With ``streaming=True`` such iterators are still rejected when the validator is
+    called directly, but ``pyvalid.accepts`` replaces them with the proxy returned by
+    the ``stream`` method. The proxy checks each element when it's pulled by the
+    wrapped function, so the iterator is neither consumed nor copied in advance.
+
     Example:
 
     .. code-block:: python
@@ -25,8 +42,144 @@ class IterableValidator(AbstractValidator):
         def example([1, 3, 7, 10]):
             pass
 
+        @accepts(IterableValidator(elements_type=int, min_val=0, streaming=True))
+        def total(numbers):
+            return sum(numbers)
+
+        total(num for num in range(10))
+        # Returns 45.
+
+        total(num for num in range(-1, 10))
+        # Raises the ArgumentValidationError exception with the element_index equal to
+        # 0, when the sum() pulls the first element.
+
+    With ``chunk_size`` the elements of the sequences longer than the chunk are
+    validated in parallel, chunk by chunk, by the pool of ``workers`` (the number of
+    CPUs by default). NumPy arrays and other buffers are validated by the threads,
+    since the vectorized comparisons release the GIL. Lists, tuples and other
+    sequences of Python objects are validated by the threads too, unless
+    ``processes=True`` is set, so the chunks are copied to the pool of processes.
+    Once an invalid element is found, the validation of the next chunks is cancelled.
+    The ``first_failure`` method returns the index of the first invalid element.
+
+    .. code-block:: python
+
+        validator = IterableValidator(
+            elements_type=float, min_val=0, chunk_size=10 ** 6, processes=True
+        )
+        validator.first_failure(values)
+        # Returns the index of the first invalid value or None.
+
     """
 
+    #: Wrap one-shot iterators into validating proxies when used with the ``accepts``.
+    streaming = False
+
+    # One-shot iterators have to be rejected before anything tries to consume them.
+    checker_costs = dict(
+        iterator_checker=0, iterable_type_checker=1, empty_checker=2,
+        elements_checker=10,
+    )
+
+    #: Python types of the elements of ``array.array`` and ``memoryview`` objects,
+    #: by their type codes.
+    buffer_element_types = dict(
+        [(type_code, int) for type_code in 'bBhHiIlLqQnN'] +
+        [(type_code, float) for type_code in 'efd'] +
+        [('?', bool), ('c', bytes), ('u', str), ('w', str)]
+    )
+
+    @classmethod
+    def array_info(cls, val):
+        """Detects one-dimensional NumPy arrays, ``array.array`` and other objects
+        supporting the buffer protocol. All elements of such objects have the same
+        type, so they can be validated with vectorized operations instead of the loop
+        over the elements.
+
+        Args:
+            val (collections.abc.Iterable):
+                Iterable whose contents needs to be validated.
+
+        Returns (tuple):
+            ``None`` if the given iterable has to be validated element by element,
+            otherwise the pair of:
+
+            * type of the elements;
+            * NumPy array, which can be compared with the min/max values in a single
+              vectorized operation, the ``array.array``/``memoryview``, which can be
+              passed to the built-in ``min()`` and ``max()`` functions, or ``None`` if
+              the min/max values can't be checked without the loop.
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(val, numpy.ndarray):
+            if val.ndim != 1 or val.dtype.hasobject:
+                return None
+            values = val if val.dtype.kind in 'biuf' else None
+            return val.dtype.type, values
+        if isinstance(val, Buffer) and not isinstance(val, array):
+            try:
+                val = memoryview(val)
+            except TypeError:
+                return None
+        element_type = cls.buffer_element_type(val)
+        if element_type is None:
+            return None
+        values = None
+        if element_type in (int, float, bool):
+            if numpy is not None:
+                values = numpy.asarray(val)
+            elif element_type is int:
+                # Without NumPy only integers are safe for min() and max(), since
+                # floats may contain NaN values.
+                values = val
+        return element_type, values
+
+    @classmethod
+    def buffer_element_type(cls, val):
+        """Returns the type of the elements of ``array.array`` or one-dimensional
+        ``memoryview``, or ``None`` for other objects and unsupported formats.
+        """
+        if isinstance(val, array):
+            type_code = val.typecode
+        elif isinstance(val, memoryview) and val.ndim == 1:
+            type_code = val.format.lstrip('@=<>!')
+        else:
+            return None
+        return cls.buffer_element_types.get(type_code)
+
+    @classmethod
+    def array_bounds_checker(cls, values, min_val, max_val):
+        """Checks if all the values of an array are within the given bounds with
+        vectorized operations.
+
+        Args:
+            values (numpy.ndarray|array.array|memoryview):
+                Values returned by the ``array_info`` method.
+            min_val (int):
+                Expected minimum value or ``None``.
+            max_val (int):
+                Expected maximum value or ``None``.
+
+        Returns (bool):
+            True:
+                If all the values are within the bounds.
+            False:
+                If at least one value is out of the bounds.
+        """
+        if len(values) == 0:
+            return True
+        if isinstance(values, (array, memoryview)):
+            return (
+                (min_val is None or min(values) >= min_val) and
+                (max_val is None or max(values) <= max_val)
+            )
+        # Unlike min() and max(), comparisons handle NaN values in the same way as
+        # the loop over the elements does.
+        return not (
+            (min_val is not None and (values < min_val).any()) or
+            (max_val is not None and (values > max_val).any())
+        )
+
     @classmethod
     def iterable_type_checker(cls, val, iterable_type):
         """Checks if the iterable is of required data type.
@@ -88,6 +241,10 @@ class IterableValidator(AbstractValidator):
             False:
                 If at least one element of the iterable is not of required type.
         """
+        array_info = cls.array_info(val)
+        if array_info is not None:
+            # Empty iterables are valid whatever the type of the elements.
+            return issubclass(array_info[0], elements_type) or len(val) == 0
         valid = True
         for element in val:
             valid = isinstance(element, elements_type)
@@ -115,6 +272,9 @@ class IterableValidator(AbstractValidator):
                 If at least one element of the iterable is less than the
                 <min_val>.
         """
+        array_info = cls.array_info(val)
+        if array_info is not None and array_info[1] is not None:
+            return cls.array_bounds_checker(array_info[1], min_val, None)
         valid = True
 
         for element in val:
@@ -143,6 +303,9 @@ class IterableValidator(AbstractValidator):
                 If at least one element of the iterable is greater than the
                 <max_val>.
         """
+        array_info = cls.array_info(val)
+        if array_info is not None and array_info[1] is not None:
+            return cls.array_bounds_checker(array_info[1], None, max_val)
         valid = True
 
         for element in val:
@@ -152,26 +315,233 @@ class IterableValidator(AbstractValidator):
 
         return valid
 
+    @classmethod
+    def elements_checker(cls, val, elements_spec):
+        """Checks the type and the value of all the elements of the iterable in a
+        single pass. Used instead of the ``element_type_checker``,
+        ``elements_min_val_checker`` and ``elements_max_val_checker`` methods, each of
+        which walks the whole iterable.
+
+        Args:
+            val (collections.abc.Iterable):
+                Iterable whose contents needs to be validated.
+            elements_spec (tuple):
+                Expected type, minimum and maximum value of the elements. Any of them
+                can be ``None``.
+
+        Returns (bool):
+            True:
+                If all the elements of the iterable are valid.
+            False:
+                If at least one element of the iterable is invalid.
+        """
+        elements_type, min_val, max_val = elements_spec
+        array_info = cls.array_info(val)
+        if array_info is not None:
+            element_type, values = array_info
+            if elements_type is not None and not issubclass(element_type, elements_type):
+                # Empty iterables are valid whatever the type of the elements.
+                return len(val) == 0
+            if min_val is None and max_val is None:
+                return True
+            if values is not None:
+                return cls.array_bounds_checker(values, min_val, max_val)
+        if elements_type is None:
+            return cls.__bounds_loop(val, min_val, max_val)
+        return cls.__typed_bounds_loop(val, elements_type, min_val, max_val)
+
+    # Comparisons in the loops below are written in the same way as in the separate
+    # checkers, so NaN values are treated in the same way.
+
+    @staticmethod
+    def __bounds_loop(val, min_val, max_val):
+        if max_val is None:
+            for element in val:
+                if element < min_val:
+                    return False
+        elif min_val is None:
+            for element in val:
+                if element > max_val:
+                    return False
+        else:
+            for element in val:
+                if element < min_val or element > max_val:
+                    return False
+        return True
+
+    @staticmethod
+    def __typed_bounds_loop(val, elements_type, min_val, max_val):  # noqa: C901
+        if max_val is None and min_val is None:
+            for element in val:
+                if not isinstance(element, elements_type):
+                    return False
+        elif max_val is None:
+            for element in val:
+                if not isinstance(element, elements_type) or element < min_val:
+                    return False
+        elif min_val is None:
+            for element in val:
+                if not isinstance(element, elements_type) or element > max_val:
+                    return False
+        else:
+            for element in val:
+                if not isinstance(element, elements_type) or \
+                        element < min_val or element > max_val:
+                    return False
+        return True
+
+    @classmethod
+    def iterator_checker(cls, val, iterators_allowed):
+        """Checks if the iterable is not a one-shot iterator (e.g. a generator). Such
+        iterables are consumed by the validation, so the validated function would
+        receive the exhausted iterator.
+
+        Args:
+            val (collections.abc.Iterable):
+                Iterable to be validated.
+            iterators_allowed (bool):
+                If this flag is set to ``True``, iterators pass the check.
+
+        Returns (bool):
+            True:
+                If the iterable can be iterated over several times or iterators are
+                allowed.
+            False:
+                If the iterable is a one-shot iterator.
+        """
+        return iterators_allowed or not isinstance(val, Iterator)
+
+    def _compile_checker(self, checker_func, checker_args):
+        if checker_func == IterableValidator.elements_checker and \
+                self.__chunk_size is not None:
+            def check(val):
+                return self.first_failure(val) is None
+            return check
+        return AbstractValidator._compile_checker(self, checker_func, checker_args)
+
+    def first_failure(self, val):
+        """Finds the first element of the iterable, which doesn't match the type, min
+        and max value of the elements. The sequences longer than the ``chunk_size`` are
+        validated in parallel.
+
+        Args:
+            val (collections.abc.Iterable):
+                Iterable whose contents needs to be validated. One-shot iterators are
+                consumed.
+
+        Returns (int):
+            Index of the first invalid element or ``None`` if all the elements are
+            valid.
+        """
+        elements_spec = self.__elements_spec
+        if elements_spec is None:
+            return None
+        elements_type, min_val, max_val = elements_spec
+        array_info = self.array_info(val)
+        processes = self.__processes
+        if array_info is not None:
+            element_type, values = array_info
+            if elements_type is not None and not issubclass(element_type, elements_type):
+                return 0 if len(val) else None
+            if min_val is None and max_val is None:
+                return None
+            # Buffers, which can't be compared by NumPy, are validated in the loop.
+            if values is None or isinstance(values, (array, memoryview)):
+                values = val if isinstance(val, Sequence) else memoryview(val)
+            else:
+                processes = False
+        elif isinstance(val, Sequence):
+            values = val
+        else:
+            return chunk_failure(val, 0, elements_spec)
+        chunk_size = self.__chunk_size
+        if chunk_size is None or len(values) <= chunk_size:
+            return chunk_failure(values, 0, elements_spec)
+        pool = get_pool(processes, self.__workers)
+        return first_failure(values, elements_spec, chunk_size, pool)
+
+    def stream(self, iterator, on_error):
+        """Returns the proxy, which yields the elements of the given iterator and
+        validates each of them, when it's pulled.
+
+        Args:
+            iterator (collections.abc.Iterator):
+                One-shot iterator whose contents needs to be validated.
+            on_error (function):
+                Called with the index of the invalid element and the element itself.
+                It's called with ``None`` instead of both, when the iterator turns out
+                to be empty, while empty iterables are not allowed. The proxy yields
+                the element, if the function doesn't raise an exception.
+
+        Returns (collections.abc.Iterator):
+            The validating proxy or ``None`` if the iterator itself is invalid.
+        """
+        if self.__iterable_type is not None and \
+                not self.iterable_type_checker(iterator, self.__iterable_type):
+            return None
+        return self.__stream(iterator, on_error)
+
+    def __stream(self, iterator, on_error):
+        elements_type, min_val, max_val = self.__elements_spec or (None, None, None)
+        element_index = -1
+        for element_index, element in enumerate(iterator):
+            is_valid = (
+                (elements_type is None or isinstance(element, elements_type)) and
+                (min_val is None or not element < min_val) and
+                (max_val is None or not element > max_val)
+            )
+            if not is_valid:
+                on_error(element_index, element)
+            yield element
+        if element_index < 0 and self.__empty_allowed is not None:
+            if self.__empty_allowed:
+                warnings.warn("Iterable is empty, but does not impact the execution.")
+            else:
+                on_error(None, None)
+
     @property
     def checkers(self):
         return self.__checkers
 
     @accepts(object, empty_allowed=bool, element_type=(str, int, float),
-             min_val=(int, float), max_val=(int, float))
+             min_val=(int, float), max_val=(int, float), streaming=bool,
+             chunk_size=int, workers=int, processes=bool)
     def __init__(self, **kwargs):
         min_val = kwargs.get('min_val', None)
         max_val = kwargs.get('max_val', None)
         if min_val is not None and max_val is not None and min_val > max_val:
             raise ValueError('Min value can\'t be greater than max value!')
+        chunk_size = kwargs.get('chunk_size', None)
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size must be a positive integer!')
+        workers = kwargs.get('workers', None)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise ValueError('Number of workers must be a positive integer!')
         iterable_type = kwargs.get('iterable_type', None)
         empty_allowed = kwargs.get('empty_allowed', None)
         elements_type = kwargs.get('elements_type', None)
 
+        elements_spec = (elements_type, min_val, max_val)
+        if elements_spec == (None, None, None):
+            elements_spec = None
+        # The empty check and the elements check would consume one-shot iterators.
+        iterators_allowed = None
+        if elements_spec is not None or empty_allowed is not None:
+            iterators_allowed = False
+        self.streaming = kwargs.get('streaming', False)
+        self.__iterable_type = iterable_type
+        self.__empty_allowed = empty_allowed
+        self.__elements_spec = elements_spec
+        self.__chunk_size = chunk_size
+        self.__workers = workers
+        self.__processes = kwargs.get('processes', False)
+
         self.__checkers = {
+            IterableValidator.iterator_checker: [iterators_allowed],
             IterableValidator.empty_checker: [empty_allowed],
-            IterableValidator.element_type_checker: [elements_type],
             IterableValidator.iterable_type_checker: [iterable_type],
-            IterableValidator.elements_min_val_checker: [min_val],
-            IterableValidator.elements_max_val_checker: [max_val]
+            IterableValidator.elements_checker: [elements_spec]
         }
-        AbstractValidator.__init__(self, allowed_types=Iterable)
+        AbstractValidator.__init__(self, **dict(kwargs, allowed_types=Iterable))
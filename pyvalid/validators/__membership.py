@@ -0,0 +1,112 @@
+from operator import index
+try:
+    from collections.abc import Container, Iterable, Sized
+except ImportError:
+    from collections import Container, Iterable, Sized
+
+
+class Membership(Container, Iterable, Sized):
+    """Immutable collection of the values for the ``in_range`` and ``not_in_range``
+    checkers. The values are collected once, when the validator is created, so:
+
+    * checking hashable values takes O(1) time — hashable elements are stored in the
+      ``frozenset``, while unhashable ones are kept in the ordered tuple and scanned
+      only if needed;
+    * ``range`` objects are kept as is, and all the numbers are checked in O(1) time,
+      unlike the ``range.__contains__`` method, which scans the range for anything but
+      ``int`` values;
+    * one-shot iterables, such as generators, are consumed once, so the validator
+      can be safely reused.
+
+    Use the ``of`` method to create the collection.
+
+    Attributes:
+        range (range):
+            The range of allowed values or ``None``.
+        elements (tuple):
+            All the values in the original order, or ``None`` for ranges.
+        contains_hashable (function):
+            The fastest equivalent of the ``in`` operator, which can be used for
+            hashable values only.
+    """
+
+    def __init__(self, values):
+        if isinstance(values, range):
+            self.range = values
+            self.elements = None
+            self.__hashable = frozenset()
+            self.__unhashable = tuple()
+            self.contains_hashable = self.__contains__
+            return
+        self.range = None
+        self.elements = tuple(values)
+        hashable = list()
+        unhashable = list()
+        for element in self.elements:
+            try:
+                hash(element)
+            except TypeError:
+                unhashable.append(element)
+            else:
+                hashable.append(element)
+        self.__hashable = frozenset(hashable)
+        self.__unhashable = tuple(unhashable)
+        if unhashable:
+            self.contains_hashable = self.__contains__
+        else:
+            self.contains_hashable = self.__hashable.__contains__
+
+    @classmethod
+    def of(cls, values):
+        """Normalizes the collection of values passed to the validator.
+
+        Args:
+            values (collections.abc.Container):
+                Collection of values or ``None``.
+
+        Returns (collections.abc.Container):
+            ``Membership`` for any iterable, except strings and bytes, whose
+            ``in`` operator checks substrings. Other values are returned unchanged.
+        """
+        if isinstance(values, (str, bytes, bytearray, cls)) or \
+                not isinstance(values, Iterable):
+            return values
+        return cls(values)
+
+    def __contains__(self, val):
+        if self.range is not None:
+            return self.__in_range(val)
+        try:
+            if val in self.__hashable:
+                return True
+        except TypeError:
+            # Unhashable values are compared with all the elements.
+            return val in self.elements
+        return bool(self.__unhashable) and val in self.__unhashable
+
+    def __in_range(self, val):
+        if isinstance(val, int):
+            return val in self.range
+        try:
+            # Integers of other types, e.g. NumPy integers.
+            return index(val) in self.range
+        except TypeError:
+            pass
+        try:
+            int_val = int(val)
+        except (TypeError, ValueError, OverflowError):
+            # Values, which can't be converted to integers, aren't equal to them.
+            return False
+        return int_val == val and int_val in self.range
+
+    def __iter__(self):
+        return iter(self.range if self.range is not None else self.elements)
+
+    def __len__(self):
+        return len(self.range if self.range is not None else self.elements)
+
+    def __repr__(self):
+        return '{}({!r})'.format(
+            type(self).__name__,
+            self.range if self.range is not None else list(self.elements)
+        )
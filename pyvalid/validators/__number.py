@@ -1,3 +1,6 @@
+from functools import partial
+from operator import ge, le
+import sys
 from sys import version_info
 try:
     from collections.abc import Iterable, Container
@@ -6,14 +9,26 @@ except ImportError:
 
 from pyvalid import accepts
 from pyvalid.validators import AbstractValidator
+from pyvalid.validators.__membership import Membership
 
 
 class NumberValidator(AbstractValidator):
 
+    pure = True
+
     number_types = (int, float)
     if version_info < (3, 0, 0):
         number_types += (long, )  # noqa: F821
 
+    #: Python types of the elements of NumPy arrays, by the kind of the array's dtype.
+    #: Arrays are validated as if they were converted to lists with ``tolist()``.
+    array_element_types = dict(b=bool, i=int, u=int, f=float)
+
+    checker_costs = dict(
+        number_type_checker=1, min_val_checker=2, max_val_checker=2,
+        in_range_checker=3, not_in_range_checker=3,
+    )
+
     @classmethod
     def number_type_checker(cls, val, number_type):
         """Checks if the number is of required data type.
@@ -58,6 +73,150 @@ class NumberValidator(AbstractValidator):
     def not_in_range_checker(cls, val, not_in_range):
         return not cls.in_range_checker(val, not_in_range)
 
+    def _compile_checker(self, checker_func, checker_args):
+        checker_arg = checker_args[0]
+        # Validated values are numbers, so the comparisons and the membership checks
+        # can be done without calling the checkers.
+        if checker_func == NumberValidator.min_val_checker:
+            return partial(le, checker_arg)
+        if checker_func == NumberValidator.max_val_checker:
+            return partial(ge, checker_arg)
+        if checker_func == NumberValidator.in_range_checker and \
+                isinstance(checker_arg, Membership):
+            return checker_arg.contains_hashable
+        if checker_func == NumberValidator.not_in_range_checker and \
+                isinstance(checker_arg, Membership):
+            contains = checker_arg.contains_hashable
+
+            def check(val):
+                return not contains(val)
+            return check
+        return AbstractValidator._compile_checker(self, checker_func, checker_args)
+
+    def _validate_batch(self, values):
+        """Validates one-dimensional NumPy arrays of numbers with vectorized
+        operations. Checkers of the ranges are applied element by element.
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is None or not isinstance(values, numpy.ndarray) or values.ndim != 1:
+            return None
+        element_type = self.array_element_types.get(values.dtype.kind)
+        if element_type is None:
+            return None
+        checker_args = self._checker_args
+        mask = numpy.ones(len(values), dtype=bool)
+        number_type = checker_args(NumberValidator.number_type_checker)
+        if number_type is not None and element_type != number_type[0]:
+            mask[:] = False
+            return mask
+        min_val = checker_args(NumberValidator.min_val_checker)
+        if min_val is not None:
+            mask &= values >= min_val[0]
+        max_val = checker_args(NumberValidator.max_val_checker)
+        if max_val is not None:
+            mask &= values <= max_val[0]
+        for checker_func, expected in ((NumberValidator.in_range_checker, True),
+                                       (NumberValidator.not_in_range_checker, False)):
+            in_range = checker_args(checker_func)
+            if in_range is None:
+                continue
+            in_range_mask = self.__in_range_mask(numpy, values, in_range[0])
+            if in_range_mask is None:
+                mask = self._refine_mask(values, mask, (checker_func, ))
+            elif expected:
+                mask &= in_range_mask
+            else:
+                mask &= ~in_range_mask
+        return mask
+
+    def validate_array(self, values, first_failure=False):
+        """Validates the whole column of numbers (one-dimensional NumPy array, pandas
+        Series or any sequence convertible to the NumPy array) with the same
+        configuration, which is used for the scalars.
+
+        The type and the min/max values are checked with vectorized operations,
+        ``in_range`` and ``not_in_range`` are checked with ``numpy.isin`` (or with
+        arithmetic operations for ``range`` objects). Arrays of objects are validated
+        element by element. Elements are validated as if the array was converted to
+        the list with ``tolist()``, so e.g. the elements of ``int64`` arrays are
+        treated as ``int`` values.
+
+        Example:
+
+        .. code-block:: python
+
+            validator = NumberValidator(min_val=0, not_in_range=[13])
+            validator.validate_array(numpy.array([1, 13, -1]))
+            # Returns array([ True, False, False]).
+
+            validator.validate_array(numpy.array([1, 13, -1]), first_failure=True)
+            # Returns 1.
+
+        Args:
+            values (numpy.ndarray|pandas.Series|collections.abc.Sequence):
+                One-dimensional column of numbers.
+            first_failure (bool):
+                If set to ``True``, the index of the first invalid element is returned
+                instead of the mask.
+
+        Returns (numpy.ndarray|pandas.Series|int):
+            Boolean mask of the valid elements (pandas Series for pandas Series, with
+            the same index), or the position of the first invalid element (``None``
+            if all the elements are valid), if ``first_failure`` is set.
+
+        Raises:
+            ValueError:
+                If the array is not one-dimensional.
+        """
+        import numpy
+        index = None
+        pandas = sys.modules.get('pandas')
+        if pandas is not None and isinstance(values, pandas.Series):
+            index = values.index
+            values = values.to_numpy()
+        values = numpy.asarray(values)
+        if values.ndim != 1:
+            raise ValueError('Only one-dimensional arrays can be validated!')
+        mask = self._validate_batch(values)
+        if mask is None:
+            mask = numpy.array(
+                AbstractValidator.validate_many(self, values.tolist()), dtype=bool
+            )
+        if first_failure:
+            failures = numpy.flatnonzero(~mask)
+            return int(failures[0]) if len(failures) else None
+        if index is not None:
+            return pandas.Series(mask, index=index)
+        return mask
+
+    @staticmethod
+    def __in_range_mask(numpy, values, in_range):
+        """Checks if the elements of the array are in the given range with vectorized
+        operations.
+
+        Returns (numpy.ndarray):
+            Boolean mask or ``None`` if the range can't be checked in this way.
+        """
+        if isinstance(in_range, Membership):
+            in_range = in_range.range if in_range.range is not None else \
+                in_range.elements
+        if isinstance(in_range, range):
+            start, stop, step = in_range.start, in_range.stop, in_range.step
+            if step > 0:
+                within = (values >= start) & (values < stop)
+            else:
+                within = (values <= start) & (values > stop)
+            return within & ((values - start) % step == 0)
+        if not isinstance(in_range, (list, tuple, set, frozenset, dict)):
+            return None
+        items = numpy.array([
+            item for item in in_range
+            if isinstance(item, NumberValidator.number_types)
+        ])
+        if items.dtype.kind not in NumberValidator.array_element_types:
+            return None
+        return numpy.isin(values, items)
+
     @property
     def checkers(self):
         return self.__checkers
@@ -72,8 +231,9 @@ class NumberValidator(AbstractValidator):
         if min_val is not None and max_val is not None and min_val > max_val:
             raise ValueError('Min value can\'t be greater than max value!')
         number_type = kwargs.get('number_type', None)
-        in_range = kwargs.get('in_range', None)
-        not_in_range = kwargs.get('not_in_range', None)
+        # Collections of values are normalized once, for O(1) membership checks.
+        in_range = Membership.of(kwargs.get('in_range', None))
+        not_in_range = Membership.of(kwargs.get('not_in_range', None))
 
         self.__checkers = {
             NumberValidator.min_val_checker: [min_val],
@@ -82,4 +242,6 @@ class NumberValidator(AbstractValidator):
             NumberValidator.in_range_checker: [in_range],
             NumberValidator.not_in_range_checker: [not_in_range]
         }
-        AbstractValidator.__init__(self, allowed_types=NumberValidator.number_types)
+        AbstractValidator.__init__(
+            self, **dict(kwargs, allowed_types=NumberValidator.number_types)
+        )
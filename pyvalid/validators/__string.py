@@ -1,4 +1,5 @@
 import re
+import sys
 try:
     from collections.abc import Iterable, Container
 except ImportError:
@@ -6,10 +7,21 @@ except ImportError:
 
 from pyvalid import accepts
 from pyvalid.validators import AbstractValidator
+from pyvalid.validators.__membership import Membership
+
+
+Pattern = type(re.compile(''))
 
 
 class StringValidator(AbstractValidator):
 
+    pure = True
+
+    checker_costs = dict(
+        min_len_checker=1, max_len_checker=1,
+        in_range_checker=2, not_in_range_checker=2, re_checker=5,
+    )
+
     @classmethod
     def min_len_checker(cls, val, min_len):
         return len(val) >= min_len
@@ -35,14 +47,79 @@ class StringValidator(AbstractValidator):
         return not cls.in_range_checker(val, not_in_range)
 
     @classmethod
-    def re_checker(cls, val, pattern, flags=0):
+    def re_checker(cls, val, pattern, flags=0, full_match=False):
         try:
-            match_obj = re.match(pattern, val, flags)
+            if full_match:
+                match_obj = cls.__full_matcher(re.compile(pattern, flags))(val)
+            else:
+                match_obj = re.match(pattern, val, flags)
             is_valid = match_obj is not None
         except re.error:
             is_valid = False
         return is_valid
 
+    @staticmethod
+    def __full_matcher(compiled_re):
+        """Returns the function, which matches the whole string against the compiled
+        regular expression, like the ``fullmatch`` method on Python 3.4+.
+        """
+        fullmatch = getattr(compiled_re, 'fullmatch', None)
+        if fullmatch is not None:
+            return fullmatch
+
+        def match_whole(val):
+            match_obj = compiled_re.match(val)
+            if match_obj is not None and match_obj.end() == len(val):
+                return match_obj
+            return None
+        return match_whole
+
+    def _compile_checker(self, checker_func, checker_args):
+        checker_arg = checker_args[0]
+        # Validated values are strings, so the membership checks and the regular
+        # expressions can be called without the checkers.
+        if checker_func == StringValidator.in_range_checker and \
+                isinstance(checker_arg, Membership):
+            return checker_arg.contains_hashable
+        if checker_func == StringValidator.not_in_range_checker and \
+                isinstance(checker_arg, Membership):
+            contains = checker_arg.contains_hashable
+
+            def check(val):
+                return not contains(val)
+            return check
+        if checker_func == StringValidator.re_checker and \
+                isinstance(checker_arg, Pattern):
+            # The pipeline needs the truth value only, so the match object works.
+            if len(checker_args) > 2 and checker_args[2]:
+                return StringValidator.__full_matcher(checker_arg)
+            return checker_arg.match
+        return AbstractValidator._compile_checker(self, checker_func, checker_args)
+
+    def _validate_batch(self, values):
+        """Checks lengths of the strings in one-dimensional NumPy arrays of strings
+        with vectorized operations. Other checkers are applied element by element.
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is None or not isinstance(values, numpy.ndarray) or \
+                values.ndim != 1 or values.dtype.kind != 'U':
+            return None
+        checker_args = self._checker_args
+        mask = numpy.ones(len(values), dtype=bool)
+        min_len = checker_args(StringValidator.min_len_checker)
+        max_len = checker_args(StringValidator.max_len_checker)
+        if min_len is not None or max_len is not None:
+            lengths = numpy.char.str_len(values)
+            if min_len is not None:
+                mask &= lengths >= min_len[0]
+            if max_len is not None:
+                mask &= lengths <= max_len[0]
+        return self._refine_mask(values, mask, (
+            StringValidator.in_range_checker,
+            StringValidator.not_in_range_checker,
+            StringValidator.re_checker,
+        ))
+
     @property
     def checkers(self):
         return self.__checkers
@@ -50,16 +127,55 @@ class StringValidator(AbstractValidator):
     @accepts(
         object, min_len=int, max_len=int,
         in_range=[Iterable, Container], not_in_range=[Iterable, Container],
-        re_pattern=str, re_flags=int
+        re_pattern=[str, Pattern], re_flags=int, re_full_match=bool
     )
     def __init__(self, **kwargs):
+        re_pattern = kwargs.get('re_pattern', None)
+        if re_pattern is not None:
+            re_pattern = StringValidator.__compile_re(
+                re_pattern, kwargs.get('re_flags', 0)
+            )
         self.__checkers = {
             StringValidator.min_len_checker: [kwargs.get('min_len', None)],
             StringValidator.max_len_checker: [kwargs.get('max_len', None)],
-            StringValidator.in_range_checker: [kwargs.get('in_range', None)],
-            StringValidator.not_in_range_checker: [kwargs.get('not_in_range', None)],
+            # Collections of values are normalized once, for O(1) membership checks.
+            StringValidator.in_range_checker: [
+                Membership.of(kwargs.get('in_range', None))
+            ],
+            StringValidator.not_in_range_checker: [
+                Membership.of(kwargs.get('not_in_range', None))
+            ],
             StringValidator.re_checker: [
-                kwargs.get('re_pattern', None), kwargs.get('re_flags', 0)
+                re_pattern, 0, kwargs.get('re_full_match', False)
             ]
         }
-        AbstractValidator.__init__(self, allowed_types=str)
+        AbstractValidator.__init__(self, **dict(kwargs, allowed_types=str))
+
+    @staticmethod
+    def __compile_re(re_pattern, re_flags):
+        """Compiles the regular expression once, so checking a value takes a single
+        call of the compiled pattern's method.
+
+        Args:
+            re_pattern (str|re.Pattern):
+                Regular expression or the compiled regular expression.
+            re_flags (int):
+                Regular expression flags. Can't be used along with the compiled
+                regular expression.
+
+        Returns (re.Pattern):
+            The compiled regular expression.
+
+        Raises:
+            ValueError:
+                If the regular expression is invalid.
+        """
+        try:
+            compiled_re = re.compile(re_pattern, re_flags)
+        except re.error as exc:
+            raise ValueError(
+                'Invalid regular expression "{}": {}'.format(re_pattern, exc)
+            )
+        if not isinstance(compiled_re.pattern, str):
+            raise ValueError('Only str regular expressions are supported.')
+        return compiled_re
@@ -27,6 +27,11 @@ class TensorValidator(AbstractValidator):
             pass
 
     """
+
+    checker_costs = dict(
+        dimension_checker=1, empty_checker=1, tensor_type_checker=2, nan_checker=10,
+    )
+
     @classmethod
     def tensor_type_checker(cls, val, tensor_type):
         """Checks the tensor types with CPU variants.
@@ -146,4 +151,4 @@ class TensorValidator(AbstractValidator):
             TensorValidator.empty_checker: [kwargs.get('empty_allowed', None)],
             TensorValidator.nan_checker: [kwargs.get('nans_allowed', None)],
         }
-        AbstractValidator.__init__(self, allowed_types=torch.Tensor)
+        AbstractValidator.__init__(self, **dict(kwargs, allowed_types=torch.Tensor))
@@ -1,4 +1,5 @@
 from os import path
+import re
 try:
     from setuptools import setup
 except ImportError:
@@ -13,6 +14,13 @@ def main():
         long_description = fd.read()
     with open(path.join('requirements', 'base.txt')) as fd:
         requirements = fd.read().splitlines()
+    # Optional dependencies, e.g. "pip install pyvalid[torch]" or "pyvalid[all]".
+    with open(path.join('requirements', 'extras.txt')) as fd:
+        extras = fd.read().splitlines()
+    extras_require = {
+        re.split(r'[\s~=<>!\[;]', extra, 1)[0]: [extra] for extra in extras if extra
+    }
+    extras_require['all'] = extras
     setup(
         name='pyvalid',
         version=version,
@@ -30,6 +38,7 @@ def main():
         ),
         long_description=long_description,
         install_requires=requirements,
+        extras_require=extras_require,
         keywords=[
             'pyvalid', 'valid',
             'validation', 'type',
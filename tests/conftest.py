@@ -0,0 +1,7 @@
+import sys
+
+
+# Asynchronous generators are a syntax error before Python 3.6.
+collect_ignore = list()
+if sys.version_info < (3, 6):
+    collect_ignore.append('test_async_generators.py')
@@ -0,0 +1,202 @@
+import pickle
+import unittest
+
+from pyvalid import ArgumentValidationError
+from pyvalid.validators import AbstractValidator, IterableValidator, \
+    NumberValidator, StringValidator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CallsValidator(AbstractValidator):
+    """Records the calls of its checkers.
+    """
+
+    calls = list()
+
+    checker_costs = dict(cheap_checker=1, expensive_checker=100)
+
+    adaptive_window = 10
+    adaptive_interval = 20
+
+    @classmethod
+    def expensive_checker(cls, val, name):
+        cls.calls.append(name)
+        return val > 0
+
+    @classmethod
+    def cheap_checker(cls, val, name):
+        cls.calls.append(name)
+        return val < 10
+
+    @classmethod
+    def other_checker(cls, val, name, limit):
+        cls.calls.append(name)
+        return val != limit
+
+    @property
+    def checkers(self):
+        return self.__checkers
+
+    def __init__(self, **kwargs):
+        self.__checkers = {
+            CallsValidator.expensive_checker: [kwargs.get('expensive', None)],
+            CallsValidator.other_checker: [kwargs.get('other', None), 5],
+            CallsValidator.cheap_checker: [kwargs.get('cheap', None)],
+        }
+        AbstractValidator.__init__(self, **dict(kwargs, allowed_types=int))
+
+
+class AbstractValidatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        del CallsValidator.calls[:]
+
+    def test_pipeline_order(self):
+        validator = CallsValidator(expensive='expensive', other='other', cheap='cheap')
+        self.assertEqual(len(validator.pipeline), 3)
+        self.assertTrue(validator(3))
+        # The checkers missing in the checker_costs get the default cost.
+        self.assertEqual(CallsValidator.calls, ['cheap', 'other', 'expensive'])
+
+        del CallsValidator.calls[:]
+        self.assertFalse(validator(20))
+        self.assertEqual(CallsValidator.calls, ['cheap'])
+        self.assertFalse(validator(5))
+        self.assertFalse(validator('a'))
+
+    def test_unused_checkers(self):
+        validator = CallsValidator(cheap='cheap')
+        self.assertEqual(len(validator.pipeline), 1)
+        self.assertTrue(validator(-1))
+        self.assertEqual(CallsValidator.calls, ['cheap'])
+        # The checkers dictionary is not modified.
+        self.assertEqual(len(validator.checkers), 3)
+
+    def test_static_costs(self):
+        validator = CallsValidator(
+            expensive='expensive', cheap='cheap',
+            checker_costs=dict(expensive_checker=1, cheap_checker=2)
+        )
+        self.assertFalse(validator(20))
+        self.assertEqual(CallsValidator.calls, ['expensive', 'cheap'])
+        self.assertIsNone(validator.checker_stats())
+
+    def test_adaptive(self):
+        validator = CallsValidator(
+            expensive='expensive', cheap='cheap', adaptive=True,
+            checker_costs=dict(expensive_checker=1, cheap_checker=2)
+        )
+        # The expensive checker never rejects the values, so it's moved to the end.
+        for _ in range(CallsValidator.adaptive_window):
+            self.assertFalse(validator(20))
+        self.assertEqual(CallsValidator.calls[:2], ['expensive', 'cheap'])
+        stats = validator.checker_stats()
+        self.assertEqual(stats['cheap_checker']['rejections'], 5)
+        self.assertEqual(stats['expensive_checker']['rejections'], 0)
+
+        del CallsValidator.calls[:]
+        self.assertFalse(validator(20))
+        self.assertTrue(validator(5))
+        self.assertEqual(CallsValidator.calls, ['cheap', 'cheap', 'expensive'])
+
+        # Profiling is repeated after the interval, and the order follows the input.
+        for _ in range((CallsValidator.adaptive_interval +
+                        CallsValidator.adaptive_window) * 3):
+            self.assertFalse(validator(-1))
+        del CallsValidator.calls[:]
+        self.assertFalse(validator(-1))
+        self.assertEqual(CallsValidator.calls, ['expensive'])
+
+    def test_options(self):
+        # The options of the pipeline are validated and applied by the base class.
+        validator = CallsValidator(cheap='cheap', heavy=True, checker_costs=dict())
+        self.assertTrue(validator.heavy)
+        self.assertRaises(ArgumentValidationError, CallsValidator, adaptive=1)
+        self.assertRaises(ArgumentValidationError, NumberValidator, checker_costs=[])
+        self.assertRaises(ArgumentValidationError, StringValidator, cache_size='a')
+        self.assertRaises(ValueError, CallsValidator, cheap='cheap', cache_size=10)
+
+    def test_adaptive_guards(self):
+        validator = CallsValidator(
+            expensive='expensive', cheap='cheap', adaptive=True,
+            checker_costs=dict(expensive_checker=0)
+        )
+        for _ in range(CallsValidator.adaptive_window * 2):
+            self.assertFalse(validator(20))
+        del CallsValidator.calls[:]
+        self.assertFalse(validator(20))
+        self.assertEqual(CallsValidator.calls, ['expensive', 'cheap'])
+
+    def test_cache(self):
+        validator = StringValidator(re_pattern='[A-Z]+$', cache_size=2)
+        self.assertTrue(validator('OK'))
+        self.assertTrue(validator('OK'))
+        self.assertFalse(validator('ok'))
+        self.assertFalse(validator(None))
+        self.assertFalse(validator(['OK']))
+        info = validator.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 3, 2))
+        validator.cache_clear()
+        self.assertEqual(validator.cache_info().currsize, 0)
+
+        # Values of different types are cached separately.
+        validator = NumberValidator(number_type=int, cache_size=16)
+        self.assertTrue(validator(1))
+        self.assertFalse(validator(1.0))
+        self.assertFalse(validator(True))
+        self.assertEqual(validator.cache_info().currsize, 3)
+
+        self.assertIsNone(NumberValidator().cache_info())
+        NumberValidator().cache_clear()
+
+    def test_cache_impure(self):
+        self.assertRaises(ValueError, IterableValidator, cache_size=16)
+        self.assertRaises(ValueError, CallsValidator, cheap='cheap', cache_size=16)
+        self.assertRaises(ValueError, StringValidator, cache_size=0)
+
+    def test_pickle(self):
+        validator = IterableValidator(elements_type=int, max_val=10, heavy=True)
+        validator = pickle.loads(pickle.dumps(validator))
+        self.assertTrue(validator.heavy)
+        self.assertEqual(len(validator.pipeline), 2)
+        self.assertTrue(validator([1, 2]))
+        self.assertFalse(validator([1, 20]))
+
+        validator = StringValidator(re_pattern='[a-z]+$', adaptive=True, cache_size=8)
+        validator = pickle.loads(pickle.dumps(validator))
+        self.assertTrue(validator('abc'))
+        self.assertFalse(validator('ABC'))
+        self.assertEqual(validator.cache_info().currsize, 2)
+        self.assertIsNotNone(validator.checker_stats())
+
+    def test_builtin_pipelines(self):
+        validator = NumberValidator(min_val=0, max_val=10, in_range=[1, 2.5, 20])
+        self.assertEqual(len(validator.pipeline), 3)
+        self.assertTrue(validator(1))
+        self.assertTrue(validator(2.5))
+        self.assertFalse(validator(20))
+        self.assertFalse(validator(-1))
+        self.assertEqual(validator.validate_many([1, 2.0]), [True, False])
+
+        validator = StringValidator(min_len=3, re_pattern='a', in_range=['abc', 'b'])
+        self.assertEqual(len(validator.pipeline), 3)
+        self.assertIs(validator('abc'), True)
+        self.assertIs(validator('bcd'), False)
+        self.assertIs(validator('b'), False)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_validate_many_numpy(self):
+        # Elements of the arrays are validated as if the array was converted with
+        # "tolist()", even if the validator doesn't support vectorized validation.
+        validator = CallsValidator(cheap='cheap')
+        values = np.array([1, 20, 3])
+        self.assertEqual(validator.validate_many(values), [True, False, True])
+        self.assertEqual([validator(val) for val in values], [False] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
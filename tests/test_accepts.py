@@ -1,5 +1,11 @@
+from abc import ABCMeta
+import gc
+import linecache
+import typing
 import unittest
 
+from six import with_metaclass
+
 from pyvalid import ArgumentValidationError, InvalidArgumentNumberError, \
     accepts
 from pyvalid.validators import is_validator
@@ -220,6 +226,26 @@ class AcceptsDecoratorTestCase(unittest.TestCase):
         # Both arguments are invalid
         self.assertRaises(ArgumentValidationError, self.func5, 'val0', 'val0')
 
+    def test_shared_decorator(self):
+        # The same decorator instance can wrap several functions, since the argument
+        # plan is compiled per function.
+        decorator = accepts(int, arg2=str)
+
+        @decorator
+        def func_a(arg1, arg2):
+            return arg1, arg2
+
+        @decorator
+        def func_b(arg1, arg3, arg2=str()):
+            return arg1, arg3, arg2
+
+        self.assertEqual(func_a(1, 'a'), (1, 'a'))
+        self.assertEqual(func_b(1, None), (1, None, str()))
+        self.assertEqual(func_b(1, None, 'b'), (1, None, 'b'))
+        self.assertRaises(ArgumentValidationError, func_a, 1, 2)
+        self.assertRaises(ArgumentValidationError, func_b, 1, 'a', 2)
+        self.assertRaises(InvalidArgumentNumberError, func_a, 1)
+
     def test_docstring(self):
         self.assertEqual(self.func_with_doc.__doc__, 'TEST_DOCSTRING')
 
@@ -287,6 +313,216 @@ class AcceptsDecoratorTestCase(unittest.TestCase):
         expected_result = '25th'
         self.assertEqual(actual_result, expected_result)
 
+    def test_generated_wrapper(self):
+        @accepts(int, str, arg4=float)
+        def func(arg1, arg2, *args, arg3=None, arg4=1.0, **kwargs):
+            return arg1, arg2, args, arg3, arg4, kwargs
+
+        self.assertEqual(func(1, 'a'), (1, 'a', tuple(), None, 1.0, dict()))
+        self.assertEqual(
+            func(1, 'a', 2, arg3=3, arg4=4.0, arg5=5),
+            (1, 'a', (2, ), 3, 4.0, {'arg5': 5})
+        )
+        self.assertEqual(func(arg2='a', arg1=1), (1, 'a', tuple(), None, 1.0, dict()))
+        self.assertRaises(ArgumentValidationError, func, 1, 'a', arg4=4)
+        self.assertRaises(InvalidArgumentNumberError, func, 1)
+        self.assertRaises(InvalidArgumentNumberError, func, arg2='a')
+        self.assertRaises(TypeError, func, 1, 'a', arg1=1)
+
+    def test_source_cache(self):
+        def wrapper_sources():
+            return [name for name in linecache.cache if name.startswith('<pyvalid ')]
+
+        gc.collect()
+        sources = wrapper_sources()
+        for _ in range(10):
+            accepts(int)(lambda arg: arg)
+        gc.collect()
+        self.assertEqual(wrapper_sources(), sources)
+
+    def test_malformed_calls(self):
+        # Both kinds of wrappers raise the same errors.
+        @accepts(int, str)
+        def func(arg1, arg2='d'):
+            return arg1, arg2
+
+        with self.assertRaises(ArgumentValidationError) as context:
+            func(1, 2, 3)
+        self.assertEqual(context.exception.arg_num, '2nd')
+        with self.assertRaisesRegex(TypeError, 'positional arguments'):
+            func(1, 'a', 'b')
+        with self.assertRaisesRegex(TypeError, "unexpected keyword argument 'arg3'"):
+            func(1, arg3=2)
+        with self.assertRaisesRegex(TypeError, "multiple values for argument 'arg1'"):
+            func(1, arg1=1)
+        with self.assertRaisesRegex(TypeError, "multiple values for argument 'arg1'"):
+            func('a', arg1=1)
+
+        @accepts(int, arg3=int)
+        def func2(arg1, *, arg3):
+            return arg1, arg3
+
+        with self.assertRaisesRegex(TypeError, 'positional argument'):
+            func2(1, 2, arg3=3)
+        with self.assertRaisesRegex(TypeError, "unexpected keyword argument 'arg4'"):
+            func2(1, arg3=3, arg4=4)
+
+    def test_keyword_only(self):
+        @accepts(arg2=str, arg3=int)
+        def func(arg1, *, arg2, arg3=None):
+            return arg1, arg2, arg3
+
+        self.assertEqual(func(1, arg2='a'), (1, 'a', None))
+        self.assertEqual(func(1, arg2='a', arg3=None), (1, 'a', None))
+        self.assertEqual(func(1, arg2='a', arg3=3), (1, 'a', 3))
+        self.assertRaises(InvalidArgumentNumberError, func, 1)
+        self.assertRaises(InvalidArgumentNumberError, func, 1, arg3=3)
+        with self.assertRaises(ArgumentValidationError) as context:
+            func(1, arg2='a', arg3='b')
+        self.assertEqual(context.exception.arg_num, '3rd')
+        self.assertEqual(context.exception.arg_name, 'arg3')
+
+    def test_keyword_default(self):
+        # The default value is allowed for the positional parameter specified by its
+        # name.
+        @accepts(arg2=int)
+        def func(arg1, arg2=None):
+            return arg1, arg2
+
+        self.assertEqual(func(1), (1, None))
+        self.assertEqual(func(1, None), (1, None))
+        self.assertEqual(func(1, arg2=None), (1, None))
+        self.assertEqual(func(1, 2), (1, 2))
+        self.assertRaises(ArgumentValidationError, func, 1, 'a')
+        self.assertEqual(func.validate_many([(1, None), (1, 'a')])[0][0], 1)
+
+    def test_variadic_params(self):
+        @accepts(str, int, args=float, kwargs=(bool, None), arg3=str)
+        def func(arg1, *args, arg2=0, **kwargs):
+            return arg1, args, arg2, kwargs
+
+        self.assertEqual(func('a'), ('a', tuple(), 0, dict()))
+        self.assertEqual(
+            func('a', 1, 2.0, 3.0, arg2=2, arg3='c', arg4=True, arg5=None),
+            ('a', (1, 2.0, 3.0), 2, dict(arg3='c', arg4=True, arg5=None))
+        )
+        # The 2nd argument has its own allowed values.
+        self.assertRaises(ArgumentValidationError, func, 'a', 1.0)
+        with self.assertRaises(ArgumentValidationError) as context:
+            func('a', 1, 2.0, 3)
+        self.assertEqual(context.exception.arg_num, '4th')
+        self.assertEqual(context.exception.arg_name, 'args')
+        with self.assertRaises(ArgumentValidationError) as context:
+            func('a', arg4=True, arg5=1)
+        self.assertEqual(context.exception.arg_num, '4th')
+        self.assertEqual(context.exception.arg_name, 'arg5')
+        self.assertRaises(ArgumentValidationError, func, 'a', arg3=True)
+        # The arguments, which are not variadic, are not affected.
+        self.assertEqual(func('a', arg2='b'), ('a', tuple(), 'b', dict()))
+        failures = func.validate_many([('a', 1, 2.0), ('a', 1, 2), dict(arg1='a', x=1)])
+        self.assertEqual([row_num for row_num, _ in failures], [1, 2])
+
+    def test_callable_object(self):
+        class Multiplier(object):
+            __name__ = 'multiplier'
+
+            def __call__(self, num):
+                return num * 2
+
+        func = accepts(int)(Multiplier())
+        self.assertEqual(func(2), 4)
+        self.assertRaises(ArgumentValidationError, func, 'x')
+
+    def test_type_dispatch(self):
+        class Base(object):
+            pass
+
+        class Child(Base):
+            pass
+
+        class Abstract(with_metaclass(ABCMeta, object)):
+            pass
+
+        @accepts((Base, Abstract, None))
+        def func(arg):
+            return arg
+
+        for _ in range(2):
+            self.assertIsInstance(func(Child()), Child)
+            self.assertIsNone(func(None))
+            self.assertRaises(ArgumentValidationError, func, 1)
+        # Negative results must not be cached for abstract base classes.
+        Abstract.register(int)
+        self.assertEqual(func(1), 1)
+
+        # Verdicts for the objects, which fake their classes, must not be cached.
+        class Proxy(object):
+            def __init__(self, obj):
+                self.obj = obj
+
+            @property
+            def __class__(self):
+                return type(self.obj)
+
+        self.assertIsInstance(func(Proxy(Child())), Proxy)
+        self.assertRaises(ArgumentValidationError, func, Proxy('x'))
+
+    @unittest.skipIf(
+        not hasattr(typing, 'runtime_checkable'), 'Protocols are not supported'
+    )
+    def test_protocol_dispatch(self):
+        @typing.runtime_checkable
+        class Named(typing.Protocol):
+            name = None
+
+        class Item(object):
+            pass
+
+        named_item = Item()
+        named_item.name = 'pyvalid'
+        # Verdicts of the protocols depend on the values, so they are never cached.
+        self.addCleanup(setattr, accepts, 'codegen', True)
+        for codegen in (True, False):
+            accepts.codegen = codegen
+
+            @accepts([Named, int])
+            def func(arg):
+                return arg
+
+            self.assertIs(func(named_item), named_item)
+            self.assertRaises(ArgumentValidationError, func, Item())
+            failures = func.validate_many([(named_item, ), (Item(), ), (1, )])
+            self.assertEqual([row_num for row_num, _ in failures], [1])
+
+    def test_validate_many(self):
+        @accepts(int, str, arg3=(float, None))
+        def func(arg1, arg2, arg3=None):
+            raise AssertionError('The function must not be called.')
+
+        failures = func.validate_many([
+            (1, 'a'),
+            ('b', 'a'),
+            dict(arg1=1, arg2='a', arg3=0.5),
+            (1, 'a', 2),
+            (1, ),
+        ])
+        self.assertEqual([row_num for row_num, _ in failures], [1, 3, 4])
+        self.assertIsInstance(failures[0][1], ArgumentValidationError)
+        self.assertEqual(failures[0][1].arg_num, '1st')
+        self.assertEqual(failures[1][1].arg_name, 'arg3')
+        self.assertIsInstance(failures[2][1], InvalidArgumentNumberError)
+        self.assertEqual(func.validate_many(list()), list())
+
+
+class AcceptsGenericWrapperTestCase(AcceptsDecoratorTestCase):
+    """Runs the same tests for wrappers, which are not generated.
+    """
+
+    def setUp(self):
+        accepts.codegen = False
+        self.addCleanup(setattr, accepts, 'codegen', True)
+        AcceptsDecoratorTestCase.setUp(self)
+
 
 if __name__ == '__main__':
     unittest.main()
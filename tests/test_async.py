@@ -0,0 +1,44 @@
+import asyncio
+from inspect import iscoroutinefunction
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidReturnTypeError, accepts, \
+    returns, validate
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncTestCase(unittest.TestCase):
+
+    def test_coroutine(self):
+        @returns(int)
+        @accepts(int)
+        async def func(arg):
+            await asyncio.sleep(0)
+            return arg * 2 if arg > 0 else str(arg)
+
+        self.assertTrue(iscoroutinefunction(func))
+        self.assertEqual(func.__name__, 'func')
+        self.assertEqual(run(func(2)), 4)
+        # The arguments are validated when the coroutine starts.
+        coroutine = func('a')
+        self.assertRaises(ArgumentValidationError, run, coroutine)
+        self.assertRaises(InvalidReturnTypeError, run, func(-1))
+
+    def test_validate(self):
+        @validate
+        async def func(arg: int) -> str:
+            return str(arg)
+
+        self.assertEqual(run(func(1)), '1')
+        self.assertRaises(ArgumentValidationError, run, func('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+from inspect import isasyncgenfunction
+from typing import AsyncIterator
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidReturnTypeError, accepts, \
+    returns, validate
+
+
+# Asynchronous generators are supported by Python 3.6 and newer, so the module is not
+# collected by the older versions (see the conftest.py).
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(generator):
+    return [item async for item in generator]
+
+
+class AsyncGeneratorTestCase(unittest.TestCase):
+
+    def test_async_generator(self):
+        @returns(int)
+        @accepts(int)
+        async def func(count):
+            for num in range(count):
+                yield num if num < 3 else str(num)
+
+        self.assertTrue(isasyncgenfunction(func))
+        self.assertEqual(run(collect(func(3))), [0, 1, 2])
+        self.assertRaises(ArgumentValidationError, run, collect(func('a')))
+        self.assertRaises(InvalidReturnTypeError, run, collect(func(5)))
+
+    def test_async_generator_delegation(self):
+        closed = list()
+
+        @returns(int, None)
+        async def func():
+            try:
+                received = yield 1
+                while True:
+                    try:
+                        received = yield received
+                    except KeyError:
+                        received = -1
+            finally:
+                closed.append(True)
+
+        async def talk():
+            generator = func()
+            items = [await generator.__anext__(), await generator.asend(2)]
+            items.append(await generator.athrow(KeyError()))
+            await generator.aclose()
+            return items
+
+        self.assertEqual(run(talk()), [1, 2, -1])
+        self.assertEqual(closed, [True])
+
+    def test_validate(self):
+        @validate
+        async def func(count: int) -> AsyncIterator[int]:
+            for num in range(count):
+                yield num
+
+        self.assertEqual(run(collect(func(2))), [0, 1])
+        self.assertRaises(ArgumentValidationError, run, collect(func(None)))
+
+
+if __name__ == '__main__':
+    unittest.main()
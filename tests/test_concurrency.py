@@ -0,0 +1,131 @@
+import threading
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidReturnTypeError, accepts, returns
+from pyvalid.validators import is_validator
+
+
+class ConcurrencyTestCase(unittest.TestCase):
+
+    threads_count = 16
+    calls_per_thread = 1000
+
+    def run_threads(self, target):
+        errors = list()
+        barrier = threading.Barrier(self.threads_count)
+
+        def runner(thread_num):
+            try:
+                barrier.wait()
+                target(thread_num)
+            except Exception as exc:  # noqa: B902
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=runner, args=(thread_num, ))
+            for thread_num in range(self.threads_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_many_threads(self):
+        @returns(int, str)
+        @accepts(int, (str, int), arg3=(float, None))
+        def func(arg1, arg2, arg3=None):
+            return arg2
+
+        def target(thread_num):
+            for call_num in range(self.calls_per_thread):
+                # Mix valid and invalid calls, so threads see different plans paths.
+                if call_num % 3 == 0:
+                    with self.assertRaises(ArgumentValidationError):
+                        func(thread_num, float(call_num))
+                elif call_num % 3 == 1:
+                    result = func(thread_num, call_num, arg3=0.5)
+                    self.assertEqual(result, call_num)
+                else:
+                    result = func(thread_num, str(call_num))
+                    self.assertEqual(result, str(call_num))
+
+        errors = self.run_threads(target)
+        self.assertEqual(errors, list())
+
+    def test_shared_decorator_instance(self):
+        decorator = accepts(int)
+
+        @decorator
+        def func1(arg):
+            return arg
+
+        @decorator
+        def func2(arg, *args):
+            return arg, args
+
+        def target(thread_num):
+            for call_num in range(self.calls_per_thread):
+                self.assertEqual(func1(call_num), call_num)
+                self.assertEqual(func2(call_num, 'x'), (call_num, ('x', )))
+                with self.assertRaises(ArgumentValidationError):
+                    func2('x', call_num)
+
+        errors = self.run_threads(target)
+        self.assertEqual(errors, list())
+
+    def test_recursive_call(self):
+        @accepts(int, str)
+        def func(depth, name):
+            if depth == 0:
+                return name
+            # Invalid nested call must not affect the outer call.
+            with self.assertRaises(ArgumentValidationError):
+                func(depth - 1, depth)
+            return func(depth - 1, name)
+
+        self.assertEqual(func(20, 'pyvalid'), 'pyvalid')
+
+    def test_reentrant_validator(self):
+        @returns(int)
+        @accepts(int)
+        def double(arg):
+            return arg * 2
+
+        @is_validator
+        def checker(val):
+            # The validator calls another function wrapped by the same decorators.
+            return double(len(val)) < 10
+
+        @accepts(int, checker)
+        def func(arg1, arg2):
+            return double(arg1)
+
+        def target(thread_num):
+            for call_num in range(self.calls_per_thread // 10):
+                self.assertEqual(func(call_num, 'ab'), call_num * 2)
+                with self.assertRaises(ArgumentValidationError):
+                    func(call_num, 'abcdef')
+                with self.assertRaises(ArgumentValidationError):
+                    double(str(call_num))
+
+        errors = self.run_threads(target)
+        self.assertEqual(errors, list())
+
+    def test_returns_threads(self):
+        @returns(int)
+        def func(arg):
+            return arg
+
+        def target(thread_num):
+            for call_num in range(self.calls_per_thread):
+                self.assertEqual(func(call_num), call_num)
+                with self.assertRaises(InvalidReturnTypeError):
+                    func(str(call_num))
+
+        errors = self.run_threads(target)
+        self.assertEqual(errors, list())
+
+
+if __name__ == '__main__':
+    unittest.main()
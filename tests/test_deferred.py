@@ -0,0 +1,169 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import unittest
+
+from pyvalid import InvalidReturnTypeError, deferred, returns, sampling
+from pyvalid.validators import is_validator
+
+
+class DeferredTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(deferred.wait)
+
+    def test_callback_sink(self):
+        errors = list()
+
+        @returns(int, deferred=True, sink=errors.append)
+        def func(arg):
+            return arg
+
+        self.assertEqual(func(1), 1)
+        # The invalid value is returned, the failure is passed to the sink.
+        self.assertEqual(func('a'), 'a')
+        self.assertTrue(deferred.wait(10))
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], InvalidReturnTypeError)
+        self.assertEqual(errors[0].actual_value, 'a')
+
+    def test_background_validation(self):
+        release = threading.Event()
+        threads = list()
+
+        @is_validator
+        def slow(val):
+            threads.append(threading.current_thread())
+            return release.wait(10)
+
+        errors = list()
+
+        @returns(slow, deferred=True, sink=errors.append)
+        def func(arg):
+            return arg
+
+        # The caller doesn't wait for the validator.
+        self.assertEqual(func(1), 1)
+        self.assertFalse(deferred.wait(0.01))
+        release.set()
+        self.assertTrue(deferred.wait(10))
+        self.assertEqual(errors, list())
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_raise_on_next_call(self):
+        sink = deferred.RaiseOnNextCall()
+
+        @returns(int, deferred=True, sink=sink)
+        def func(arg):
+            return arg
+
+        self.assertEqual(func('a'), 'a')
+        self.assertEqual(func('b'), 'b')
+        deferred.wait()
+        self.assertRaises(InvalidReturnTypeError, func, 1)
+        self.assertEqual(sink.dropped, 1)
+        self.assertEqual(func(1), 1)
+
+    def test_log_sink(self):
+        @is_validator
+        def broken(val):
+            raise KeyError(val)
+
+        @returns(int, deferred=True)
+        def func1(arg):
+            return arg
+
+        @returns(broken, deferred=True)
+        def func2(arg):
+            return arg
+
+        with self.assertLogs('pyvalid') as logs:
+            func1('a')
+            func2('b')
+            deferred.wait()
+        self.assertEqual(len(logs.records), 2)
+        self.assertIsNone(logs.records[0].exc_info)
+        self.assertIs(logs.records[1].exc_info[0], KeyError)
+
+    def test_sampled(self):
+        errors = list()
+
+        @returns.sampled(sampling.EveryNth(2), int, deferred=True, sink=errors.append)
+        def func(arg):
+            return arg
+
+        for num in range(4):
+            func(str(num))
+        deferred.wait()
+        self.assertEqual([error.actual_value for error in errors], ['0', '2'])
+
+    def test_executor(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(deferred.set_executor, None)
+        deferred.set_executor(executor)
+        self.assertIs(deferred.get_executor(), executor)
+        errors = list()
+
+        @returns(int, deferred=True, sink=errors.append)
+        def func(arg):
+            return arg
+
+        for num in range(10):
+            func(num if num % 2 else str(num))
+        deferred.wait()
+        self.assertEqual(len(errors), 5)
+
+    def test_max_pending(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.addCleanup(deferred.set_max_pending, deferred.max_pending)
+        deferred.set_max_pending(2)
+
+        @is_validator
+        def slow(val):
+            return release.wait(10) and isinstance(val, int)
+
+        errors = list()
+
+        @returns(slow, deferred=True, sink=errors.append)
+        def func(arg):
+            return arg
+
+        dropped = deferred.get_dropped()
+        # The first value is validated, the second one waits in the queue, the others
+        # are dropped.
+        for num in range(5):
+            self.assertEqual(func(str(num)), str(num))
+        self.assertEqual(deferred.get_dropped() - dropped, 3)
+        release.set()
+        self.assertTrue(deferred.wait(10))
+        self.assertEqual([error.actual_value for error in errors], ['0', '1'])
+        # The queue is free again.
+        func('5')
+        deferred.wait()
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(deferred.get_dropped() - dropped, 3)
+
+    def test_coroutine(self):
+        sink = deferred.RaiseOnNextCall()
+
+        @returns(int, deferred=True, sink=sink)
+        async def func(arg):
+            return arg
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertEqual(loop.run_until_complete(func('a')), 'a')
+        deferred.wait()
+        self.assertRaises(InvalidReturnTypeError, loop.run_until_complete, func(1))
+
+    def test_options(self):
+        self.assertRaises(TypeError, deferred.Sink)
+        self.assertRaises(TypeError, returns, int, defered=True)
+        self.assertRaises(ValueError, returns, int, sink=print)
+        self.assertRaises(TypeError, returns(int, deferred=True, sink=1), len)
+
+
+if __name__ == '__main__':
+    unittest.main()
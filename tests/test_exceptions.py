@@ -0,0 +1,85 @@
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidArgumentNumberError, \
+    InvalidReturnTypeError, PyvalidError, accepts, returns
+
+
+class ExceptionsTestCase(unittest.TestCase):
+
+    def test_structured_fields(self):
+        @accepts(int, arg2=str)
+        def func(arg1, arg2):
+            return arg1
+
+        with self.assertRaises(ArgumentValidationError) as context:
+            func(1, arg2=2)
+        error = context.exception
+        self.assertIs(error.func, func.__wrapped__)
+        self.assertEqual(error.arg_num, '2nd')
+        self.assertEqual(error.arg_name, 'arg2')
+        self.assertEqual(error.actual_value, 2)
+        self.assertEqual(list(error.allowed_arg_values), [str])
+        self.assertIsNone(error.element_index)
+
+        with self.assertRaises(InvalidArgumentNumberError) as context:
+            func(1)
+        self.assertIn('func(arg1, arg2)', str(context.exception))
+
+    def test_lazy_message(self):
+        class Value(object):
+            reprs = 0
+
+            def __repr__(self):
+                Value.reprs += 1
+                return 'Value()'
+
+        @returns(int)
+        def func(value):
+            return value
+
+        value = Value()
+        try:
+            func(value)
+        except InvalidReturnTypeError:
+            pass
+        self.assertEqual(Value.reprs, 0)
+
+        with self.assertRaises(InvalidReturnTypeError) as context:
+            func(value)
+        error = context.exception
+        self.assertIs(error.actual_value, value)
+        self.assertEqual(error.allowed_return_values, (int, ))
+        self.assertEqual(str(error), error.error)
+        self.assertIn('"Value()"', str(error))
+        self.assertEqual(Value.reprs, 1)
+
+    def test_truncated_value(self):
+        @accepts(int)
+        def func(arg):
+            return arg
+
+        for value in (list(range(10 ** 6)), 'x' * 10 ** 6):
+            with self.assertRaises(ArgumentValidationError) as context:
+                func(value)
+            self.assertLess(len(str(context.exception)), 1000)
+        with self.assertRaises(ArgumentValidationError) as context:
+            func('short')
+        self.assertIn('"short"', str(context.exception))
+
+    def test_callable_without_name(self):
+        class Multiplier(object):
+            def __call__(self, num):
+                return num * 2
+
+        error = ArgumentValidationError(Multiplier(), '1st', 'a', [int])
+        self.assertIn('Multiplier(num)', str(error))
+
+    def test_custom_message(self):
+        error = PyvalidError('custom message')
+        self.assertEqual(str(error), 'custom message')
+        self.assertEqual(error.error, 'custom message')
+        self.assertEqual(str(PyvalidError()), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
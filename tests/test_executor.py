@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidReturnTypeError, accepts, \
+    concurrency, returns
+from pyvalid.validators import IterableValidator, is_validator
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class ExecutorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        concurrency.set_executor(self.executor)
+        self.addCleanup(self.executor.shutdown)
+        self.addCleanup(concurrency.set_executor, None)
+        self.addCleanup(concurrency.set_parallel, False)
+        self.threads = list()
+
+        @is_validator
+        def heavy_checker(val):
+            self.threads.append(threading.get_ident())
+            return isinstance(val, list) and len(val) > 1
+
+        heavy_checker.heavy = True
+        self.heavy_checker = heavy_checker
+
+    def test_arguments(self):
+        @accepts([int, self.heavy_checker], str)
+        async def func(arg1, arg2='a'):
+            return arg1
+
+        self.assertIs(concurrency.get_executor(), self.executor)
+        # The cheap allowed values are checked inline.
+        self.assertEqual(run(func(1)), 1)
+        self.assertEqual(self.threads, list())
+        self.assertEqual(run(func([1, 2])), [1, 2])
+        self.assertEqual(len(self.threads), 1)
+        self.assertNotEqual(self.threads[0], threading.get_ident())
+        with self.assertRaises(ArgumentValidationError) as context:
+            run(func([1]))
+        self.assertEqual(context.exception.arg_name, 'arg1')
+        self.assertRaises(ArgumentValidationError, run, func([1, 2], 2))
+
+    def test_result(self):
+        @returns(self.heavy_checker)
+        async def func(arg):
+            return arg
+
+        self.assertEqual(run(func([1, 2])), [1, 2])
+        self.assertRaises(InvalidReturnTypeError, run, func([1]))
+        self.assertEqual(len(self.threads), 2)
+
+    def test_parallel(self):
+        body_started = threading.Event()
+
+        @is_validator
+        def waiting_checker(val):
+            return body_started.wait(5)
+
+        waiting_checker.heavy = True
+
+        @accepts(waiting_checker)
+        async def func(arg):
+            body_started.set()
+            return arg
+
+        concurrency.set_parallel(True)
+        self.assertEqual(run(func('a')), 'a')
+
+        @accepts(self.heavy_checker)
+        async def failing_func(arg):
+            return arg
+
+        self.assertRaises(ArgumentValidationError, run, failing_func(1))
+
+    def test_process_pool(self):
+        executor = ProcessPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        concurrency.set_executor(executor)
+
+        @accepts(IterableValidator(elements_type=int, max_val=10, heavy=True))
+        async def func(values):
+            return sum(values)
+
+        self.assertEqual(run(func(list(range(10)))), 45)
+        self.assertRaises(ArgumentValidationError, run, func(list(range(20))))
+
+    def test_sync_function(self):
+        @accepts(self.heavy_checker)
+        def func(arg):
+            return arg
+
+        self.assertEqual(func([1, 2]), [1, 2])
+        self.assertEqual(self.threads, [threading.get_ident()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 
@@ -31,6 +33,22 @@ class TestImports(unittest.TestCase):
         self.assertTrue(validators.TensorValidator)
         self.assertTrue(validators.StringValidator)
 
+    def test_optional_dependencies_not_imported(self):
+        # Heavy optional packages must be imported only when the validators, which
+        # need them, are used.
+        code = (
+            'import sys; import pyvalid; import pyvalid.validators; '
+            'print(sorted(set(sys.argv[1:]) & set(sys.modules)))'
+        )
+        heavy_modules = [
+            'torch', 'numpy', 'pandas', 'concurrent.futures', 'multiprocessing',
+            'logging'
+        ]
+        output = subprocess.check_output(
+            [sys.executable, '-c', code] + heavy_modules, universal_newlines=True
+        )
+        self.assertEqual(output.strip(), '[]')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,14 @@
+from array import array
 import unittest
 
+from pyvalid import ArgumentValidationError, accepts
 from pyvalid.validators import IterableValidator
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class IterableValidatorTestCase(unittest.TestCase):
 
@@ -112,6 +119,239 @@ class IterableValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator(8))  # Integer
         self.assertFalse(None)
 
+    def test_single_pass(self):
+        """
+        Verify elements_checker() method and rejection of one-shot iterators.
+        """
+        class CountingList(list):
+            iterations = 0
+
+            def __iter__(self):
+                CountingList.iterations += 1
+                return list.__iter__(self)
+
+        validator = IterableValidator(elements_type=int, min_val=0, max_val=10)
+        self.assertTrue(validator(CountingList([0, 5, 10])))
+        self.assertEqual(CountingList.iterations, 1)
+        self.assertFalse(validator([0, 5, 11]))
+        self.assertFalse(validator([-1, 5, 10]))
+        self.assertFalse(validator([0, 5.0, 10]))
+
+        # Generators would be consumed by the validation, so they are rejected.
+        self.assertFalse(validator(x for x in range(5)))
+        self.assertFalse(validator(iter([1, 2])))
+        self.assertFalse(IterableValidator(empty_allowed=False)(iter([1, 2])))
+        # Nothing is consumed, if only the type of the iterable is checked.
+        validator = IterableValidator(iterable_type=type(iter([])))
+        self.assertTrue(validator(iter([1, 2])))
+
+    def test_streaming(self):
+        """
+        Verify stream() method and streaming of one-shot iterators by accepts.
+        """
+        validator = IterableValidator(
+            elements_type=int, min_val=0, max_val=10, streaming=True
+        )
+        # Direct calls still reject one-shot iterators.
+        self.assertFalse(validator(iter([1, 2])))
+
+        pulled = list()
+
+        def numbers(*values):
+            for value in values:
+                pulled.append(value)
+                yield value
+
+        @accepts(validator)
+        def func(values):
+            return [value * 2 for value in values]
+
+        self.assertEqual(func(numbers(1, 2, 3)), [2, 4, 6])
+        # Non-iterators are validated as usual.
+        self.assertEqual(func([1, 2]), [2, 4])
+        self.assertRaises(ArgumentValidationError, func, [1, 11])
+
+        del pulled[:]
+        with self.assertRaises(ArgumentValidationError) as context:
+            func(numbers(1, 2, 11, 3))
+        self.assertEqual(context.exception.element_index, 2)
+        self.assertIn('element #2', str(context.exception))
+        # Elements are validated when they are pulled, the rest is left untouched.
+        self.assertEqual(pulled, [1, 2, 11])
+
+        with self.assertRaises(ArgumentValidationError) as context:
+            func(values=numbers(1, 'a'))
+        self.assertEqual(context.exception.element_index, 1)
+
+        @accepts(IterableValidator(empty_allowed=False, streaming=True))
+        def first(values):
+            return next(iter(values), None)
+
+        self.assertEqual(first(iter([5])), 5)
+
+        @accepts(IterableValidator(empty_allowed=False, streaming=True))
+        def count(values):
+            return len(list(values))
+
+        with self.assertRaises(ArgumentValidationError) as context:
+            count(iter([]))
+        self.assertIsNone(context.exception.element_index)
+
+        # Without the streaming mode one-shot iterators are rejected.
+        @accepts(IterableValidator(elements_type=int))
+        def strict(values):
+            return list(values)
+
+        self.assertRaises(ArgumentValidationError, strict, iter([1, 2]))
+
+    def test_buffers(self):
+        """
+        Verify the vectorized checks of array.array and other buffers.
+        """
+        validator = IterableValidator(elements_type=int, min_val=0, max_val=255)
+        self.assertTrue(validator(array('q', [0, 128, 255])))
+        self.assertTrue(validator(array('q')))
+        self.assertFalse(validator(array('q', [0, 128, 256])))
+        self.assertFalse(validator(array('q', [-1, 128, 255])))
+        self.assertFalse(validator(array('d', [0.0, 128.0])))
+        self.assertTrue(validator(b'pyvalid'))
+        self.assertTrue(validator(bytearray(b'pyvalid')))
+        self.assertTrue(validator(memoryview(b'pyvalid')))
+
+        validator = IterableValidator(elements_type=float, min_val=-1.5)
+        self.assertTrue(validator(array('d', [-1.5, 0.0, 1e10])))
+        self.assertFalse(validator(array('d', [float('nan'), -2.0])))
+        self.assertFalse(validator(array('i', [1, 2])))
+
+    def test_empty_buffers(self):
+        """
+        Verify that empty buffers are valid whatever the type of their elements, as
+        the other empty iterables.
+        """
+        empty_buffers = [array('l'), memoryview(array('l')), memoryview(b'')]
+        for options in (dict(), dict(min_val=0), dict(chunk_size=10)):
+            validator = IterableValidator(elements_type=float, **options)
+            self.assertTrue(validator(list()))
+            for empty_buffer in empty_buffers:
+                self.assertTrue(validator(empty_buffer))
+                self.assertIsNone(validator.first_failure(empty_buffer))
+            self.assertFalse(validator(array('l', [1])))
+            self.assertEqual(validator.first_failure(array('l', [1])), 0)
+        for empty_buffer in empty_buffers:
+            self.assertTrue(
+                IterableValidator.element_type_checker(empty_buffer, float)
+            )
+        self.assertFalse(IterableValidator.element_type_checker(array('l', [1]), float))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_arrays(self):
+        """
+        Verify the vectorized checks of NumPy arrays.
+        """
+        validator = IterableValidator(elements_type=float, min_val=0, max_val=1)
+        self.assertTrue(validator(np.linspace(0, 1, 1000)))
+        self.assertTrue(validator(np.array([], dtype=np.float64)))
+        self.assertFalse(validator(np.linspace(0, 1.1, 1000)))
+        self.assertFalse(validator(np.linspace(-0.1, 1, 1000)))
+        self.assertFalse(validator(np.array([np.nan, -1.0])))
+        # Elements of integer arrays are not instances of int, as in the loop.
+        self.assertFalse(validator(np.arange(2)))
+        self.assertEqual(
+            IterableValidator(elements_type=int)(np.arange(2)),
+            IterableValidator(elements_type=int)(list(np.arange(2)))
+        )
+        # Bounds of integer arrays.
+        validator = IterableValidator(min_val=-5, max_val=5)
+        self.assertTrue(validator(np.arange(-5, 6, dtype=np.int8)))
+        self.assertFalse(validator(np.arange(0, 7, dtype=np.uint64)))
+        # Arrays which can be converted by NumPy.
+        self.assertTrue(validator(array('b', [-5, 5])))
+        self.assertFalse(validator(memoryview(b'pyvalid')))
+        # Multidimensional arrays are validated element by element (row by row).
+        validator = IterableValidator(elements_type=np.ndarray)
+        self.assertTrue(validator(np.zeros((2, 2))))
+
+    def test_chunks(self):
+        """
+        Verify the parallel validation of the chunks of large sequences.
+        """
+        validator = IterableValidator(
+            elements_type=int, min_val=0, chunk_size=100, workers=4
+        )
+        values = list(range(1000))
+        self.assertTrue(validator(values))
+        self.assertIsNone(validator.first_failure(values))
+        values[750] = -1
+        values[420] = 'a'
+        self.assertFalse(validator(values))
+        # Index of the first invalid element in the whole sequence.
+        self.assertEqual(validator.first_failure(values), 420)
+        self.assertEqual(validator.first_failure(tuple(values)), 420)
+        # Short sequences and one-shot iterators are validated in the caller thread.
+        self.assertEqual(validator.first_failure([0, -1]), 1)
+        self.assertEqual(validator.first_failure(iter(values)), 420)
+        self.assertFalse(validator(array('d', [0.0] * 1000)))
+        self.assertEqual(validator.first_failure(array('d', [0.0] * 1000)), 0)
+        self.assertTrue(validator(array('q', range(1000))))
+        self.assertEqual(validator.first_failure(array('q', range(-1, 999))), 0)
+
+        self.assertRaises(ValueError, IterableValidator, chunk_size=0)
+        self.assertRaises(ValueError, IterableValidator, chunk_size=10, workers=0)
+
+    def test_chunks_early_stop(self):
+        """
+        Verify that the chunks after the invalid element are not validated.
+        """
+        class CountingList(list):
+
+            def __init__(self, values):
+                super(CountingList, self).__init__(values)
+                self.reads = 0
+
+            def __getitem__(self, index):
+                if isinstance(index, slice):
+                    # The items of the chunk are read only when it gets validated.
+                    return self.read(range(*index.indices(len(self))))
+                return super(CountingList, self).__getitem__(index)
+
+            def read(self, indices):
+                for index in indices:
+                    self.reads += 1
+                    yield self[index]
+
+        validator = IterableValidator(min_val=0, chunk_size=1000, workers=1)
+        values = CountingList([-1] + [0] * 99999)
+        self.assertEqual(validator.first_failure(values), 0)
+        self.assertLess(values.reads, len(values) // 2)
+
+    def test_chunks_processes(self):
+        """
+        Verify the validation of the chunks in the pool of processes.
+        """
+        validator = IterableValidator(
+            elements_type=float, max_val=1.0, chunk_size=1000, workers=2,
+            processes=True
+        )
+        values = [0.5] * 5000
+        self.assertTrue(validator(values))
+        values[3210] = 2.0
+        self.assertEqual(validator.first_failure(values), 3210)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_chunks(self):
+        """
+        Verify the parallel validation of the chunks of NumPy arrays.
+        """
+        validator = IterableValidator(
+            elements_type=float, min_val=0, max_val=1, chunk_size=1000, processes=True
+        )
+        values = np.linspace(0, 1, 10000)
+        self.assertTrue(validator(values))
+        values[[2500, 7500]] = 1.5
+        self.assertFalse(validator(values))
+        self.assertEqual(validator.first_failure(values), 2500)
+        self.assertEqual(validator.first_failure(np.arange(10)), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,15 @@ import unittest
 
 from pyvalid.validators import NumberValidator
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 
 class NumberValidatorTestCase(unittest.TestCase):
 
@@ -37,6 +46,26 @@ class NumberValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator(0))
         self.assertFalse(None)
 
+    def test_in_range_collections(self):
+        # One-shot iterables are collected once, so the validator can be reused.
+        validator = NumberValidator(in_range=(2**x for x in range(16)))
+        self.assertTrue(validator(256))
+        self.assertTrue(validator(256))
+        self.assertFalse(validator(3))
+
+        validator = NumberValidator(in_range=range(0, 10 ** 12, 2))
+        self.assertTrue(validator(10 ** 11))
+        self.assertTrue(validator(10.0 ** 11))
+        self.assertFalse(validator(10.0 ** 11 + 0.5))
+        self.assertFalse(validator(-2))
+        self.assertFalse(validator(float('inf')))
+        self.assertFalse(validator(float('nan')))
+
+        # Unhashable elements are compared as before.
+        validator = NumberValidator(not_in_range=[[1], 2, {3: 3}])
+        self.assertFalse(validator(2))
+        self.assertTrue(validator(3))
+
     def test_not_in_range(self):
         validator = NumberValidator(
             not_in_range=[2**x for x in range(16)]
@@ -61,6 +90,83 @@ class NumberValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator(-8))
         self.assertFalse(None)
 
+    def test_validate_many(self):
+        validator = NumberValidator(min_val=0, max_val=10, not_in_range=[5])
+        values = [0, 5, 10, 11, -1, 2.5, 'a', None]
+        self.assertEqual(
+            validator.validate_many(values), [validator(val) for val in values]
+        )
+        self.assertEqual(validator.validate_many(iter([1, 5])), [True, False])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_validate_many_numpy(self):
+        validator = NumberValidator(min_val=0, max_val=10, in_range=range(0, 10, 2))
+        values = np.array([0, 5, 10, 4, -2, 8])
+        mask = validator.validate_many(values)
+        self.assertIsInstance(mask, np.ndarray)
+        self.assertEqual(mask.tolist(), [validator(val) for val in values.tolist()])
+
+        validator = NumberValidator(max_val=1.5)
+        values = np.array([1.0, np.nan, 2.0, -np.inf])
+        self.assertEqual(
+            validator.validate_many(values).tolist(),
+            [validator(val) for val in values.tolist()]
+        )
+        validator = NumberValidator(number_type=float)
+        self.assertFalse(validator.validate_many(np.arange(3)).any())
+        self.assertTrue(validator.validate_many(np.arange(3.0)).all())
+        # Elements are validated as if the array was converted with "tolist()",
+        # NumPy scalars are not numbers for the validator.
+        validator = NumberValidator(min_val=0)
+        values = np.array([1, 2, -1])
+        self.assertEqual(validator.validate_many(values).tolist(), [True, True, False])
+        self.assertEqual([validator(val) for val in values], [False, False, False])
+        self.assertEqual(
+            validator.validate_many(np.array([1, -1], dtype=object)), [True, False]
+        )
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_validate_array(self):
+        validator = NumberValidator(min_val=0, not_in_range=[13, 'a'])
+        values = np.array([1, 13, -1, 14])
+        self.assertEqual(
+            validator.validate_array(values).tolist(), [True, False, False, True]
+        )
+        self.assertEqual(validator.validate_array(values, first_failure=True), 1)
+        self.assertIsNone(validator.validate_array([1, 2], first_failure=True))
+        self.assertRaises(ValueError, validator.validate_array, np.ones((2, 2)))
+
+        validators = (
+            NumberValidator(in_range=range(0, 10, 3)),
+            NumberValidator(in_range=range(10, 0, -3)),
+            NumberValidator(in_range={1, 2.5, 2 ** 70}),
+            NumberValidator(in_range=[]),
+            NumberValidator(max_val=3, number_type=int),
+        )
+        for values in (np.arange(-2, 13), np.linspace(-2, 12, 29)):
+            for validator in validators:
+                self.assertEqual(
+                    validator.validate_array(values).tolist(),
+                    [validator(val) for val in values.tolist()]
+                )
+
+        # Arrays of objects are validated element by element.
+        validator = NumberValidator(max_val=3)
+        values = np.array([1, 'a', 5, None], dtype=object)
+        self.assertEqual(
+            validator.validate_array(values).tolist(), [True, False, False, False]
+        )
+        self.assertEqual(validator.validate_array(values, first_failure=True), 1)
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_validate_array_pandas(self):
+        validator = NumberValidator(min_val=0, in_range=[1, 2, 3])
+        values = pd.Series([1, 5, 3, -1], index=['a', 'b', 'c', 'd'])
+        mask = validator.validate_array(values)
+        self.assertIsInstance(mask, pd.Series)
+        self.assertEqual(mask.to_dict(), dict(a=True, b=False, c=True, d=False))
+        self.assertEqual(validator.validate_array(values, first_failure=True), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
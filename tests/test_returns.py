@@ -1,6 +1,7 @@
 import unittest
 
-from pyvalid import InvalidReturnTypeError, returns
+from pyvalid import ArgumentValidationError, InvalidArgumentNumberError, \
+    InvalidReturnTypeError, accepts, returns
 from pyvalid.validators import is_validator
 
 
@@ -57,6 +58,28 @@ class ReturnsDecoratorTestCase(unittest.TestCase):
     def test_docstring(self):
         self.assertEqual(self.func_with_doc.__doc__, 'TEST_DOCSTRING')
 
+    def test_stacked_decorators(self):
+        @returns(int)
+        @accepts(int, (int, float))
+        def func(num_1, num_2=2):
+            return num_1 * num_2
+
+        self.assertEqual(func(2), 4)
+        self.assertEqual(func(2, num_2=3), 6)
+        self.assertRaises(InvalidArgumentNumberError, func)
+        self.assertRaises(ArgumentValidationError, func, 2, 'x')
+        self.assertRaises(InvalidReturnTypeError, func, 2, 2.5)
+
+
+class ReturnsGenericWrapperTestCase(ReturnsDecoratorTestCase):
+    """Runs the same tests for wrappers, which are not generated.
+    """
+
+    def setUp(self):
+        returns.codegen = False
+        self.addCleanup(setattr, returns, 'codegen', True)
+        ReturnsDecoratorTestCase.setUp(self)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidReturnTypeError, accepts, \
+    returns, sampling
+
+
+class SamplingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(sampling.set_default, None)
+        self.addCleanup(setattr, accepts, 'codegen', True)
+        self.addCleanup(setattr, returns, 'codegen', True)
+
+    def call_many(self, func, values):
+        failed = 0
+        for value in values:
+            try:
+                func(value)
+            except (ArgumentValidationError, InvalidReturnTypeError):
+                failed += 1
+        return failed
+
+    def check_every_nth(self):
+        sampler = sampling.EveryNth(3)
+
+        @accepts.sampled(sampler, int)
+        def func1(arg):
+            return arg
+
+        # Calls #0, #3, #6 and #9 are validated.
+        failed = self.call_many(func1, ['a', 'b', 'c', 1, 'd', 'e', 'f', 2, 3, 'g'])
+        self.assertEqual(failed, 3)
+        self.assertEqual(sampler.stats(), dict(checked=4, skipped=6, failed=3))
+        sampler.reset()
+        self.assertEqual(sampler.stats(), dict(checked=0, skipped=0, failed=0))
+
+        sampler = sampling.EveryNth(2)
+
+        @returns.sampled(sampler, int)
+        def func2(arg):
+            return arg
+
+        failed = self.call_many(func2, ['a', 'b', 'c', 1])
+        self.assertEqual(failed, 2)
+        self.assertEqual(sampler.stats(), dict(checked=2, skipped=2, failed=2))
+
+        # Calls with keyword arguments only are sampled in the same way.
+        sampler = sampling.EveryNth(2)
+
+        @accepts.sampled(sampler, int)
+        def func3(arg1, arg2):
+            return arg1
+
+        with self.assertRaises(ArgumentValidationError):
+            func3(arg1='a', arg2=1)
+        self.assertEqual(func3(arg1='a', arg2=1), 'a')
+        self.assertEqual(sampler.failed, 1)
+
+    def test_every_nth(self):
+        self.check_every_nth()
+
+    def test_every_nth_generic_wrapper(self):
+        accepts.codegen = False
+        returns.codegen = False
+        self.check_every_nth()
+
+    def test_probabilistic(self):
+        never = sampling.Probabilistic(0)
+
+        @returns.sampled(never, int)
+        @accepts.sampled(never, int)
+        def func1(arg):
+            return arg
+
+        self.assertEqual(self.call_many(func1, ['a'] * 10), 0)
+        self.assertEqual(never.stats(), dict(checked=0, skipped=20, failed=0))
+
+        always = sampling.Probabilistic(1)
+
+        @accepts.sampled(always, int)
+        def func2(arg):
+            return arg
+
+        self.assertEqual(self.call_many(func2, ['a'] * 10), 10)
+        self.assertEqual(always.stats(), dict(checked=10, skipped=0, failed=10))
+
+        half = sampling.Probabilistic(0.5)
+
+        @accepts.sampled(half, int)
+        def func3(arg):
+            return arg
+
+        self.call_many(func3, range(1000))
+        self.assertEqual(half.checked + half.skipped, 1000)
+        self.assertTrue(300 < half.checked < 700)
+
+    def test_default(self):
+        sampler = sampling.EveryNth(2)
+        sampling.set_default(sampler)
+        self.assertIs(sampling.get_default(), sampler)
+
+        @accepts(int)
+        def func1(arg):
+            return arg
+
+        own_sampler = sampling.Probabilistic(1)
+
+        @accepts.sampled(own_sampler, int)
+        def func2(arg):
+            return arg
+
+        sampling.set_default(None)
+
+        @accepts(int)
+        def func3(arg):
+            return arg
+
+        self.assertEqual(self.call_many(func1, ['a'] * 4), 2)
+        self.assertEqual(self.call_many(func2, ['a'] * 4), 4)
+        self.assertEqual(self.call_many(func3, ['a'] * 4), 4)
+        self.assertEqual(sampler.stats(), dict(checked=2, skipped=2, failed=2))
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, sampling.EveryNth, 0)
+        self.assertRaises(ValueError, sampling.EveryNth, 2.5)
+        self.assertRaises(ValueError, sampling.Probabilistic, 1.5)
+        # The policy has to implement the "__call__" method.
+        self.assertRaises(TypeError, sampling.Sampler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import asyncio
+import copy
+import gc
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from pyvalid import ArgumentValidationError, InvalidArgumentNumberError, \
+    InvalidReturnTypeError, accepts, returns, stats
+from pyvalid.validators import NumberValidator, StringValidator
+
+
+class StatsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(stats.disable)
+        self.addCleanup(setattr, accepts, 'codegen', True)
+        self.addCleanup(setattr, returns, 'codegen', True)
+        stats.enable()
+        stats.reset()
+
+    def function_stats(self, func, kind):
+        name = '{}.{}'.format(func.__module__, func.__qualname__)
+        return stats.snapshot()['functions'][name][kind]
+
+    def check_accepts(self):
+        @accepts(int, arg2=str)
+        def func(arg1, arg2='a'):
+            return arg1
+
+        @accepts(int)
+        def outer(arg):
+            # Failures of the nested calls are not the failures of this function.
+            return func(arg, 1)
+
+        func(1)
+        func(1, 'b')
+        self.assertRaises(ArgumentValidationError, func, 'a')
+        self.assertRaises(ArgumentValidationError, func, 1, arg2=2)
+        self.assertRaises(ArgumentValidationError, func, 1, 2)
+        self.assertRaises(InvalidArgumentNumberError, func)
+        self.assertRaises(ArgumentValidationError, outer, 1)
+        result = self.function_stats(func, 'accepts')
+        self.assertEqual(result['calls'], 7)
+        self.assertEqual(result['failures'], 5)
+        self.assertEqual(
+            result['failures_by_argument'], {'arg1': 1, 'arg2': 3, 'arguments': 1}
+        )
+        self.assertGreater(result['seconds'], 0)
+        self.assertEqual(set(result['percentiles']), {50, 90, 99})
+        result = self.function_stats(outer, 'accepts')
+        self.assertEqual((result['calls'], result['failures']), (1, 0))
+
+    def test_accepts(self):
+        self.check_accepts()
+
+    def test_accepts_generic(self):
+        accepts.codegen = False
+        self.check_accepts()
+
+    def check_returns(self):
+        @returns(int)
+        def func(arg):
+            if arg is None:
+                raise ValueError(arg)
+            return arg
+
+        func(1)
+        self.assertRaises(InvalidReturnTypeError, func, 'a')
+        # The calls, which didn't return, are not recorded.
+        self.assertRaises(ValueError, func, None)
+        result = self.function_stats(func, 'returns')
+        self.assertEqual(result['calls'], 2)
+        self.assertEqual(result['failures_by_argument'], {'return': 1})
+
+    def test_returns(self):
+        self.check_returns()
+
+    def test_returns_generic(self):
+        returns.codegen = False
+        self.check_returns()
+
+    def test_validation_time(self):
+        # The time of the function is not included into the time of the validation.
+        @returns(int)
+        @accepts(int)
+        def func(arg):
+            total = 0
+            for num in range(10 ** 6):
+                total += num
+            return arg
+
+        func(1)
+        self.assertLess(self.function_stats(func, 'accepts')['seconds'], 0.01)
+        self.assertLess(self.function_stats(func, 'returns')['seconds'], 0.01)
+
+    def test_coroutine(self):
+        @returns(int)
+        @accepts(int)
+        async def func(arg):
+            return arg
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(func(1))
+        self.assertRaises(ArgumentValidationError, loop.run_until_complete, func('a'))
+        self.assertEqual(self.function_stats(func, 'accepts')['failures'], 1)
+        self.assertEqual(self.function_stats(func, 'returns')['calls'], 1)
+
+    def test_validators(self):
+        validator = StringValidator(min_len=2, re_pattern=r'[a-z]+$')
+        self.assertTrue(validator('ab'))
+        self.assertFalse(validator('a'))
+        self.assertFalse(validator('AB'))
+        name = [
+            name for name in stats.snapshot()['validators']
+            if name.startswith('StringValidator#')
+        ][-1]
+        result = stats.snapshot()['validators'][name]
+        self.assertEqual((result['calls'], result['failures']), (3, 2))
+        self.assertEqual(result['checkers']['min_len_checker']['calls'], 3)
+        self.assertEqual(result['checkers']['min_len_checker']['rejections'], 1)
+        self.assertEqual(result['checkers']['re_checker']['calls'], 2)
+        self.assertEqual(result['checkers']['re_checker']['rejections'], 1)
+        # The statistics are not pickled.
+        self.assertTrue(pickle.loads(pickle.dumps(validator))('ab'))
+
+    def test_validators_released(self):
+        def validator_names():
+            return set(
+                name for name in stats.snapshot()['validators']
+                if name.startswith('NumberValidator#')
+            )
+
+        gc.collect()
+        names = validator_names()
+        validator = NumberValidator(min_val=0)
+        copies = [pickle.loads(pickle.dumps(validator)), copy.deepcopy(validator)]
+        self.assertTrue(all(copied(1) for copied in copies))
+        self.assertEqual(len(validator_names() - names), 3)
+        # The statistics are released along with the validators.
+        del validator, copies
+        gc.collect()
+        self.assertEqual(validator_names(), names)
+
+    def test_hooks_and_reset(self):
+        events = list()
+        stats.add_hook(events.append)
+        self.addCleanup(stats.remove_hook, events.append)
+
+        @accepts(NumberValidator(min_val=0))
+        def func(arg):
+            return arg
+
+        func(1)
+        self.assertRaises(ArgumentValidationError, func, -1)
+        kinds = [(event.kind, event.failure) for event in events]
+        self.assertEqual(kinds, [
+            ('validator', None), ('accepts', None),
+            ('validator', 'value'), ('accepts', 'arg'),
+        ])
+        stats.reset()
+        self.assertEqual(self.function_stats(func, 'accepts')['calls'], 0)
+
+    def test_disabled(self):
+        stats.disable()
+
+        @accepts(int)
+        def func(arg):
+            return arg
+
+        self.assertEqual(type(func).__name__, 'function')
+        self.assertNotIn(
+            '{}.{}'.format(func.__module__, func.__qualname__),
+            stats.snapshot()['functions']
+        )
+        self.assertNotIn('_AbstractValidator__instrumentation', dict(
+            (name, value) for name, value in vars(NumberValidator()).items()
+            if value is not None
+        ))
+
+    def test_environment(self):
+        code = 'import pyvalid; print(pyvalid.stats.is_enabled())'
+        env = dict(os.environ, PYVALID_STATS='on')
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], env=env, universal_newlines=True
+        )
+        self.assertEqual(output.strip(), 'True')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,11 @@ import unittest
 
 from pyvalid.validators import StringValidator
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class StringValidatorTestCase(unittest.TestCase):
 
@@ -29,6 +34,18 @@ class StringValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator('Ruby'))
         self.assertFalse(validator(None))
 
+    def test_in_range_collections(self):
+        validator = StringValidator(in_range=iter(['CPython', 'PyPy']))
+        self.assertTrue(validator('PyPy'))
+        self.assertTrue(validator('PyPy'))
+        validator = StringValidator(in_range=dict(CPython=1, PyPy=2))
+        self.assertTrue(validator('CPython'))
+        self.assertFalse(validator('Jython'))
+        # Strings are kept as is, so substrings are still allowed.
+        validator = StringValidator(in_range='CPython')
+        self.assertTrue(validator('Py'))
+        self.assertFalse(validator('PyPy'))
+
     def test_not_in_range(self):
         validator = StringValidator(
             not_in_range=['CPython', 'PyPy', 'IronPython', 'Jython', 'Cython']
@@ -45,9 +62,8 @@ class StringValidatorTestCase(unittest.TestCase):
         self.assertTrue(validator('42'))
         self.assertFalse(validator('__pyvalid__'))
         # Regular expression is broken
-        validator = StringValidator(re_pattern=':)')
-        self.assertFalse(validator('pyvalid'))
-        self.assertFalse(validator(':)'))
+        with self.assertRaises(ValueError):
+            StringValidator(re_pattern=':)')
         # Try to use regular expression with flag
         validator = StringValidator(
             re_pattern='^pyvalid$', re_flags=re.IGNORECASE
@@ -57,6 +73,47 @@ class StringValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator('42'))
         self.assertFalse(validator(None))
 
+    def test_re_full_match(self):
+        validator = StringValidator(re_pattern='[a-z]+')
+        self.assertTrue(validator('pyvalid'))
+        self.assertTrue(validator('pyvalid42'))
+        self.assertFalse(validator('42pyvalid'))
+        validator = StringValidator(re_pattern='[a-z]+', re_full_match=True)
+        self.assertTrue(validator('pyvalid'))
+        self.assertFalse(validator('pyvalid42'))
+        self.assertFalse(validator('42pyvalid'))
+        # The pattern is not rewritten, so the inline flags and comments work.
+        validator = StringValidator(re_pattern='(?i)[a-z]+', re_full_match=True)
+        self.assertTrue(validator('PyValid'))
+        self.assertFalse(validator('PyValid42'))
+        validator = StringValidator(
+            re_pattern='[a-z]+  # letters only', re_flags=re.VERBOSE,
+            re_full_match=True
+        )
+        self.assertTrue(validator('pyvalid'))
+        self.assertFalse(validator('pyvalid42'))
+        validator = StringValidator(re_pattern='a|ab', re_full_match=True)
+        self.assertTrue(validator('ab'))
+        self.assertTrue(StringValidator.re_checker('ab', 'a|ab', full_match=True))
+        self.assertFalse(StringValidator.re_checker('abc', 'a|ab', full_match=True))
+
+    def test_re_checker(self):
+        self.assertTrue(StringValidator.re_checker('pyvalid', '[a-z]+$'))
+        self.assertFalse(StringValidator.re_checker('PyValid', '[a-z]+$'))
+        self.assertTrue(StringValidator.re_checker('PyValid', '[a-z]+$', re.IGNORECASE))
+        self.assertFalse(StringValidator.re_checker('pyvalid', ':)'))
+
+    def test_re_compiled(self):
+        validator = StringValidator(re_pattern=re.compile('^py', re.IGNORECASE))
+        self.assertTrue(validator('pyvalid'))
+        self.assertTrue(validator('PyValid'))
+        self.assertFalse(validator('valid'))
+        # Flags can't be applied to the compiled regular expression.
+        with self.assertRaises(ValueError):
+            StringValidator(re_pattern=re.compile('^py'), re_flags=re.IGNORECASE)
+        with self.assertRaises(ValueError):
+            StringValidator(re_pattern=re.compile(b'^py'))
+
     def test_mixed(self):
         validator = StringValidator(
             min_len=6, max_len=64,
@@ -69,6 +126,23 @@ class StringValidatorTestCase(unittest.TestCase):
         self.assertFalse(validator('sunshine'))
         self.assertFalse(validator(None))
 
+    def test_validate_many(self):
+        validator = StringValidator(min_len=2, max_len=4, re_pattern='[a-z]+$')
+        values = ['ab', 'abcde', 'a', 'AB', 'abc', None, 12]
+        self.assertEqual(
+            validator.validate_many(values), [validator(val) for val in values]
+        )
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_validate_many_numpy(self):
+        validator = StringValidator(
+            min_len=2, max_len=4, re_pattern='[a-z]+$', not_in_range=['abc']
+        )
+        values = np.array(['ab', 'abcde', 'a', 'AB', 'abc', 'abcd'])
+        mask = validator.validate_many(values)
+        self.assertIsInstance(mask, np.ndarray)
+        self.assertEqual(mask.tolist(), [validator(val) for val in values.tolist()])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import unittest
 
 import pyvalid
@@ -11,6 +14,7 @@ class TestSwitch(unittest.TestCase):
         def func1(val):
             return val
         self.func1 = func1
+        self.addCleanup(pyvalid.switch.turn_on)
 
     def test_default_state(self):
         # Validators must be enabled by default.
@@ -29,6 +33,41 @@ class TestSwitch(unittest.TestCase):
             pyvalid.ArgumentValidationError, self.func1, False
         )
 
+    def test_strip(self):
+        pyvalid.switch.turn_off(strip=True)
+        self.assertFalse(pyvalid.switch.is_enabled())
+        self.assertTrue(pyvalid.switch.is_stripped())
+
+        def func2(val):
+            return val
+
+        # Decorators return functions unchanged.
+        self.assertIs(pyvalid.accepts(int)(func2), func2)
+        self.assertIs(pyvalid.returns(int)(func2), func2)
+        # Functions decorated before keep working, but don't validate anything.
+        self.assertFalse(self.func1(False))
+        pyvalid.switch.turn_on()
+        self.assertFalse(pyvalid.switch.is_stripped())
+        self.assertRaises(pyvalid.ArgumentValidationError, self.func1, False)
+        self.assertIsNot(pyvalid.accepts(int)(func2), func2)
+
+    def test_environment(self):
+        code = (
+            'import pyvalid; '
+            'print(pyvalid.switch.is_enabled(), pyvalid.switch.is_stripped())'
+        )
+        expected_output = {
+            'on': 'True False',
+            'off': 'False False',
+            'strip': 'False True',
+        }
+        for mode, expected_state in expected_output.items():
+            env = dict(os.environ, PYVALID_MODE=mode)
+            output = subprocess.check_output(
+                [sys.executable, '-c', code], env=env, universal_newlines=True
+            )
+            self.assertEqual(output.strip(), expected_state)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,188 @@
+import __future__
+from importlib import import_module
+from typing import Any, Counter, Dict, List, NewType, Optional, Sequence, Tuple, \
+    TypeVar, Union
+import unittest
+from unittest import mock
+
+from pyvalid import ArgumentValidationError, InvalidArgumentNumberError, \
+    InvalidReturnTypeError, validate
+from pyvalid.validators import NumberValidator
+
+try:
+    from typing import Annotated, Literal
+except ImportError:
+    Annotated = Literal = None
+
+
+class ValidateDecoratorTestCase(unittest.TestCase):
+
+    def test_simple_hints(self):
+        UserId = NewType('UserId', int)
+        Number = TypeVar('Number', int, float)
+
+        @validate
+        def func(arg1: int, arg2: Optional[str], arg3: Union[UserId, bytes] = b'',
+                 arg4: Number = 0, arg5: Any = None, arg6=None) -> Dict:
+            return dict(arg1=arg1)
+
+        self.assertEqual(func(1, None), dict(arg1=1))
+        self.assertEqual(func(1, 'a', arg3=3, arg4=4.0, arg5=object(), arg6=6),
+                         dict(arg1=1))
+        self.assertRaises(ArgumentValidationError, func, 1.0, None)
+        self.assertRaises(ArgumentValidationError, func, 1, 2)
+        self.assertRaises(ArgumentValidationError, func, 1, None, 'c')
+        self.assertRaises(ArgumentValidationError, func, 1, None, arg4='d')
+        self.assertRaises(InvalidArgumentNumberError, func, 1)
+        self.assertEqual(func.__name__, 'func')
+
+        @validate
+        def func(arg) -> Optional[int]:
+            return arg
+
+        self.assertIsNone(func(None))
+        self.assertRaises(InvalidReturnTypeError, func, 'a')
+
+    def test_variadic_hints(self):
+        @validate
+        def func(*args: int, key: str, **kwargs: float):
+            return args, key, kwargs
+
+        self.assertEqual(func(1, 2, key='a', x=1.0), ((1, 2), 'a', dict(x=1.0)))
+        self.assertRaises(ArgumentValidationError, func, 1, 'b', key='a')
+        self.assertRaises(ArgumentValidationError, func, key=1)
+        self.assertRaises(ArgumentValidationError, func, key='a', x='y')
+
+    def test_containers(self):
+        @validate
+        def func(arg1: List[int], arg2: Dict[str, Tuple[int, str]] = None,
+                 arg3: Tuple[float, ...] = tuple(), arg4: Counter[str] = None,
+                 arg5: Sequence[List[Any]] = tuple()):
+            return arg1
+
+        self.assertEqual(func([1, 2]), [1, 2])
+        func([], dict(a=(1, 'b')), (1.0, 2.0), Counter('abc'), [[1], ['a']])
+        self.assertRaises(ArgumentValidationError, func, (1, 2))
+        self.assertRaises(ArgumentValidationError, func, [1, 'a'])
+        self.assertRaises(ArgumentValidationError, func, [], dict(a=(1, 2)))
+        self.assertRaises(ArgumentValidationError, func, [], dict(a=(1, )))
+        self.assertRaises(ArgumentValidationError, func, [], dict(a=1))
+        self.assertRaises(ArgumentValidationError, func, [], None, (1.0, 'a'))
+        self.assertRaises(ArgumentValidationError, func, [], None, (), Counter([1]))
+        self.assertRaises(ArgumentValidationError, func, [], None, (), None, [(1, )])
+
+    def test_depth_and_sampling(self):
+        @validate(max_depth=1)
+        def func1(arg: List[List[int]]):
+            return arg
+
+        self.assertEqual(func1([['a']]), [['a']])
+        self.assertRaises(ArgumentValidationError, func1, [('a', )])
+
+        @validate(max_depth=0)
+        def func2(arg: List[int]):
+            return arg
+
+        self.assertEqual(func2(['a']), ['a'])
+
+        @validate(sample_size=4)
+        def func3(arg: List[int]):
+            return arg
+
+        # Only the elements #0, #25, #50 and #75 are validated.
+        values = list(range(100))
+        values[1] = 'a'
+        self.assertEqual(func3(values), values)
+        values[50] = 'a'
+        self.assertRaises(ArgumentValidationError, func3, values)
+
+        @validate(sample_size=None)
+        def func4(arg: List[int]):
+            return arg
+
+        values = list(range(100))
+        values[99] = 'a'
+        self.assertRaises(ArgumentValidationError, func4, values)
+
+        # Iterators are not consumed.
+        @validate
+        def func5(arg: Sequence[int] = None):
+            return arg
+
+        self.assertRaises(ArgumentValidationError, func5, iter([1]))
+
+        self.assertRaises(ValueError, validate, max_depth=-1)
+        self.assertRaises(ValueError, validate, sample_size=0)
+
+    @unittest.skipIf(Annotated is None, 'Annotated and Literal are not supported')
+    def test_annotated_and_literal(self):
+        @validate
+        def func(arg1: Annotated[int, NumberValidator(min_val=0), 'docs'],
+                 arg2: Literal['r', 'w'] = 'r',
+                 arg3: Annotated[Optional[int], 'docs'] = None) -> Literal[1, 2]:
+            return arg1
+
+        self.assertEqual(func(1, 'w', 3), 1)
+        self.assertRaises(ArgumentValidationError, func, -1)
+        self.assertRaises(ArgumentValidationError, func, 1.0)
+        self.assertRaises(ArgumentValidationError, func, 1, 'x')
+        self.assertRaises(ArgumentValidationError, func, 1, 'r', 'c')
+        self.assertRaises(InvalidReturnTypeError, func, 3)
+
+    def test_forward_references(self):
+        class Node(object):
+
+            @validate
+            def clone(self, depth: int) -> 'Node':
+                return Node() if depth else depth
+
+            @validate
+            def child(self, other: 'Missing') -> 'Node':  # noqa: F821
+                return other
+
+        # Unresolved forward references are not validated, the other hints are.
+        node = Node()
+        self.assertIsInstance(node.clone(1), Node)
+        self.assertEqual(node.clone(0), 0)
+        self.assertRaises(ArgumentValidationError, node.clone, 'a')
+        self.assertEqual(node.child(1), 1)
+
+    @unittest.skipIf(
+        not hasattr(__future__, 'annotations'), 'Postponed annotations are not supported'
+    )
+    def test_postponed_annotations(self):
+        source = (
+            '@validate\n'
+            'def make(value: int) -> Later:\n'
+            '    return value\n'
+            '\n'
+            'class Later(object):\n'
+            '    pass\n'
+        )
+        namespace = dict(validate=validate)
+        code = compile(
+            source, '<postponed>', 'exec', __future__.annotations.compiler_flag,
+            dont_inherit=True
+        )
+        exec(code, namespace)
+        make = namespace['make']
+        self.assertEqual(make(1), 1)
+        self.assertRaises(ArgumentValidationError, make, 'a')
+
+    def test_missing_special_forms(self):
+        # Python < 3.8 doesn't have the "Literal" and "Final" special forms.
+        validate_module = import_module('pyvalid.__validate')
+        with mock.patch.object(validate_module, 'LITERAL', None), \
+                mock.patch.object(validate_module, 'QUALIFIERS', tuple()):
+            @validate
+            def func(arg1: int, arg2: Optional[str] = None) -> str:
+                return str(arg1)
+
+        self.assertEqual(func(1), '1')
+        self.assertEqual(func(1, 'a'), '1')
+        self.assertRaises(ArgumentValidationError, func, 'a')
+        self.assertRaises(ArgumentValidationError, func, 1, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()